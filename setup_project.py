@@ -59,7 +59,7 @@ def main():
     create_superuser()
     
     # Setup initial data
-    if not run_command("python manage.py setup_admin_data"):
+    if not run_command("python manage.py seed"):
         return False
     
     # Collect static files
@@ -0,0 +1,7 @@
+function performSearch(event) {
+    event.preventDefault();
+    const query = document.getElementById('searchInput').value;
+    if (query.trim()) {
+        alert(`Searching for: ${query}`);
+    }
+}
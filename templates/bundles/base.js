@@ -0,0 +1,441 @@
+{% load static %}
+document.addEventListener('DOMContentLoaded', function() {
+    const currentPath = window.location.pathname;
+    const navLinks = document.querySelectorAll('.nav-link');
+
+    navLinks.forEach(link => {
+        link.classList.remove('active');
+        const linkPath = new URL(link.href).pathname;
+        if (currentPath === linkPath || (currentPath === '/' && linkPath === '/')) {
+            link.classList.add('active');
+        }
+    });
+
+    updateCartCount();
+
+    document.querySelectorAll('.search-box').forEach(setupSearchBox);
+
+    const images = document.querySelectorAll('img');
+    images.forEach(img => {
+        img.addEventListener('error', function() {
+            this.style.background = 'linear-gradient(45deg, #f0f0f0, #e0e0e0)';
+            this.style.display = 'flex';
+            this.style.alignItems = 'center';
+            this.style.justifyContent = 'center';
+            this.innerHTML = '<i class="fas fa-image" style="font-size: 2rem; color: #999;"></i>';
+        });
+    });
+});
+
+function toggleCart() {
+    window.location.href = '{% url "cart" %}';
+}
+
+function toggleSearch() {
+    const searchInput = document.querySelector('.search-bar input');
+    if (searchInput) {
+        searchInput.focus();
+        searchInput.scrollIntoView({ behavior: 'smooth' });
+    } else {
+        window.location.href = '{% url "theme_search" %}';
+    }
+}
+
+function setupSearchBox(box) {
+    const form = box.querySelector('form');
+    const input = form.querySelector('input[name="q"]');
+    const list = box.querySelector('.search-suggestions');
+    let timer = null;
+    let latest = 0;
+
+    function close() {
+        list.hidden = true;
+        list.replaceChildren();
+    }
+
+    function item(label, kind, href) {
+        const link = document.createElement('a');
+        link.href = href;
+        link.textContent = label;
+        const tag = document.createElement('span');
+        tag.className = 'suggestion-kind';
+        tag.textContent = kind;
+        link.appendChild(tag);
+        const entry = document.createElement('li');
+        entry.appendChild(link);
+        return entry;
+    }
+
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        const query = input.value.trim();
+        if (!query) {
+            close();
+            return;
+        }
+        // Wait for a pause in typing, and drop answers to queries typed over since
+        timer = setTimeout(function() {
+            const current = ++latest;
+            fetch(`${input.dataset.suggestUrl}?q=${encodeURIComponent(query)}&limit=6`)
+                .then(response => response.json())
+                .then(data => {
+                    if (current !== latest) return;
+                    const items = data.categories.map(category =>
+                        item(category.label, 'Category', `{% url "themes" %}?category=${encodeURIComponent(category.slug)}`)
+                    ).concat(data.themes.map(theme =>
+                        item(theme.label, 'Theme', `${form.action}?q=${encodeURIComponent(theme.label)}`)
+                    ));
+                    list.replaceChildren(...items);
+                    list.hidden = items.length === 0;
+                })
+                .catch(close);
+        }, 150);
+    });
+
+    input.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') close();
+    });
+
+    document.addEventListener('click', function(e) {
+        if (!box.contains(e.target)) close();
+    });
+}
+
+function toggleMobileMenu() {
+    const nav = document.getElementById('mobileNav');
+    nav.classList.toggle('active');
+}
+
+function updateCartCount() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const cartCount = cartItems.length;
+    const cartCountElement = document.getElementById('cartCount');
+    if (cartCountElement) {
+        cartCountElement.textContent = cartCount;
+        cartCountElement.style.display = cartCount === 0 ? 'none' : 'flex';
+    }
+}
+
+function addToCart(itemId) {
+    // Get existing cart items
+    let cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+
+    // Check if item already exists
+    const existingItem = cartItems.find(item => item.id === itemId);
+    if (!existingItem) {
+        // Add new item to cart
+        const items = {
+            'flatsome': { price: '₹5,232', image: '{% static "images/Frame 1410119443.png" %}', title: 'Flatsome - Multi-Purpose' },
+            'restaurant': { price: '₹4,345', image: '{% static "images/Frame 1410119442.png" %}', title: 'Restaurant Website' },
+            'porto': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (4).png" %}', title: 'Porto - Multipurpose eCommerce' },
+            'avada': { price: '₹6,118', image: '{% static "images/Frame 1410119443 (1).png" %}', title: 'Avada - Website Builder' },
+            'salient': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (2).png" %}', title: 'Salient - Responsive Multi-Purpose' },
+            'uncode': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (3).png" %}', title: 'Uncode - Creative Multiuse' },
+            'zenix': { price: '₹8,778', image: '{% static "images/Frame 1410119443 (13).png" %}', title: 'Zenix - Modern Dashboard' },
+            'shopmaster': { price: '₹3,192', image: '{% static "images/Frame 1410119442 (2).png" %}', title: 'ShopMaster - Ultimate eCommerce' },
+            'flatsome-template': { price: '₹8,778', image: '{% static "images/Frame 1410119443.png" %}', title: 'Flatsome - Multi-Purpose Template' },
+            'horizon-template': { price: '₹8,778', image: '{% static "images/Themes Images/328afcdf-a9e9-4558-aa2d-7826291d57c6-cover.png" %}', title: 'Horizon - Modern Landing Page' },
+            'adminpro-template': { price: '₹8,778', image: '{% static "images/Themes Images/admin-dashboard-panel-free-template-ui-02.jpg" %}', title: 'AdminPro - Dashboard UI Kit' },
+            'flatsome-bestseller': { price: '₹8,778', image: '{% static "images/Themes Images/8288c5233505779.Y3JvcCwxNzUwLDEzNjgsMCwxNw.png" %}', title: 'Flatsome - Multi-Purpose Bestseller' },
+            'food-delivery': { price: '₹8,778', image: '{% static "images/Themes Images/89368199915f55d5ed120e1c65a0ef9c.jpg" %}', title: 'Food Delivery Website' },
+            'adminpro-bestseller': { price: '₹8,778', image: '{% static "images/Themes Images/c768a587-fba9-401a-bbbd-76d475719f4f-cover.png" %}', title: 'AdminPro - Dashboard UI Kit Bestseller' },
+            'flatsome2': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (5).png" %}', title: 'Flatsome - Multi-Purpose' },
+            'avada2': { price: '₹1,685', image: '{% static "images/Frame 1410119443 (6).png" %}', title: 'Avada - Website Builder For' },
+            'food': { price: '₹2,217', image: '{% static "images/Frame 1410119443 (7).png" %}', title: 'Food Delivery Website' },
+            'business-pro': { price: '₹3,990', image: '{% static "images/Frame 1410119467.png" %}', title: 'Business Pro - Corporate' },
+            'creative-studio': { price: '₹2,571', image: '{% static "images/Frame 1410119468.png" %}', title: 'Creative Studio - Agency' },
+            'shopmaster-ecom': { price: '₹3,458', image: '{% static "images/Frame 1410119469.png" %}', title: 'ShopMaster - E-commerce' },
+            'shopmaster2': { price: '₹3,192', image: '{% static "images/Frame 1410119443 (8).png" %}', title: 'ShopMaster - Ultimate eCommerce' },
+            'blogify': { price: '₹2,217', image: '{% static "images/Frame 1410119443 (9).png" %}', title: 'Blogify - Minimal Blog WordPress' }
+        };
+
+        const item = items[itemId] || { price: '₹1,685', image: '{% static "images/Frame 1410119443.png" %}', title: 'WordPress Theme' };
+
+        const cartItem = {
+            id: itemId,
+            image: item.image,
+            title: item.title,
+            price: item.price,
+            license: 'Regular License'
+        };
+
+        cartItems.push(cartItem);
+        localStorage.setItem('cartItems', JSON.stringify(cartItems));
+        updateCartCount();
+
+        // Show cart modal
+        showCartModal(itemId);
+    }
+
+    const btn = event.target.closest('.btn-cart');
+    const originalContent = btn.innerHTML;
+    btn.innerHTML = '<i class="fas fa-check"></i>';
+    btn.style.background = '#4ade80';
+
+    setTimeout(() => {
+        btn.innerHTML = originalContent;
+        btn.style.background = '';
+    }, 1000);
+}
+
+function showCartModal(itemId) {
+    console.log('Showing cart modal for itemId:', itemId);
+    const modal = document.getElementById('cartModal');
+    const itemImage = document.getElementById('modalItemImage');
+    const itemPrice = document.getElementById('modalItemPrice');
+
+    // Set item details based on itemId
+    const items = {
+        'flatsome': { price: '₹5,232', image: '{% static "images/Frame 1410119443.png" %}' },
+        'restaurant': { price: '₹4,345', image: '{% static "images/Frame 1410119442.png" %}' },
+        'porto': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (4).png" %}' },
+        'avada': { price: '₹6,118', image: '{% static "images/Frame 1410119443 (1).png" %}' },
+        'salient': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (2).png" %}' },
+        'uncode': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (3).png" %}' },
+        'zenix': { price: '₹8,778', image: '{% static "images/Frame 1410119443 (13).png" %}' },
+        'shopmaster': { price: '₹3,192', image: '{% static "images/Frame 1410119442 (2).png" %}' },
+        'flatsome-template': { price: '₹8,778', image: '{% static "images/Frame 1410119443.png" %}' },
+        'horizon-template': { price: '₹8,778', image: '{% static "images/Themes Images/328afcdf-a9e9-4558-aa2d-7826291d57c6-cover.png" %}' },
+        'adminpro-template': { price: '₹8,778', image: '{% static "images/Themes Images/admin-dashboard-panel-free-template-ui-02.jpg" %}' },
+        'flatsome-bestseller': { price: '₹8,778', image: '{% static "images/Themes Images/8288c5233505779.Y3JvcCwxNzUwLDEzNjgsMCwxNw.png" %}' },
+        'food-delivery': { price: '₹8,778', image: '{% static "images/Themes Images/89368199915f55d5ed120e1c65a0ef9c.jpg" %}' },
+        'adminpro-bestseller': { price: '₹8,778', image: '{% static "images/Themes Images/c768a587-fba9-401a-bbbd-76d475719f4f-cover.png" %}' },
+        'flatsome2': { price: '₹1,064', image: '{% static "images/Frame 1410119443 (5).png" %}' },
+        'avada2': { price: '₹1,685', image: '{% static "images/Frame 1410119443 (6).png" %}' },
+        'food': { price: '₹2,217', image: '{% static "images/Frame 1410119443 (7).png" %}' },
+        'business-pro': { price: '₹3,990', image: '{% static "images/Frame 1410119467.png" %}' },
+        'creative-studio': { price: '₹2,571', image: '{% static "images/Frame 1410119468.png" %}' },
+        'shopmaster-ecom': { price: '₹3,458', image: '{% static "images/Frame 1410119469.png" %}' },
+        'shopmaster2': { price: '₹3,192', image: '{% static "images/Frame 1410119443 (8).png" %}' },
+        'blogify': { price: '₹2,217', image: '{% static "images/Frame 1410119443 (9).png" %}' }
+    };
+
+    const item = items[itemId] || { price: '₹1,685', image: '{% static "images/Frame 1410119443.png" %}' };
+    itemPrice.textContent = item.price;
+    itemImage.src = item.image;
+
+    modal.classList.add('show');
+}
+
+function closeCartModal() {
+    document.getElementById('cartModal').classList.remove('show');
+}
+
+function goToCheckout() {
+    // Close modal and go to cart (item already added in addToCart function)
+    closeCartModal();
+    window.location.href = '{% url "cart" %}';
+}
+
+function completePayment() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const user = JSON.parse(localStorage.getItem('currentUser'));
+
+    if (cartItems.length > 0 && user) {
+        const order = {
+            id: Date.now(),
+            date: new Date().toLocaleDateString(),
+            items: cartItems,
+            total: cartItems.reduce((sum, item) => sum + parseFloat(item.price.replace('₹', '').replace(',', '')), 0),
+            status: 'Completed'
+        };
+
+        const userOrders = JSON.parse(localStorage.getItem(`orders_${user.email}`) || '[]');
+        userOrders.push(order);
+        localStorage.setItem(`orders_${user.email}`, JSON.stringify(userOrders));
+        localStorage.removeItem('cartItems');
+        updateCartCount();
+    }
+}
+
+function showMyOrders() {
+    const user = JSON.parse(localStorage.getItem('currentUser'));
+    if (!user) return;
+
+    const orders = JSON.parse(localStorage.getItem(`orders_${user.email}`) || '[]');
+    const ordersList = document.getElementById('ordersList');
+
+    if (orders.length === 0) {
+        ordersList.innerHTML = '<div style="text-align: center; padding: 3rem; color: #64748b;"><i class="fas fa-shopping-bag" style="font-size: 3rem; margin-bottom: 1rem; opacity: 0.3;"></i><h3>No orders yet</h3><p>Your orders will appear here after purchase</p></div>';
+    } else {
+        ordersList.innerHTML = orders.map(order => `
+            <div onclick="showOrderDetails(${order.id})" style="border: 1px solid #f1f5f9; border-radius: 8px; padding: 1rem; margin-bottom: 1rem; cursor: pointer; transition: all 0.3s ease;" onmouseover="this.style.boxShadow='0 4px 12px rgba(0,0,0,0.1)'" onmouseout="this.style.boxShadow='none'">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.75rem;">
+                    <div style="font-weight: 600; color: #1e293b; font-size: 1.1rem;">Order #${order.id}</div>
+                    <div style="font-size: 0.9rem; color: #64748b;">${order.date}</div>
+                </div>
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="color: #64748b; font-size: 0.9rem;">${order.items.length} item${order.items.length > 1 ? 's' : ''}</div>
+                    <div style="font-weight: 600; color: #4ade80; font-size: 1.1rem;">₹${order.total.toLocaleString('en-IN')}</div>
+                </div>
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div style="background: #dcfce7; color: #16a34a; padding: 0.25rem 0.75rem; border-radius: 12px; font-size: 0.8rem; font-weight: 600;">Payment Complete</div>
+                    <div style="color: #64748b; font-size: 0.85rem;">Ready to Use</div>
+                </div>
+            </div>
+        `).join('');
+    }
+
+    document.getElementById('userMenu').style.display = 'none';
+    document.getElementById('ordersModal').classList.add('show');
+}
+
+function showOrderDetails(orderId) {
+    const user = JSON.parse(localStorage.getItem('currentUser'));
+    const orders = JSON.parse(localStorage.getItem(`orders_${user.email}`) || '[]');
+    const order = orders.find(o => o.id === orderId);
+
+    if (order) {
+        const content = document.getElementById('orderDetailsContent');
+        content.innerHTML = `
+            <div style="margin-bottom: 1.5rem;">
+                <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;">Order ID:</span>
+                    <span>#${order.id}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;">Date:</span>
+                    <span>${order.date}</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;">Status:</span>
+                    <span style="color: #4ade80; font-weight: 600;">${order.status}</span>
+                </div>
+            </div>
+            <div style="border-top: 1px solid #f1f5f9; padding-top: 1rem;">
+                <h3 style="margin-bottom: 1rem; color: #1e293b;">Items Purchased</h3>
+                ${order.items.map(item => `
+                    <div style="display: flex; align-items: center; gap: 1rem; padding: 0.75rem 0; border-bottom: 1px solid #f8fafc;">
+                        <img src="${item.image}" style="width: 60px; height: 45px; border-radius: 6px; object-fit: cover;">
+                        <div style="flex: 1;">
+                            <div style="font-weight: 600; margin-bottom: 0.25rem;">${item.title}</div>
+                            <div style="font-size: 0.85rem; color: #64748b;">${item.license}</div>
+                        </div>
+                        <div style="font-weight: 600; color: #1e293b;">${item.price}</div>
+                    </div>
+                `).join('')}
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 1rem; padding-top: 1rem; border-top: 2px solid #f1f5f9;">
+                    <span style="font-size: 1.25rem; font-weight: 700;">Total:</span>
+                    <span style="font-size: 1.25rem; font-weight: 700; color: #4ade80;">₹${order.total.toLocaleString('en-IN')}</span>
+                </div>
+            </div>
+        `;
+
+        document.getElementById('ordersModal').classList.remove('show');
+        document.getElementById('orderDetailsModal').classList.add('show');
+    }
+}
+
+function closeOrdersModal() {
+    document.getElementById('ordersModal').classList.remove('show');
+}
+
+function closeOrderDetailsModal() {
+    document.getElementById('orderDetailsModal').classList.remove('show');
+    document.getElementById('ordersModal').classList.add('show');
+}
+
+// Close modal when clicking outside
+document.addEventListener('click', function(e) {
+    const cartModal = document.getElementById('cartModal');
+    const loginModal = document.getElementById('loginModal');
+    if (e.target === cartModal) {
+        closeCartModal();
+    }
+    if (e.target === loginModal) {
+        closeLoginModal();
+    }
+});
+
+function openLoginModal() {
+    document.getElementById('loginModal').classList.add('show');
+}
+
+function closeLoginModal() {
+    document.getElementById('loginModal').classList.remove('show');
+}
+
+let isLoginMode = false;
+
+function toggleUserMenu() {
+    const menu = document.getElementById('userMenu');
+    menu.style.display = menu.style.display === 'none' ? 'block' : 'none';
+}
+
+function checkUserSession() {
+    const user = localStorage.getItem('currentUser');
+    if (user) {
+        const userData = JSON.parse(user);
+        document.getElementById('loginBtn').style.display = 'none';
+        document.getElementById('userProfile').style.display = 'block';
+        document.getElementById('userName').textContent = userData.name;
+        document.getElementById('userInitials').textContent = userData.name.substring(0, 3).toUpperCase();
+    }
+}
+
+function logout() {
+    localStorage.removeItem('currentUser');
+    document.getElementById('loginBtn').style.display = 'block';
+    document.getElementById('userProfile').style.display = 'none';
+    document.getElementById('userMenu').style.display = 'none';
+}
+
+document.getElementById('switchMode').addEventListener('click', function(e) {
+    e.preventDefault();
+    isLoginMode = !isLoginMode;
+    const title = document.querySelector('#loginModal h2');
+    const button = document.getElementById('authButton');
+    const nameField = document.getElementById('fullName');
+    const termsCheck = document.getElementById('termsCheck').parentElement;
+    const switchText = document.getElementById('switchText');
+    const switchLink = document.getElementById('switchMode');
+
+    if (isLoginMode) {
+        title.textContent = 'Log in';
+        button.textContent = 'Log in';
+        nameField.style.display = 'none';
+        termsCheck.style.display = 'none';
+        switchText.textContent = "Don't have an account ?";
+        switchLink.textContent = 'Sign up';
+    } else {
+        title.textContent = 'Sign in';
+        button.textContent = 'Create Account';
+        nameField.style.display = 'block';
+        termsCheck.style.display = 'flex';
+        switchText.textContent = 'Already have an account ?';
+        switchLink.textContent = 'Log in';
+    }
+});
+
+document.getElementById('authForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+    const name = document.getElementById('fullName').value;
+    const email = document.getElementById('userEmail').value;
+
+    if (isLoginMode) {
+        // Login logic
+        const users = JSON.parse(localStorage.getItem('registeredUsers') || '[]');
+        const user = users.find(u => u.email === email);
+        if (user) {
+            localStorage.setItem('currentUser', JSON.stringify(user));
+            closeLoginModal();
+            checkUserSession();
+        } else {
+            alert('User not found. Please sign up first.');
+        }
+    } else {
+        // Signup logic
+        const users = JSON.parse(localStorage.getItem('registeredUsers') || '[]');
+        const newUser = { name, email };
+        users.push(newUser);
+        localStorage.setItem('registeredUsers', JSON.stringify(users));
+        localStorage.setItem('currentUser', JSON.stringify(newUser));
+        closeLoginModal();
+        checkUserSession();
+    }
+});
+
+// Check user session on page load
+document.addEventListener('DOMContentLoaded', function() {
+    checkUserSession();
+});
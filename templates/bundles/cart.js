@@ -0,0 +1,82 @@
+function closeModal() {
+    document.getElementById('itemAddedModal').style.display = 'none';
+}
+
+function loadCartItems() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const cartItemsList = document.getElementById('cartItemsList');
+    const emptyMessage = document.getElementById('emptyCartMessage');
+    const cartTotal = document.getElementById('cartTotal');
+    const cartSavings = document.getElementById('cartSavings');
+
+    if (cartItems.length === 0) {
+        emptyMessage.style.display = 'block';
+        cartItemsList.style.display = 'none';
+        cartTotal.textContent = '₹0';
+        cartSavings.textContent = 'Total Saving ₹0';
+        return;
+    }
+
+    emptyMessage.style.display = 'none';
+    cartItemsList.style.display = 'block';
+
+    let total = 0;
+    cartItemsList.innerHTML = '';
+
+    cartItems.forEach((item, index) => {
+        const price = parseFloat(item.price.replace('₹', '').replace(',', ''));
+        total += price;
+
+        const cartItemHTML = `
+            <div class="cart-item">
+                <img src="${item.image}" alt="${item.title}" class="item-image">
+                <div class="item-details">
+                    <div class="item-title">${item.title}</div>
+                    <div class="item-license">License: ${item.license}</div>
+                </div>
+                <div class="item-quantity">
+                    <button class="qty-btn">−</button>
+                    <input type="text" value="1" class="qty-input">
+                    <button class="qty-btn">+</button>
+                </div>
+                <div class="item-price">${item.price}</div>
+                <div class="remove-btn" onclick="removeCartItem(${index})">×</div>
+            </div>
+        `;
+        cartItemsList.innerHTML += cartItemHTML;
+    });
+
+    cartTotal.textContent = `₹${total.toLocaleString('en-IN')}`;
+    cartSavings.textContent = `Total Saving ₹${Math.floor(total * 0.1).toLocaleString('en-IN')}`;
+}
+
+function removeCartItem(index) {
+    let cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    cartItems.splice(index, 1);
+    localStorage.setItem('cartItems', JSON.stringify(cartItems));
+    loadCartItems();
+    updateCartCount();
+}
+
+function updateCartCount() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const cartCount = cartItems.length;
+    const cartCountElement = document.getElementById('cartCount');
+    if (cartCountElement) {
+        cartCountElement.textContent = cartCount;
+        cartCountElement.style.display = cartCount === 0 ? 'none' : 'flex';
+    }
+}
+
+// Load cart items when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    loadCartItems();
+    updateCartCount();
+});
+
+// Empty cart functionality
+document.querySelector('.btn-empty').addEventListener('click', function() {
+    localStorage.removeItem('cartItems');
+    loadCartItems();
+    updateCartCount();
+});
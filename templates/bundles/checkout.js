@@ -0,0 +1,120 @@
+document.addEventListener('DOMContentLoaded', function() {
+    loadCheckoutItems();
+});
+
+function loadCheckoutItems() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const orderItems = document.getElementById('orderItems');
+    const itemCount = document.getElementById('itemCount');
+    const totalDiscount = document.getElementById('totalDiscount');
+    const finalTotal = document.getElementById('finalTotal');
+
+    if (cartItems.length === 0) {
+        orderItems.innerHTML = '<div class="summary-item"><span class="item-name">No items in cart</span><span class="item-price">₹0</span></div>';
+        itemCount.textContent = '0 items';
+        totalDiscount.textContent = '₹0';
+        finalTotal.textContent = '₹0';
+        return;
+    }
+
+    let total = 0;
+    orderItems.innerHTML = '';
+
+    cartItems.forEach(item => {
+        const price = parseFloat(item.price.replace('₹', '').replace(',', ''));
+        total += price;
+
+        orderItems.innerHTML += `
+            <div class="summary-item">
+                <span class="item-name">${item.title}</span>
+                <span class="item-price">${item.price}</span>
+            </div>
+        `;
+    });
+
+    const discount = Math.floor(total * 0.05);
+    const finalAmount = total - discount;
+
+    itemCount.textContent = `${cartItems.length} item${cartItems.length > 1 ? 's' : ''}`;
+    totalDiscount.textContent = `₹${discount.toLocaleString('en-IN')}`;
+    finalTotal.textContent = `₹${finalAmount.toLocaleString('en-IN')}`;
+}
+
+function completePayment() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    const user = JSON.parse(localStorage.getItem('currentUser'));
+
+    if (cartItems.length > 0 && user) {
+        const order = {
+            id: Date.now(),
+            date: new Date().toLocaleDateString(),
+            items: cartItems,
+            total: cartItems.reduce((sum, item) => sum + parseFloat(item.price.replace('₹', '').replace(',', '')), 0),
+            status: 'Completed'
+        };
+
+        const userOrders = JSON.parse(localStorage.getItem(`orders_${user.email}`) || '[]');
+        userOrders.push(order);
+        localStorage.setItem(`orders_${user.email}`, JSON.stringify(userOrders));
+        localStorage.removeItem('cartItems');
+    }
+}
+
+function initiateRazorpayPayment() {
+    const cartItems = JSON.parse(localStorage.getItem('cartItems') || '[]');
+    if (cartItems.length === 0) {
+        alert('No items in cart');
+        return;
+    }
+
+    const total = cartItems.reduce((sum, item) => sum + parseFloat(item.price.replace('₹', '').replace(',', '')), 0);
+    const discount = Math.floor(total * 0.05);
+    const finalAmount = total - discount;
+
+    const options = {
+        "key": "rzp_test_RbxlYBHo3dkp9y",
+        "amount": finalAmount * 100,
+        "currency": "INR",
+        "name": "ThemeMarket",
+        "description": `Purchase of ${cartItems.length} item(s)`,
+        "handler": function (response){
+            try {
+                completePayment();
+                alert('Payment successful! Order placed. Payment ID: ' + response.razorpay_payment_id);
+                setTimeout(function() {
+                    window.top.location.href = window.location.origin;
+                }, 1000);
+            } catch (error) {
+                alert('Order processing failed. Please contact support.');
+            }
+        },
+        "prefill": {
+            "name": document.querySelector('input[type="text"]').value,
+            "email": document.querySelector('input[type="email"]').value,
+            "contact": document.querySelector('input[type="tel"]').value
+        },
+        "theme": {
+            "color": "#5c2dd5"
+        },
+        "modal": {
+            "ondismiss": function(){
+                alert('Payment cancelled');
+            },
+            "escape": false,
+            "backdropclose": false
+        },
+        "retry": {
+            "enabled": true,
+            "max_count": 3
+        }
+    };
+
+    const rzp1 = new Razorpay(options);
+
+    rzp1.on('payment.failed', function (response){
+        alert('Payment failed! Error: ' + response.error.description + '. Please try again.');
+        console.error('Payment failed:', response.error);
+    });
+
+    rzp1.open();
+}
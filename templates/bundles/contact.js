@@ -0,0 +1,30 @@
+function toggleFaq(element) {
+    const faqItem = element.parentElement;
+    const icon = element.querySelector('i');
+
+    // Close all other FAQ items
+    document.querySelectorAll('.faq-item').forEach(item => {
+        if (item !== faqItem) {
+            item.classList.remove('active');
+            item.querySelector('i').classList.remove('fa-chevron-up');
+            item.querySelector('i').classList.add('fa-chevron-down');
+        }
+    });
+
+    // Toggle current FAQ item
+    faqItem.classList.toggle('active');
+    if (faqItem.classList.contains('active')) {
+        icon.classList.remove('fa-chevron-down');
+        icon.classList.add('fa-chevron-up');
+    } else {
+        icon.classList.remove('fa-chevron-up');
+        icon.classList.add('fa-chevron-down');
+    }
+}
+
+// Form submission
+document.querySelector('.contact-form').addEventListener('submit', function(e) {
+    e.preventDefault();
+    alert('Thank you for your message! We\'ll get back to you soon.');
+    this.reset();
+});
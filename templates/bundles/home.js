@@ -0,0 +1,54 @@
+function handleImageError(img) {
+    const fallbackUrl = img.getAttribute('data-fallback');
+    if (fallbackUrl) {
+        img.src = fallbackUrl;
+    }
+    img.onerror = null;
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Initialize hero images positioning
+    const heroImagesContainer = document.querySelector('.hero-images');
+    if (heroImagesContainer) {
+        const rect = heroImagesContainer.getBoundingClientRect();
+        console.log('Hero Images Container Dimensions:', {
+            width: rect.width,
+            height: rect.height
+        });
+    }
+
+    // Newsletter form submission
+    const subscribeForm = document.querySelector('.subscribe-form');
+    if (subscribeForm) {
+        subscribeForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+            const email = this.querySelector('.subscribe-input').value;
+            if (email) {
+                alert('Thank you for subscribing!');
+                this.querySelector('.subscribe-input').value = '';
+            }
+        });
+    }
+});
+
+// Toggle functionality for Best Sellers section
+function switchPeriod(period) {
+    const weekBtn = document.getElementById('week-btn');
+    const monthBtn = document.getElementById('month-btn');
+
+    if (period === 'week') {
+        weekBtn.style.background = '#4ade80';
+        weekBtn.style.color = 'white';
+        weekBtn.style.boxShadow = '0 2px 4px rgba(0,0,0,0.1)';
+        monthBtn.style.background = 'transparent';
+        monthBtn.style.color = '#6b7280';
+        monthBtn.style.boxShadow = 'none';
+    } else {
+        monthBtn.style.background = '#4ade80';
+        monthBtn.style.color = 'white';
+        monthBtn.style.boxShadow = '0 2px 4px rgba(0,0,0,0.1)';
+        weekBtn.style.background = 'transparent';
+        weekBtn.style.color = '#6b7280';
+        weekBtn.style.boxShadow = 'none';
+    }
+}
@@ -0,0 +1,22 @@
+function selectPaymentMethod(element, method) {
+    document.querySelectorAll('.method-option').forEach(el => el.classList.remove('selected'));
+    element.classList.add('selected');
+    element.querySelector('input[type="radio"]').checked = true;
+
+    const cardForm = document.getElementById('cardForm');
+    if (method === 'card') {
+        cardForm.style.display = 'block';
+    } else {
+        cardForm.style.display = 'none';
+    }
+}
+
+function processPayment() {
+    const loadingOverlay = document.getElementById('loadingOverlay');
+    loadingOverlay.style.display = 'flex';
+
+    // Simulate payment processing
+    setTimeout(() => {
+        window.location.href = '{% url "payment_success" %}';
+    }, 3000);
+}
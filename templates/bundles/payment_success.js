@@ -0,0 +1,8 @@
+// Clear cart after successful payment
+localStorage.removeItem('cartItems');
+localStorage.setItem('cartCount', '0');
+
+// Auto redirect after 30 seconds
+setTimeout(() => {
+    window.location.href = '{% url "home" %}';
+}, 30000);
@@ -0,0 +1,177 @@
+function toggleSortDropdown() {
+    const options = document.getElementById('sort-options');
+    const icon = document.getElementById('sort-icon');
+
+    if (options.style.display === 'none' || options.style.display === '') {
+        options.style.display = 'block';
+        icon.classList.remove('fa-chevron-down');
+        icon.classList.add('fa-chevron-up');
+    } else {
+        options.style.display = 'none';
+        icon.classList.remove('fa-chevron-up');
+        icon.classList.add('fa-chevron-down');
+    }
+}
+
+function selectSort(option) {
+    document.getElementById('sort-text').textContent = option;
+    document.getElementById('sort-options').style.display = 'none';
+    document.getElementById('sort-icon').classList.remove('fa-chevron-up');
+    document.getElementById('sort-icon').classList.add('fa-chevron-down');
+
+    // Apply sorting
+    const themeGrid = document.querySelector('.theme-grid');
+    const themeCards = Array.from(themeGrid.querySelectorAll('.theme-card'));
+
+    themeCards.sort((a, b) => {
+        const priceA = parseFloat(a.querySelector('.theme-price').textContent.replace('₹', '').replace(',', ''));
+        const priceB = parseFloat(b.querySelector('.theme-price').textContent.replace('₹', '').replace(',', ''));
+        const titleA = a.querySelector('.theme-title').textContent;
+        const titleB = b.querySelector('.theme-title').textContent;
+
+        switch(option) {
+            case 'Price, Low to high':
+                return priceA - priceB;
+            case 'Price, high to low':
+                return priceB - priceA;
+            case 'Newest First':
+                return titleA.localeCompare(titleB);
+            case 'Most Popular':
+                return titleB.localeCompare(titleA);
+            default: // Best Sellers
+                return 0;
+        }
+    });
+
+    // Re-append sorted cards
+    themeCards.forEach(card => themeGrid.appendChild(card));
+}
+
+function toggleFilter(filterType) {
+    const content = document.getElementById(filterType + '-content');
+    const icon = document.getElementById(filterType + '-icon');
+    const dropdown = content.previousElementSibling;
+
+    if (content.classList.contains('active')) {
+        content.classList.remove('active');
+        dropdown.classList.remove('active');
+        icon.classList.remove('fa-chevron-up');
+        icon.classList.add('fa-chevron-down');
+    } else {
+        content.classList.add('active');
+        dropdown.classList.add('active');
+        icon.classList.remove('fa-chevron-down');
+        icon.classList.add('fa-chevron-up');
+    }
+}
+
+// Category, type, price and rating are filtered and counted by the server:
+// each group holds one value, so ticking a box replaces the group's choice
+// and reloads the listing through the GET form
+function submitFacet(event) {
+    const checkbox = event.target;
+    checkbox.form.querySelectorAll(`input[name="${checkbox.name}"]`).forEach(other => {
+        if (other !== checkbox) other.checked = false;
+    });
+    checkbox.form.submit();
+}
+
+// Features and compatibility have no server-side data yet and still filter the cards on this page
+function applyFilters() {
+    const themeCards = document.querySelectorAll('.theme-card');
+    const activeFilters = {
+        features: [],
+        compatibility: []
+    };
+
+    // Collect active filters
+    Object.keys(activeFilters).forEach(filterType => {
+        const checkboxes = document.querySelectorAll(`input[name="${filterType}"]:checked`);
+        checkboxes.forEach(checkbox => {
+            activeFilters[filterType].push(checkbox.value);
+        });
+    });
+
+    // Filter theme cards
+    themeCards.forEach(card => {
+        let shouldShow = true;
+        const title = card.querySelector('.theme-title').textContent.toLowerCase();
+
+        // Features filter
+        if (activeFilters.features.length > 0) {
+            const matchesFeatures = activeFilters.features.some(feature => {
+                if (feature === 'responsive') return true; // All themes are responsive
+                if (feature === 'seo') return title.includes('flatsome') || title.includes('avada');
+                return false;
+            });
+            if (!matchesFeatures) shouldShow = false;
+        }
+
+        // Compatibility filter
+        if (activeFilters.compatibility.length > 0) {
+            const matchesCompatibility = activeFilters.compatibility.some(comp => {
+                if (comp === 'woocommerce') return title.includes('porto') || title.includes('shopmaster') || title.includes('flatsome');
+                if (comp === 'elementor') return title.includes('avada') || title.includes('uncode');
+                return false;
+            });
+            if (!matchesCompatibility) shouldShow = false;
+        }
+
+        card.style.display = shouldShow ? 'block' : 'none';
+    });
+}
+
+function switchView(viewType) {
+    const themeGrid = document.querySelector('.theme-grid');
+    const themeCards = document.querySelectorAll('.theme-card');
+    const viewButtons = document.querySelectorAll('.view-toggle button');
+
+    // Remove active class from all buttons
+    viewButtons.forEach(btn => btn.classList.remove('active'));
+
+    if (viewType === 'list') {
+        themeGrid.classList.add('list-view');
+        themeCards.forEach(card => card.classList.add('list-view'));
+        viewButtons[1].classList.add('active');
+    } else {
+        themeGrid.classList.remove('list-view');
+        themeCards.forEach(card => card.classList.remove('list-view'));
+        viewButtons[0].classList.add('active');
+    }
+}
+
+function toggleHeart(heartIcon) {
+    const popup = heartIcon.nextElementSibling;
+
+    if (heartIcon.classList.contains('loved')) {
+        heartIcon.classList.remove('loved');
+        heartIcon.innerHTML = '♡';
+    } else {
+        heartIcon.classList.add('loved');
+        heartIcon.innerHTML = '♥';
+
+        // Show popup animation
+        popup.classList.add('show');
+        setTimeout(() => {
+            popup.classList.remove('show');
+        }, 600);
+    }
+}
+
+document.addEventListener('click', function(event) {
+    const sortDropdown = document.querySelector('.sort-dropdown');
+    const sortOptions = document.getElementById('sort-options');
+
+    if (!sortDropdown.contains(event.target)) {
+        sortOptions.style.display = 'none';
+        document.getElementById('sort-icon').classList.remove('fa-chevron-up');
+        document.getElementById('sort-icon').classList.add('fa-chevron-down');
+    }
+});
+
+// Add event listeners to filter checkboxes
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('.filter-option input[type="checkbox"]').forEach(checkbox => {
+        checkbox.addEventListener('change', checkbox.form && checkbox.form.id === 'facet-form' ? submitFacet : applyFilters);
+    });
+});
@@ -16,8 +16,12 @@ from .models import (
     # Templates Page Models
     TemplatesHero, HTMLTemplatesSection, UITemplatesSection,
     # Other Page Models
-    LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent
+    LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent,
+    # Background Jobs
+    BackgroundJob
 )
+from .exports import export_response
+from .jobs import retry
 
 class SiteSettingsAdmin(ModelAdmin):
     list_display = ['site_name', 'site_tagline']
@@ -72,7 +76,7 @@ class HeroSectionAdmin(ModelAdmin):
 admin_site.register(HeroSection, HeroSectionAdmin)
 
 class CategoryAdmin(ModelAdmin):
-    list_display = ['name', 'slug', 'icon_class', 'is_featured', 'order']
+    list_display = ['name', 'slug', 'icon_class', 'theme_count', 'is_featured', 'order']
     list_editable = ['is_featured', 'order']
     list_filter = ['is_featured']
     prepopulated_fields = {'slug': ('name',)}
@@ -93,6 +97,7 @@ class ThemeAdmin(ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     ordering = ['-created_at']
     inlines = [ThemeImageInline]
+    actions = ['export_csv', 'export_jsonl']
     
     fieldsets = (
         ('Basic Information', {
@@ -119,6 +124,15 @@ class ThemeAdmin(ModelAdmin):
         if obj:
             return ['created_at', 'updated_at']
         return []
+
+    # With "select all" the queryset is the whole filtered changelist; the export streams it
+    @admin.action(description='Export selected themes as CSV')
+    def export_csv(self, request, queryset):
+        return export_response(queryset, 'csv')
+
+    @admin.action(description='Export selected themes as JSONL')
+    def export_jsonl(self, request, queryset):
+        return export_response(queryset, 'jsonl')
 admin_site.register(Theme, ThemeAdmin)
 
 class PageAdmin(ModelAdmin):
@@ -458,4 +472,21 @@ class PaymentSuccessPageContentAdmin(ModelAdmin):
     list_editable = ['is_active', 'order']
     list_filter = ['section_type', 'is_active']
     ordering = ['order']
-admin_site.register(PaymentSuccessPageContent, PaymentSuccessPageContentAdmin)
\ No newline at end of file
+admin_site.register(PaymentSuccessPageContent, PaymentSuccessPageContentAdmin)
+
+class BackgroundJobAdmin(ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'attempts', 'max_attempts', 'run_after', 'created_at', 'finished_at']
+    list_filter = ['status', 'kind']
+    search_fields = ['payload', 'last_error']
+    readonly_fields = ['kind', 'payload', 'status', 'attempts', 'run_after', 'last_error', 'result',
+                       'created_at', 'updated_at', 'started_at', 'finished_at']
+    actions = ['retry_jobs']
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description='Retry selected jobs now')
+    def retry_jobs(self, request, queryset):
+        count = retry(queryset)
+        self.message_user(request, f'{count} jobs queued for retry.')
+admin_site.register(BackgroundJob, BackgroundJobAdmin)
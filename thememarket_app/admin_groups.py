@@ -4,11 +4,30 @@ from django.urls import path
 from django.shortcuts import render
 from django.http import HttpResponseRedirect
 
+from .metrics import request_stats, reset_stats
+
 class ThemeMarketAdminSite(AdminSite):
     site_header = 'ThemeMarket Admin'
     site_title = 'ThemeMarket Admin Portal'
     index_title = 'Welcome to ThemeMarket Administration'
     
+    def get_urls(self):
+        return [
+            path('stats/', self.admin_view(self.request_stats_view), name='request_stats'),
+        ] + super().get_urls()
+    
+    def request_stats_view(self, request):
+        """Rolling per-view timings recorded by ServerTimingMiddleware in this process"""
+        if request.method == 'POST' and 'reset' in request.POST:
+            reset_stats()
+            return HttpResponseRedirect(request.path)
+        context = {
+            **self.each_context(request),
+            'title': 'Request Stats',
+            'stats': request_stats(),
+        }
+        return render(request, 'admin/request_stats.html', context)
+    
     def get_app_list(self, request, app_label=None):
         """Organize admin models into logical groups"""
         app_list = super().get_app_list(request, app_label)
@@ -103,6 +122,20 @@ class ThemeMarketAdminSite(AdminSite):
                     {'name': '📑 Static Pages', 'object_name': 'Page', 'admin_url': '/admin/thememarket_app/page/', 'add_url': '/admin/thememarket_app/page/add/'},
                 ]
             },
+            {
+                'name': 'Monitoring',
+                'app_label': 'monitoring',
+                'models': [
+                    {'name': '📊 Request Stats', 'object_name': 'RequestStats', 'admin_url': '/admin/stats/'},
+                ]
+            },
+            {
+                'name': 'Background Jobs',
+                'app_label': 'background_jobs',
+                'models': [
+                    {'name': '⚙️ Job Queue', 'object_name': 'BackgroundJob', 'admin_url': '/admin/thememarket_app/backgroundjob/'},
+                ]
+            },
         ]
 
         return custom_app_list
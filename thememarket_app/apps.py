@@ -2,4 +2,9 @@ from django.apps import AppConfig
 
 class ThememarketAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'thememarket_app'
\ No newline at end of file
+    name = 'thememarket_app'
+
+    def ready(self):
+        from . import checks  # noqa: F401  registers the system checks
+        from .signals import connect_signals
+        connect_signals()
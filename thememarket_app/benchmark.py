@@ -0,0 +1,333 @@
+import http.client
+import json
+import platform
+import re
+import resource
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urlencode
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.test import Client
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from . import urls as storefront_urls
+from .admin_groups import admin_site
+from .models import Theme
+
+HOST = 'localhost'
+BENCHMARK_DIR = Path(settings.BASE_DIR) / 'benchmarks'
+
+# Query strings for endpoints that need one to do any work, plus extra listing variants
+ROUTE_QUERIES = {
+    'theme_search': {'q': 'theme'},
+    'suggest': {'q': 'th'},
+}
+EXTRA_ROUTES = {
+    'themes:filtered': ('themes', {'type': 'html', 'price': 'free'}),
+    'themes:rated': ('themes', {'rating': '4'}),
+}
+
+# How the database behind the committed baselines is built, starting from an
+# empty one; results are only comparable against a database made the same way
+BASELINE_CATALOG = (
+    'python manage.py migrate',
+    'python manage.py loaddata critical_pages',
+    'python manage.py generate_catalog --themes 10000 --seed 22',
+    'python manage.py run_workers --once',
+    'DJANGO_SUPERUSER_PASSWORD=benchmark python manage.py createsuperuser --noinput '
+    '--username benchmark --email benchmark@example.com',
+)
+
+# Latency moves by a few milliseconds between identical runs; smaller changes are noise
+NOISE_MS = 5.0
+QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+
+
+def storefront_routes():
+    """{route name: url} for every argument-free storefront URL and a few filtered listings"""
+    routes = {}
+    for pattern in storefront_urls.urlpatterns:
+        if isinstance(pattern, URLPattern) and not pattern.pattern.converters:
+            query = ROUTE_QUERIES.get(pattern.name)
+            routes[pattern.name] = reverse(pattern.name) + (f'?{urlencode(query)}' if query else '')
+    for name, (url_name, query) in EXTRA_ROUTES.items():
+        routes[name] = f'{reverse(url_name)}?{urlencode(query)}'
+    return routes
+
+
+def admin_routes():
+    """{route name: url} for every registered admin changelist"""
+    return {
+        f'admin:{model._meta.label_lower}': reverse(
+            f'{admin_site.name}:{model._meta.app_label}_{model._meta.model_name}_changelist'
+        )
+        for model in admin_site._registry
+    }
+
+
+def admin_cookie():
+    """Session cookie of a superuser, or None when there is no superuser to log in as"""
+    user = get_user_model().objects.filter(is_superuser=True, is_active=True).order_by('pk').first()
+    if user is None:
+        return None
+    client = Client()
+    client.force_login(user)
+    return f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}'
+
+
+class InProcessTransport:
+    """Calls the WSGI application directly, without sockets or HTTP parsing"""
+
+    name = 'inprocess'
+
+    def __init__(self, application):
+        self.application = application
+
+    def request(self, url, cookie):
+        path, _, query = url.partition('?')
+        environ = {
+            'REQUEST_METHOD': 'GET',
+            'SCRIPT_NAME': '',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'SERVER_NAME': HOST,
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'HTTP_HOST': HOST,
+            'HTTP_ACCEPT_ENCODING': 'gzip, br',
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': BytesIO(),
+            'wsgi.errors': BytesIO(),
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        if cookie:
+            environ['HTTP_COOKIE'] = cookie
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = dict(headers)
+
+        body = self.application(environ, start_response)
+        try:
+            size = sum(len(chunk) for chunk in body)
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
+        return response['status'], response['headers'], size
+
+    def close(self):
+        pass
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class SocketTransport:
+    """Serves the WSGI application from a local threaded HTTP server and talks HTTP to it"""
+
+    name = 'socket'
+
+    def __init__(self, application):
+        self.server = make_server('127.0.0.1', 0, application, ThreadingWSGIServer, QuietHandler)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def request(self, url, cookie):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        headers = {'Host': HOST, 'Accept-Encoding': 'gzip, br'}
+        if cookie:
+            headers['Cookie'] = cookie
+        try:
+            conn.request('GET', url, headers=headers)
+            response = conn.getresponse()
+            return response.status, dict(response.getheaders()), len(response.read())
+        finally:
+            conn.close()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def rss_mb():
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[1]) * resource.getpagesize() / 2 ** 20
+    except OSError:
+        return max_rss_mb()
+
+
+def max_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    divisor = 2 ** 20 if platform.system() == 'Darwin' else 2 ** 10
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+
+
+def run(transport, routes, cookies, clients=8, rounds=30, warmup=True):
+    """
+    Request each route rounds times, spread over clients concurrent threads.
+
+    routes maps a route name to a URL and cookies maps a route name to the
+    Cookie header to send. Routes are loaded one after another so a route's
+    latencies reflect contention with itself rather than with whichever
+    heavier route happened to run alongside it. Every route is requested
+    once first so the numbers describe a warm process, unless warmup is False.
+    """
+    if warmup:
+        for name, url in routes.items():
+            transport.request(url, cookies.get(name))
+    samples = {name: [] for name in routes}
+    seconds = {}
+
+    def client(name, count):
+        try:
+            for _ in range(count):
+                started = time.perf_counter()
+                try:
+                    status, headers, size = transport.request(routes[name], cookies.get(name))
+                except Exception:
+                    status, headers, size = None, {}, 0
+                elapsed = time.perf_counter() - started
+                match = QUERIES_RE.search(headers.get('Server-Timing', ''))
+                samples[name].append((elapsed, status, int(match.group(1)) if match else None, size))
+        finally:
+            connections.close_all()
+
+    for name in routes:
+        shares = [rounds // clients + (index < rounds % clients) for index in range(clients)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(client, [name] * clients, shares))
+        seconds[name] = time.perf_counter() - started
+
+    results = {}
+    for name, route_samples in samples.items():
+        latencies = [sample[0] * 1000 for sample in route_samples]
+        queries = [sample[2] for sample in route_samples if sample[2] is not None]
+        results[name] = {
+            'url': routes[name],
+            'requests': len(route_samples),
+            'errors': sum(1 for sample in route_samples if sample[1] is None or sample[1] >= 400),
+            'p50': round(percentile(latencies, 0.5), 2),
+            'p95': round(percentile(latencies, 0.95), 2),
+            'p99': round(percentile(latencies, 0.99), 2),
+            'throughput': round(len(route_samples) / seconds[name], 1),
+            'queries': percentile(queries, 0.5) if queries else None,
+            'bytes': max(sample[3] for sample in route_samples),
+        }
+    total = sum(len(route_samples) for route_samples in samples.values())
+    elapsed = sum(seconds.values())
+    return {
+        'meta': {
+            'transport': transport.name,
+            'clients': clients,
+            'rounds': rounds,
+            'warmup': warmup,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'themes': Theme.objects.count(),
+            'recorded': timezone.now().isoformat(timespec='seconds'),
+        },
+        'summary': {
+            'requests': total,
+            'errors': sum(route['errors'] for route in results.values()),
+            'seconds': round(elapsed, 3),
+            'throughput': round(total / elapsed, 1),
+            'rss_mb': round(rss_mb(), 1),
+            'max_rss_mb': round(max_rss_mb(), 1),
+        },
+        'routes': results,
+    }
+
+
+def compare(results, baseline, tolerance, latency_tolerance):
+    """
+    Lines describing the overall change and every regression against baseline.
+
+    More queries or any error is a regression outright. Throughput and peak
+    memory regress when worse by more than tolerance percent and a route's
+    median latency when slower by more than latency_tolerance percent.
+    """
+    lines, regressions = [], []
+
+    def check(label, before, after, worse, always=False):
+        if not (worse or always):
+            return
+        change = f'{(after - before) / before * 100:+.0f}%' if before else 'from 0'
+        line = f'  {label}: {before} -> {after} ({change})'
+        if worse:
+            regressions.append(label)
+            line += '  REGRESSED'
+        lines.append(line)
+
+    factor = tolerance / 100
+    before, after = baseline.get('summary', {}), results['summary']
+    # Totals are only comparable when the same set of routes was run
+    if before and set(baseline.get('routes', {})) == set(results['routes']):
+        check('throughput', before['throughput'], after['throughput'], after['throughput'] < before['throughput'] * (1 - factor), True)
+        check('max_rss_mb', before['max_rss_mb'], after['max_rss_mb'], after['max_rss_mb'] > before['max_rss_mb'] * (1 + factor), True)
+    factor = latency_tolerance / 100
+    for name, route in sorted(results['routes'].items()):
+        if route['errors']:
+            regressions.append(f'{name} errors')
+            lines.append(f'  {name} errors: {route["errors"]} of {route["requests"]} requests failed  REGRESSED')
+        base = baseline.get('routes', {}).get(name)
+        if base is None:
+            lines.append(f'  {name}: not in baseline')
+            continue
+        if base['queries'] is not None and route['queries'] is not None:
+            check(f'{name} queries', base['queries'], route['queries'], route['queries'] > base['queries'])
+        # Tail percentiles of a few dozen requests swing too much between identical runs to gate on
+        check(
+            f'{name} p50', base['p50'], route['p50'],
+            route['p50'] > base['p50'] * (1 + factor) and route['p50'] - base['p50'] > NOISE_MS,
+        )
+    return lines, regressions
+
+
+def baseline_file(transport):
+    # Socket round trips add a fixed cost per request, so each transport keeps its own baseline
+    return BENCHMARK_DIR / f'baseline-{transport}.json'
+
+
+def results_file(transport):
+    return BENCHMARK_DIR / f'results-{transport}.json'
+
+
+def load_json(path):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_json(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.template.loader import get_template
+
+# Bundle sources are templates under templates/bundles/, rendered once at build
+# time so {% static %} and {% url %} resolve; output goes to static/bundles/
+SOURCE_DIR = 'bundles'
+OUTPUT_DIR = 'bundles'
+MANIFEST_NAME = 'manifest.json'
+BUNDLE_TYPES = ('.css', '.js')
+
+_manifest = {}
+_contents = {}
+
+
+def output_root():
+    return Path(settings.STATICFILES_DIRS[0]) / OUTPUT_DIR
+
+
+def manifest_file():
+    return output_root() / MANIFEST_NAME
+
+
+def source_files():
+    """{bundle name: source path} for every CSS/JS bundle source in the template dirs"""
+    sources = {}
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        for path in sorted((Path(directory) / SOURCE_DIR).glob('*')):
+            if path.suffix in BUNDLE_TYPES:
+                sources.setdefault(path.name, path)
+    return sources
+
+
+def render_bundle(name):
+    return get_template(f'{SOURCE_DIR}/{name}').render({})
+
+
+def write_bundle(name, content):
+    """Write content under its hashed name, dropping superseded files of the same bundle"""
+    root = output_root()
+    stem, suffix = name.rsplit('.', 1)
+    filename = f'{stem}.{hashlib.md5(content).hexdigest()[:12]}.{suffix}'
+    target = root / filename
+    if not target.exists():
+        target.write_bytes(content)
+    pattern = re.compile(rf'{re.escape(stem)}\.[0-9a-f]{{12}}\.{suffix}$')
+    for stale in root.glob(f'{stem}.*.{suffix}'):
+        if stale.name != filename and pattern.match(stale.name):
+            stale.unlink()
+    return f'{OUTPUT_DIR}/{filename}'
+
+
+def write_manifest(manifest):
+    manifest_file().write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    _manifest.clear()
+    _manifest.update(manifest)
+    _contents.clear()
+
+
+def build_bundles():
+    """
+    Render every bundle source into a content-hashed file and write the manifest.
+
+    Unchanged bundles keep their file name, so browsers keep their cached copy
+    across deploys; superseded files of a bundle are removed.
+    """
+    output_root().mkdir(parents=True, exist_ok=True)
+    manifest = {name: write_bundle(name, render_bundle(name).encode()) for name in source_files()}
+    write_manifest(manifest)
+    return manifest
+
+
+def _is_stale():
+    path = manifest_file()
+    if not path.exists():
+        return True
+    built = path.stat().st_mtime
+    return any(source.stat().st_mtime > built for source in source_files().values())
+
+
+def load_manifest():
+    if settings.DEBUG and _is_stale():
+        build_bundles()
+    if not _manifest and manifest_file().exists():
+        _manifest.update(json.loads(manifest_file().read_text()))
+    return _manifest
+
+
+def manifest_version():
+    """Short hash of the current build, for keys of cached HTML that links to bundles"""
+    return hashlib.md5(json.dumps(load_manifest(), sort_keys=True).encode()).hexdigest()[:12]
+
+
+def bundle_path(name):
+    """Static path of a built bundle, e.g. 'bundles/home.3f2c9a1b7e0d.css'"""
+    try:
+        return load_manifest()[name]
+    except KeyError:
+        raise ImproperlyConfigured(f'Bundle {name!r} has not been built; run manage.py build_bundles')
+
+
+def bundle_content(name):
+    """Text of a built bundle, or None when it is not in the manifest"""
+    path = load_manifest().get(name)
+    if path is None:
+        return None
+    if path not in _contents:
+        _contents[path] = (Path(settings.STATICFILES_DIRS[0]) / path).read_text()
+    return _contents[path]
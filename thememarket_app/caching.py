@@ -0,0 +1,179 @@
+import math
+import random
+import time
+from collections import namedtuple
+from threading import Lock
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from .metrics import record_cache
+
+VERSION_KEY_PREFIX = 'thememarket:version:'
+MODIFIED_KEY_PREFIX = 'thememarket:modified:'
+
+# Seconds a rebuild may hold its lease, and how long others wait on a cold key
+LEASE_TIMEOUT = 30
+LEASE_WAIT = 5.0
+LEASE_POLL = 0.05
+# Higher values recompute earlier before expiry (XFetch's beta)
+EARLY_EXPIRY_BETA = 1.0
+
+_memo = {}
+_memo_lock = Lock()
+_memo_locks = {}
+_row_types = {}
+
+
+def cache_is_shared(alias='default'):
+    """Whether a cache backend is visible to other processes, unlike LocMemCache and DummyCache"""
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def version_key(namespace):
+    return f'{VERSION_KEY_PREFIX}{namespace}'
+
+
+def _initial_version():
+    # Starting from the clock rather than 1 means a cleared or restarted cache
+    # never hands out a version an in-process memo already holds
+    return time.time_ns() // 1000
+
+
+def get_version(namespace):
+    """Current version number of a cache namespace"""
+    return cache.get_or_set(version_key(namespace), _initial_version, timeout=None)
+
+
+def last_modified(namespace):
+    """Unix time of the namespace's last invalidation, or of when this cache first saw it"""
+    return cache.get_or_set(f'{MODIFIED_KEY_PREFIX}{namespace}', int(time.time()), timeout=None)
+
+
+def bump_version(namespace):
+    """Invalidate everything cached under a namespace"""
+    cache.set(f'{MODIFIED_KEY_PREFIX}{namespace}', int(time.time()), timeout=None)
+    key = version_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _initial_version()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def _memo_key_lock(memo_key):
+    with _memo_lock:
+        return _memo_locks.setdefault(memo_key, Lock())
+
+
+def versioned(namespace, key, builder):
+    """
+    Return builder() memoized in-process until the namespace version changes.
+
+    One thread rebuilds an outdated value while the others keep using it.
+    """
+    memo_key = (namespace, key)
+    version = get_version(namespace)
+    entry = _memo.get(memo_key)
+    if entry is not None and entry[0] == version:
+        record_cache('hit')
+        return entry[1]
+    lock = _memo_key_lock(memo_key)
+    if not lock.acquire(blocking=entry is None):
+        record_cache('stale')
+        return entry[1]
+    try:
+        entry = _memo.get(memo_key)
+        if entry is not None and entry[0] == version:
+            record_cache('hit')
+            return entry[1]
+        record_cache('miss')
+        value = builder()
+        _memo[memo_key] = (version, value)
+        return value
+    finally:
+        lock.release()
+
+
+def _expires_early(expires, delta):
+    """
+    XFetch: refresh before expiry with a probability that rises as it nears.
+
+    delta is how long the value took to build, so expensive values are
+    refreshed earlier and a hot key's expiry is spread over its readers.
+    """
+    return expires is not None and time.time() - delta * EARLY_EXPIRY_BETA * math.log(1 - random.random()) >= expires
+
+
+def _rebuild(cache_key, version, builder, timeout):
+    started = time.monotonic()
+    value = builder()
+    if value is not None:
+        expires = None if timeout is None else time.time() + timeout
+        # Kept past its freshness so there is something to serve while it is rebuilt
+        cache.set(cache_key, (version, value, expires, time.monotonic() - started), None if timeout is None else timeout * 2)
+    return value
+
+
+def cached(namespace, key, builder, timeout=None):
+    """
+    Return builder() from the shared cache, rebuilt when the namespace version changes.
+
+    Entries remember the version they were built for. When one is outdated
+    or close to expiry, a single worker takes a lease and rebuilds it while
+    the others keep serving the old value; only a cold key makes them wait.
+    A builder returning None is not cached.
+    """
+    cache_key = f'thememarket:{namespace}:{key}'
+    version = get_version(namespace)
+    entry = cache.get(cache_key)
+    if entry is not None and entry[0] == version and not _expires_early(entry[2], entry[3]):
+        record_cache('hit')
+        return entry[1]
+
+    lease = f'{cache_key}:lease'
+    if cache.add(lease, 1, LEASE_TIMEOUT):
+        record_cache('miss')
+        try:
+            return _rebuild(cache_key, version, builder, timeout)
+        finally:
+            cache.delete(lease)
+    if entry is not None:
+        record_cache('stale')
+        return entry[1]
+
+    deadline = time.monotonic() + LEASE_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LEASE_POLL)
+        # Read before the entry: the holder stores its value before releasing the lease
+        released = cache.get(lease) is None
+        entry = cache.get(cache_key)
+        if entry is not None and entry[0] >= version:
+            record_cache('hit')
+            return entry[1]
+        if released:
+            # Released without storing anything (the builder returned None or
+            # raised), so there is nothing left to wait for
+            break
+    record_cache('miss')
+    # Nothing was stored, or the lease holder is too slow or died; build it here rather than fail the request
+    return _rebuild(cache_key, version, builder, timeout)
+
+
+def row_type(model, fields=None):
+    """Immutable namedtuple type for plain rows of a model"""
+    if fields is None:
+        fields = [field.attname for field in model._meta.concrete_fields]
+    fields = tuple(fields)
+    signature = (model, fields)
+    if signature not in _row_types:
+        _row_types[signature] = namedtuple(f'{model.__name__}Row', fields)
+    return _row_types[signature]
+
+
+def freeze_rows(queryset, fields=None):
+    """Evaluate a queryset into a tuple of immutable rows"""
+    row = row_type(queryset.model, fields)
+    return tuple(row(**values) for values in queryset.values(*row._fields))
@@ -0,0 +1,27 @@
+from django.db import transaction
+
+from .caching import bump_version
+from .counters import recount_categories
+from .facets import CATALOG_NAMESPACE
+from .models import Category, Theme
+from .pagecache import invalidate_pages
+from .search import rebuild_index
+from .suggest import SUGGEST_NAMESPACE
+
+
+def catalog_loaded(reindex=True):
+    """
+    Bring everything derived from themes up to date after a bulk write.
+
+    bulk_create/bulk_update and queryset updates skip the model signals that
+    keep counters, the search index and the caches current one row at a
+    time, so bulk loaders call this once at the end instead.
+    """
+    with transaction.atomic():
+        recount_categories(Category, Theme)
+        indexed = rebuild_index() if reindex else 0
+    bump_version(CATALOG_NAMESPACE)
+    bump_version(SUGGEST_NAMESPACE)
+    invalidate_pages(Theme)
+    invalidate_pages(Category)
+    return indexed
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Error, Tags, register
+
+from .caching import cache_is_shared
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """Several workers need one cache, or page purges and version bumps only reach the worker that made them"""
+    workers = getattr(settings, 'WEB_WORKERS', 1)
+    if workers <= 1 or cache_is_shared():
+        return []
+    return [
+        Error(
+            f'The default cache is a {type(caches["default"]).__name__}, private to each process, '
+            f'but {workers} web workers are configured.',
+            hint='Set REDIS_URL (or point CACHES at Memcached or DatabaseCache), or run a single worker.',
+            id='thememarket.E001',
+        )
+    ]
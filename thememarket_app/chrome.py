@@ -0,0 +1,35 @@
+from collections import namedtuple
+from types import MappingProxyType
+
+from .caching import freeze_rows, versioned
+from .models import SiteSettings, NavigationMenu, FooterSection, FooterLink, SocialLink
+
+CHROME_NAMESPACE = 'chrome'
+
+# Models whose rows end up in the header/footer of every page
+CHROME_MODELS = (SiteSettings, NavigationMenu, FooterSection, FooterLink, SocialLink)
+
+FooterSectionRow = namedtuple('FooterSectionRow', ['id', 'title', 'order', 'links'])
+
+
+def build_chrome():
+    """Resolve the site chrome into plain immutable data"""
+    site_settings = freeze_rows(SiteSettings.objects.order_by('pk')[:1])
+    links_by_section = {}
+    for link in freeze_rows(FooterLink.objects.filter(is_active=True)):
+        links_by_section.setdefault(link.section_id, []).append(link)
+
+    return MappingProxyType({
+        'site_settings': site_settings[0] if site_settings else None,
+        'navigation_menus': freeze_rows(NavigationMenu.objects.filter(is_active=True)),
+        'footer_sections': tuple(
+            FooterSectionRow(section.id, section.title, section.order, tuple(links_by_section.get(section.id, ())))
+            for section in freeze_rows(FooterSection.objects.all())
+        ),
+        'social_links': freeze_rows(SocialLink.objects.filter(is_active=True)),
+    })
+
+
+def get_chrome():
+    """Site chrome, served from the in-process cache while the version holds"""
+    return versioned(CHROME_NAMESPACE, 'chrome', build_chrome)
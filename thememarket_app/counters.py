@@ -0,0 +1,62 @@
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from .models import Theme
+
+THEME_TYPES = tuple(value for value, _ in Theme.THEME_TYPES)
+COUNTER_FIELDS = ('theme_count',) + tuple(f'{theme_type}_count' for theme_type in THEME_TYPES)
+
+
+def counts_by_category(theme_model):
+    """{category_id: {counter field: value}} from one GROUP BY over themes"""
+    counts = {}
+    rows = theme_model.objects.order_by().values_list('category_id', 'theme_type').annotate(total=Count('id'))
+    for category_id, theme_type, total in rows:
+        entry = counts.setdefault(category_id, dict.fromkeys(COUNTER_FIELDS, 0))
+        entry['theme_count'] += total
+        if theme_type in THEME_TYPES:
+            entry[f'{theme_type}_count'] += total
+    return counts
+
+
+def recount_categories(category_model, theme_model):
+    """
+    Recompute every category's counters from the themes table.
+
+    Returns the categories whose stored counters had drifted. Takes the
+    models as arguments so migrations can pass their historical versions.
+    """
+    counts = counts_by_category(theme_model)
+    drifted = []
+    for category in category_model.objects.only('id', *COUNTER_FIELDS):
+        expected = counts.get(category.id, dict.fromkeys(COUNTER_FIELDS, 0))
+        if any(getattr(category, field) != value for field, value in expected.items()):
+            for field, value in expected.items():
+                setattr(category, field, value)
+            drifted.append(category)
+    category_model.objects.bulk_update(drifted, COUNTER_FIELDS, batch_size=500)
+    return drifted
+
+
+def _shift(category_model, category_id, theme_type, delta):
+    updates = {'theme_count': Greatest(F('theme_count') + delta, 0)}
+    if theme_type in THEME_TYPES:
+        field = f'{theme_type}_count'
+        updates[field] = Greatest(F(field) + delta, 0)
+    category_model.objects.filter(pk=category_id).update(**updates)
+
+
+def move_theme(category_model, old, new):
+    """
+    Move one theme between (category_id, theme_type) buckets with F() updates.
+
+    old is None for a new theme and new is None for a deleted one.
+    """
+    if old == new:
+        return
+    with transaction.atomic():
+        if old is not None:
+            _shift(category_model, old[0], old[1], -1)
+        if new is not None:
+            _shift(category_model, new[0], new[1], 1)
@@ -0,0 +1,200 @@
+import json
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.urls import resolve, reverse
+
+from .bundles import SOURCE_DIR, bundle_content, load_manifest, write_bundle, write_manifest
+
+# Pages whose above-the-fold CSS is inlined: {page bundle: url name}
+CRITICAL_PAGES = {
+    'home': 'home',
+    'themes': 'themes',
+    'template': 'template',
+    'about': 'about',
+    'contact': 'contact',
+    'cart': 'cart',
+    'checkout': 'checkout',
+}
+# The header plus the next two top-level blocks of <body> are treated as the first screen
+FOLD_BLOCKS = 3
+BASELINE_NAME = 'first_paint.json'
+# Pages are rendered from this demo catalog in a throwaway database, so the
+# critical CSS and the baseline don't depend on the local database's content
+RENDER_FIXTURE = 'critical_pages'
+
+COMMENT = re.compile(r'/\*.*?\*/', re.S)
+# Pseudo-elements and user-action pseudo-classes can't be matched against static HTML
+UNMATCHABLE_PSEUDO = re.compile(
+    r'::?(?:before|after|first-line|first-letter|placeholder|selection|marker|-webkit-[\w-]+|-moz-[\w-]+)'
+    r'|:(?:hover|focus|focus-within|focus-visible|active|visited|target)'
+)
+KEYFRAMES = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+
+
+def parse_rules(css):
+    """Split a stylesheet into top-level (prelude, body) pairs; body is None for @import-style statements"""
+    css = COMMENT.sub('', css)
+    rules, position, length = [], 0, len(css)
+    while position < length:
+        brace = css.find('{', position)
+        semicolon = css.find(';', position)
+        if brace == -1 and semicolon == -1:
+            break
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            statement = css[position:semicolon].strip()
+            if statement:
+                rules.append((statement, None))
+            position = semicolon + 1
+            continue
+        depth, end = 1, brace + 1
+        while end < length and depth:
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        rules.append((css[position:brace].strip(), css[brace + 1:end - 1].strip()))
+        position = end
+    return rules
+
+
+def split_selectors(prelude):
+    selectors, depth, current = [], 0, ''
+    for char in prelude:
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if char == ',' and depth == 0:
+            selectors.append(current.strip())
+            current = ''
+        else:
+            current += char
+    selectors.append(current.strip())
+    return [selector for selector in selectors if selector]
+
+
+def fold_elements(soup):
+    """ids of the elements painted on the first screen, plus <html> and <body>"""
+    blocks = [child for child in soup.body.find_all(recursive=False) if child.name not in ('script', 'style', 'noscript')]
+    elements = {id(soup.html), id(soup.body)}
+    for block in blocks[:FOLD_BLOCKS]:
+        elements.add(id(block))
+        elements.update(id(element) for element in block.find_all(True))
+    return elements
+
+
+def _matches_fold(selector, soup, fold):
+    selector = UNMATCHABLE_PSEUDO.sub('', selector).strip() or '*'
+    if selector.endswith(('>', '+', '~')):
+        selector += ' *'
+    try:
+        return any(id(element) in fold for element in soup.select(selector))
+    except Exception:
+        # Keep what soupsieve can't evaluate rather than risk an unstyled first paint
+        return True
+
+
+def _critical_rules(rules, soup, fold, keyframes):
+    kept = []
+    for prelude, body in rules:
+        if body is None:
+            if prelude.startswith(('@import', '@charset')):
+                kept.append(f'{prelude};')
+        elif prelude.startswith(('@media', '@supports')):
+            inner = _critical_rules(parse_rules(body), soup, fold, keyframes)
+            if inner:
+                kept.append(f'{prelude}{{{"".join(inner)}}}')
+        elif KEYFRAMES.match(prelude):
+            keyframes[KEYFRAMES.match(prelude).group(1)] = f'{prelude}{{{body}}}'
+        elif prelude.startswith('@font-face'):
+            kept.append(f'{prelude}{{{body}}}')
+        elif not prelude.startswith('@'):
+            selectors = [selector for selector in split_selectors(prelude) if _matches_fold(selector, soup, fold)]
+            if selectors:
+                kept.append(f'{",".join(selectors)}{{{body}}}')
+    return kept
+
+
+def extract_critical_css(html, css):
+    """The subset of css that applies to the above-the-fold part of a rendered page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    keyframes = {}
+    kept = _critical_rules(parse_rules(css), soup, fold_elements(soup), keyframes)
+    text = ''.join(kept)
+    used = [rule for name, rule in keyframes.items() if re.search(rf'\b{re.escape(name)}\b', text)]
+    return text + ''.join(used)
+
+
+def render_page(url_name):
+    """Render a storefront view the way an anonymous visitor sees it"""
+    request = RequestFactory().get(reverse(url_name))
+    request.user = AnonymousUser()
+    request.session = {}
+    match = resolve(request.path)
+    response = match.func(request, *match.args, **match.kwargs)
+    return response.content.decode()
+
+
+@contextmanager
+def fixture_database():
+    """Render against a fresh test database holding only RENDER_FIXTURE, with caching off"""
+    with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            call_command('loaddata', RENDER_FIXTURE, verbosity=0)
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            # SQLite keeps an in-memory test database's connection open; drop it now NAME is restored
+            connection.close()
+
+
+def page_bundles(page):
+    return ('base.css', f'{page}.css')
+
+
+def build_critical_css():
+    """
+    Build each CRITICAL_PAGES page's critical CSS and add it to the bundle manifest.
+
+    Pages are rendered from the RENDER_FIXTURE catalog, not the configured database.
+
+    Returns {page: (before, after)} first-paint bytes: the HTML plus its
+    render-blocking stylesheets before, and the HTML carrying the inlined
+    critical CSS after.
+    """
+    manifest = dict(load_manifest())
+    for page in CRITICAL_PAGES:
+        manifest.pop(f'{page}.critical.css', None)
+    write_manifest(manifest)
+
+    first_paint = {}
+    with fixture_database():
+        for page, url_name in CRITICAL_PAGES.items():
+            html = render_page(url_name)
+            css = '\n'.join(bundle_content(name) for name in page_bundles(page))
+            critical = extract_critical_css(html, css)
+            manifest[f'{page}.critical.css'] = write_bundle(f'{page}.critical.css', critical.encode())
+            first_paint[page] = [len(html.encode()) + len(css.encode())]
+        write_manifest(manifest)
+
+        for page, url_name in CRITICAL_PAGES.items():
+            first_paint[page].append(len(render_page(url_name).encode()))
+    return {page: tuple(sizes) for page, sizes in first_paint.items()}
+
+
+def baseline_file():
+    return Path(settings.TEMPLATES[0]['DIRS'][0]) / SOURCE_DIR / BASELINE_NAME
+
+
+def load_baseline():
+    path = baseline_file()
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baseline(first_paint):
+    baseline_file().write_text(json.dumps(first_paint, indent=2, sort_keys=True) + '\n')
@@ -0,0 +1,176 @@
+import hashlib
+import json
+from functools import reduce
+from io import BytesIO
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from .models import Theme, ThemeImage, HeroImage, TeamMember, CustomerTestimonial
+
+DERIVATIVE_ROOT = 'derivatives'
+DERIVATIVE_WIDTHS = getattr(settings, 'IMAGE_DERIVATIVE_WIDTHS', (320, 640, 960, 1280))
+WEBP_QUALITY = 80
+FALLBACK_QUALITY = 82
+MANIFEST_TIMEOUT = 60 * 60 * 24
+
+# Image fields that get responsive renditions
+IMAGE_FIELDS = {
+    Theme: ('image',),
+    ThemeImage: ('image',),
+    HeroImage: ('image',),
+    TeamMember: ('photo',),
+    CustomerTestimonial: ('avatar',),
+}
+
+
+def content_hash(name):
+    digest = hashlib.sha256()
+    with default_storage.open(name, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:20]
+
+
+def manifest_path(name):
+    return f'{DERIVATIVE_ROOT}/manifests/{hashlib.sha1(name.encode()).hexdigest()}.json'
+
+
+def rendition_path(digest, width, extension):
+    return f'{DERIVATIVE_ROOT}/{digest[:2]}/{digest}-{width}.{extension}'
+
+
+def _manifest_cache_key(name):
+    return f'thememarket:derivatives:{hashlib.sha1(name.encode()).hexdigest()}'
+
+
+def _encode(image, image_format, **options):
+    buffer = BytesIO()
+    image.save(buffer, image_format, **options)
+    return ContentFile(buffer.getvalue())
+
+
+def read_manifest(name):
+    """The rendition manifest stored for an upload, or None"""
+    path = manifest_path(name)
+    if not default_storage.exists(path):
+        return None
+    with default_storage.open(path) as handle:
+        return json.loads(handle.read())
+
+
+def forget_manifest(name):
+    """Drop this process's cached manifest so the next render reads the stored one"""
+    cache.delete(_manifest_cache_key(name))
+
+
+def generate_derivatives(name):
+    """
+    Write WebP and JPEG/PNG renditions of a stored upload at each configured width.
+
+    Renditions are named by content hash, so re-saving a model with the same
+    file, or uploading an identical file elsewhere, reuses what is on disk.
+    Returns the manifest describing the renditions.
+    """
+    digest = content_hash(name)
+    with default_storage.open(name, 'rb') as handle:
+        source = ImageOps.exif_transpose(Image.open(handle))
+        source.load()
+
+    has_alpha = source.mode in ('RGBA', 'LA') or (source.mode == 'P' and 'transparency' in source.info)
+    fallback = 'png' if has_alpha else 'jpg'
+    source = source.convert('RGBA' if has_alpha else 'RGB')
+
+    widths = sorted({width for width in DERIVATIVE_WIDTHS if width < source.width} | {min(source.width, max(DERIVATIVE_WIDTHS))})
+    for width in widths:
+        webp_path = rendition_path(digest, width, 'webp')
+        fallback_path = rendition_path(digest, width, fallback)
+        if default_storage.exists(webp_path) and default_storage.exists(fallback_path):
+            continue
+        height = max(1, round(source.height * width / source.width))
+        resized = source.resize((width, height), Image.LANCZOS) if width != source.width else source
+        if not default_storage.exists(webp_path):
+            default_storage.save(webp_path, _encode(resized, 'WEBP', quality=WEBP_QUALITY, method=6))
+        if not default_storage.exists(fallback_path):
+            if fallback == 'png':
+                default_storage.save(fallback_path, _encode(resized, 'PNG', optimize=True))
+            else:
+                default_storage.save(
+                    fallback_path, _encode(resized, 'JPEG', quality=FALLBACK_QUALITY, optimize=True, progressive=True)
+                )
+
+    manifest = {
+        'hash': digest,
+        'width': source.width,
+        'height': source.height,
+        'fallback': fallback,
+        'widths': widths,
+    }
+    path = manifest_path(name)
+    if default_storage.exists(path):
+        default_storage.delete(path)
+    default_storage.save(path, ContentFile(json.dumps(manifest).encode()))
+    cache.set(_manifest_cache_key(name), manifest, MANIFEST_TIMEOUT)
+    return manifest
+
+
+def extract_metadata(name):
+    """Basic facts about a stored image for the job log"""
+    with default_storage.open(name, 'rb') as handle:
+        image = Image.open(handle)
+        return {
+            'format': image.format,
+            'mode': image.mode,
+            'width': image.width,
+            'height': image.height,
+            'bytes': default_storage.size(name),
+            'has_exif': bool(image.getexif()),
+        }
+
+
+def process_image(name):
+    """
+    Renditions plus metadata for one upload; the unit of work of an image job.
+
+    `changed` is False when the upload already had the same renditions, so
+    pages showing it render exactly as before.
+    """
+    previous = read_manifest(name)
+    renditions = generate_derivatives(name)
+    return {'metadata': extract_metadata(name), 'renditions': renditions, 'changed': renditions != previous}
+
+
+def get_manifest(field_file):
+    """Rendition manifest for an image, or None when it has not been processed yet"""
+    if not field_file:
+        return None
+    key = _manifest_cache_key(field_file.name)
+    manifest = cache.get(key)
+    if manifest is None:
+        manifest = read_manifest(field_file.name)
+        if manifest is None:
+            return None
+        cache.set(key, manifest, MANIFEST_TIMEOUT)
+    return manifest
+
+
+def image_owners(name):
+    """Models with a row whose image field holds the upload called name"""
+    return [
+        model for model, field_names in IMAGE_FIELDS.items()
+        if model.objects.filter(reduce(or_, (Q(**{field_name: name}) for field_name in field_names))).exists()
+    ]
+
+
+def image_names(instance):
+    """Storage names of the non-empty image fields of a model instance"""
+    return [
+        getattr(instance, field_name).name
+        for field_name in IMAGE_FIELDS.get(type(instance), ())
+        if getattr(instance, field_name)
+    ]
@@ -0,0 +1,144 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.db.models import Case, CharField, Count, IntegerField, Q, Value, When
+
+from .caching import cached
+from .models import Theme
+
+CATALOG_NAMESPACE = 'catalog'
+FACET_TIMEOUT = 60 * 60
+
+PRICE_BANDS = (
+    ('free', 'Free', Q(price=0)),
+    ('under50', 'Under ₹4,500', Q(price__gt=0, price__lt=50)),
+    ('over50', '₹4,500 and above', Q(price__gte=50)),
+)
+
+# Ratings are bucketed by whole star; the rating filter means "at least"
+RATING_BANDS = (5, 4, 3, 0)
+RATING_FILTERS = (5, 4, 3)
+
+FACET_PARAMS = ('category', 'type', 'price', 'rating')
+
+
+def clean_filters(params):
+    """The facet filters present in a QueryDict, with unknown values dropped"""
+    filters = {}
+    if params.get('category'):
+        filters['category'] = params['category']
+    if params.get('type') in dict(Theme.THEME_TYPES):
+        filters['type'] = params['type']
+    if params.get('price') in {band for band, _, _ in PRICE_BANDS}:
+        filters['price'] = params['price']
+    if params.get('rating', '').isdigit() and int(params['rating']) in RATING_FILTERS:
+        filters['rating'] = int(params['rating'])
+    return filters
+
+
+def filter_themes(queryset, filters):
+    """Apply clean_filters() output to a Theme queryset"""
+    if 'category' in filters:
+        queryset = queryset.filter(category__slug=filters['category'])
+    if 'type' in filters:
+        queryset = queryset.filter(theme_type=filters['type'])
+    if 'price' in filters:
+        queryset = queryset.filter(dict((band, q) for band, _, q in PRICE_BANDS)[filters['price']])
+    if 'rating' in filters:
+        queryset = queryset.filter(rating__gte=filters['rating'])
+    return queryset
+
+
+def facet_groups():
+    """
+    Theme counts per (category, type, price band, rating band) in one GROUP BY.
+
+    The result has at most categories x types x bands rows regardless of the
+    catalog size, and every filter combination's facets are derived from it.
+    """
+    price_band = Case(
+        *[When(q, then=Value(band)) for band, _, q in PRICE_BANDS],
+        default=Value('over50'),
+        output_field=CharField(),
+    )
+    rating_band = Case(
+        *[When(rating__gte=band, then=Value(band)) for band in RATING_BANDS[:-1]],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    rows = (
+        Theme.objects.order_by()
+        .annotate(price_band=price_band, rating_band=rating_band)
+        .values_list('category__slug', 'theme_type', 'price_band', 'rating_band')
+        .annotate(total=Count('id'))
+    )
+    return tuple(rows)
+
+
+def _matches(group, filters, skip):
+    category, theme_type, price, rating = group[:4]
+    return (
+        (skip == 'category' or filters.get('category', category) == category)
+        and (skip == 'type' or filters.get('type', theme_type) == theme_type)
+        and (skip == 'price' or filters.get('price', price) == price)
+        and (skip == 'rating' or rating >= filters.get('rating', 0))
+    )
+
+
+def compute_facets(groups, filters):
+    """
+    Counts for each facet value under the current filters.
+
+    A facet ignores its own filter so the sidebar shows how many themes
+    choosing another value of it would return.
+    """
+    facets = {'category': {}, 'type': {}, 'price': {}, 'rating': {}}
+    total = 0
+    for group in groups:
+        category, theme_type, price, rating, count = group
+        if _matches(group, filters, skip=None):
+            total += count
+        if _matches(group, filters, skip='category'):
+            facets['category'][category] = facets['category'].get(category, 0) + count
+        if _matches(group, filters, skip='type'):
+            facets['type'][theme_type] = facets['type'].get(theme_type, 0) + count
+        if _matches(group, filters, skip='price'):
+            facets['price'][price] = facets['price'].get(price, 0) + count
+        if _matches(group, filters, skip='rating'):
+            for threshold in RATING_FILTERS:
+                if rating >= threshold:
+                    facets['rating'][threshold] = facets['rating'].get(threshold, 0) + count
+    facets['total'] = total
+    return facets
+
+
+def get_facets(filters):
+    """Facet counts for a filter set, cached until any Theme or Category changes"""
+    key = urlencode(sorted(filters.items()))
+    return cached(
+        CATALOG_NAMESPACE,
+        f'facets:{hashlib.md5(key.encode()).hexdigest()}',
+        lambda: compute_facets(cached(CATALOG_NAMESPACE, 'facet_groups', facet_groups, FACET_TIMEOUT), filters),
+        FACET_TIMEOUT,
+    )
+
+
+def facet_options(facets, categories, filters):
+    """Sidebar-ready [{'value', 'label', 'count', 'selected'}] lists for each facet"""
+    def option(name, value, label):
+        return {
+            'value': value,
+            'label': label,
+            'count': facets[name].get(value, 0),
+            'selected': filters.get(name) == value,
+        }
+
+    return {
+        'category': [option('category', category.slug, category.name) for category in categories],
+        'type': [option('type', value, label) for value, label in Theme.THEME_TYPES],
+        'price': [option('price', band, label) for band, label, _ in PRICE_BANDS],
+        'rating': [
+            option('rating', threshold, '5 Stars' if threshold == 5 else f'{threshold}+ Stars')
+            for threshold in RATING_FILTERS
+        ],
+    }
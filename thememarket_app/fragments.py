@@ -0,0 +1,52 @@
+import hashlib
+
+from django.template.loader import render_to_string
+
+# Session key a server-side cart will keep its items under
+CART_SESSION_KEY = 'cart'
+MARKER_PREFIX = b'<!--fragment:'
+
+
+def cart_count(request):
+    session = getattr(request, 'session', None)
+    return len(session.get(CART_SESSION_KEY, ())) if session is not None else 0
+
+
+def account_context(request):
+    return {'user': request.user}
+
+
+def cart_count_context(request):
+    return {'cart_count': cart_count(request)}
+
+
+# name: builds the context of templates/fragments/<name>.html for one request
+FRAGMENTS = {
+    'account': account_context,
+    'cart_count': cart_count_context,
+}
+
+
+def marker(name):
+    """Placeholder left in the shared page shell where a per-user fragment goes"""
+    return f'<!--fragment:{name}-->'
+
+
+def render_fragment(name, request):
+    return render_to_string(f'fragments/{name}.html', FRAGMENTS[name](request))
+
+
+def fill_fragments(content, request):
+    """Replace every fragment marker in a rendered page with the fragment for this request"""
+    for name in FRAGMENTS:
+        placeholder = marker(name).encode()
+        if placeholder in content:
+            content = content.replace(placeholder, render_fragment(name, request).encode())
+    return content
+
+
+def fragment_state(request):
+    """Short digest of everything the fragments depend on, so validators can vary by user"""
+    user = request.user
+    state = f'{user.pk}:{user.get_username()}:{cart_count(request)}' if user.is_authenticated else f'-:{cart_count(request)}'
+    return hashlib.md5(state.encode()).hexdigest()[:8]
@@ -0,0 +1,191 @@
+import csv
+import json
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import BooleanField
+from django.utils.text import slugify
+
+from .catalog import catalog_loaded
+from .models import Category, Theme
+from .search import index_themes
+
+BATCH_SIZE = 1000
+
+# Columns copied onto Theme; category and slug are handled separately
+IMPORT_FIELDS = (
+    'title', 'description', 'theme_type', 'price', 'original_price', 'preview_url', 'download_url',
+    'is_featured', 'is_popular', 'is_new', 'rating', 'downloads',
+)
+REQUIRED_FIELDS = ('title', 'category', 'price')
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y'}
+FALSE_VALUES = {'0', 'false', 'f', 'no', 'n', ''}
+
+
+class RowError(Exception):
+    def __init__(self, line, slug, messages):
+        super().__init__('; '.join(messages))
+        self.line = line
+        self.slug = slug
+        self.messages = messages
+
+
+def read_rows(path, file_format=None):
+    """Yield (line number, row dict) from a CSV or JSONL file without reading it all in"""
+    path = Path(path)
+    file_format = file_format or path.suffix.lstrip('.').lower()
+    with path.open(newline='', encoding='utf-8-sig') as handle:
+        if file_format == 'csv':
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, row
+        elif file_format in ('jsonl', 'ndjson'):
+            for number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    yield number, exc
+                    continue
+                yield number, row if isinstance(row, dict) else ValueError('expected a JSON object')
+        else:
+            raise ValueError(f'Unsupported import format "{file_format}", expected csv or jsonl')
+
+
+def _boolean(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValidationError(f'"{value}" is not a true/false value')
+
+
+def clean_row(line, row, categories):
+    """
+    A validated, unsaved Theme for one input row and the columns it supplies.
+
+    Values go through the model fields' own clean(), so decimals, URLs,
+    choices and lengths are checked the way the admin checks them. Raises
+    RowError listing every problem with the row.
+    """
+    if isinstance(row, Exception):
+        raise RowError(line, '', [str(row)])
+    row = {key.strip(): value.strip() if isinstance(value, str) else value for key, value in row.items() if key}
+    slug = row.get('slug') or slugify(row.get('title') or '')
+    errors = []
+    values = {}
+    for name in REQUIRED_FIELDS:
+        if row.get(name) in (None, ''):
+            errors.append(f'{name}: required')
+    for name in IMPORT_FIELDS:
+        if name not in row or (name in REQUIRED_FIELDS and row[name] in (None, '')):
+            continue
+        field = Theme._meta.get_field(name)
+        value = row[name]
+        try:
+            if isinstance(field, BooleanField):
+                values[name] = _boolean(value)
+            elif value in (None, '') and field.null:
+                values[name] = None
+            elif value in (None, '') and field.has_default():
+                values[name] = field.get_default()
+            else:
+                values[name] = field.clean(value, None)
+        except ValidationError as exc:
+            errors.extend(f'{name}: {message}' for message in exc.messages)
+    try:
+        values['slug'] = Theme._meta.get_field('slug').clean(slug, None)
+    except ValidationError as exc:
+        errors.extend(f'slug: {message}' for message in exc.messages)
+    category = row.get('category')
+    if category and category not in categories:
+        errors.append(f'category: no category with slug "{category}"')
+    if errors:
+        # URLField's own validator and the model's explicit URLValidator report the same problem
+        raise RowError(line, slug, list(dict.fromkeys(errors)))
+    values['category_id'] = categories[category]
+    return Theme(**values), frozenset(values)
+
+
+class ThemeImporter:
+    """
+    Upsert themes by slug in batches, collecting per-row errors instead of stopping.
+
+    Only the current batch and the slugs already seen are held in memory,
+    whatever the size of the file. An existing theme only has the columns
+    the file supplies overwritten.
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE, dry_run=False, on_error=None):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.on_error = on_error
+        self.categories = dict(Category.objects.values_list('slug', 'id'))
+        self.seen = set()
+        self.batch = []
+        self.valid = self.created = self.updated = self.failed = 0
+
+    def error(self, error):
+        self.failed += 1
+        if self.on_error:
+            self.on_error(error)
+
+    def add(self, line, row):
+        try:
+            theme, columns = clean_row(line, row, self.categories)
+        except RowError as error:
+            self.error(error)
+            return
+        if theme.slug in self.seen:
+            self.error(RowError(line, theme.slug, ['slug: appears more than once in the file']))
+            return
+        self.seen.add(theme.slug)
+        self.valid += 1
+        self.batch.append((line, theme, columns))
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        batch, self.batch = self.batch, []
+        if not batch or self.dry_run:
+            return
+        groups = {}
+        for line, theme, columns in batch:
+            groups.setdefault(columns, []).append((line, theme))
+        for columns, rows in groups.items():
+            try:
+                with transaction.atomic():
+                    self.write([theme for _, theme in rows], columns)
+            except DatabaseError:
+                # Find the offending rows one at a time and keep the rest
+                for line, theme in rows:
+                    try:
+                        with transaction.atomic():
+                            self.write([theme], columns)
+                    except DatabaseError as exc:
+                        self.error(RowError(line, theme.slug, [str(exc)]))
+
+    def write(self, themes, columns):
+        slugs = [theme.slug for theme in themes]
+        existing = Theme.objects.filter(slug__in=slugs).count()
+        Theme.objects.bulk_create(
+            themes, update_conflicts=True, unique_fields=['slug'],
+            update_fields=sorted(columns - {'slug'} | {'updated_at'}),
+        )
+        # bulk_create skips the signal that keeps the search index current
+        index_themes(Theme.objects.filter(slug__in=slugs))
+        self.updated += existing
+        self.created += len(themes) - existing
+
+    def run(self, rows):
+        """Import every (line, row) pair, then refresh counters and caches once"""
+        for line, row in rows:
+            self.add(line, row)
+        self.flush()
+        if self.created or self.updated:
+            catalog_loaded(reindex=False)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from .derivatives import forget_manifest, image_names, image_owners, manifest_path, process_image
+from .models import BackgroundJob
+from .pagecache import invalidate_pages
+
+BACKOFF_SECONDS = 30
+# A running job older than this is taken to belong to a dead worker; keep it
+# well above the longest a job can take, or live jobs will be run twice
+RUNNING_LEASE_SECONDS = getattr(settings, 'JOB_LEASE_SECONDS', 15 * 60)
+
+# Job handlers run in worker processes and must only touch storage, never the database
+HANDLERS = {
+    'image': process_image,
+}
+
+
+def enqueue(kind, **payload):
+    """Queue a job unless an identical one is already waiting"""
+    with transaction.atomic():
+        job = BackgroundJob.objects.filter(kind=kind, payload=payload, status=BackgroundJob.PENDING).first()
+        if job is None:
+            job = BackgroundJob.objects.create(kind=kind, payload=payload)
+    return job
+
+
+def enqueue_images(instance):
+    """Queue image processing for each image on a model instance that has no renditions yet"""
+    return [
+        enqueue('image', name=name)
+        for name in image_names(instance)
+        if not default_storage.exists(manifest_path(name))
+    ]
+
+
+def execute(kind, payload):
+    """Run one job's handler; called inside a worker process"""
+    return HANDLERS[kind](**payload)
+
+
+def claim(limit):
+    """
+    Mark up to limit due jobs as running and return them.
+
+    Each job is claimed with a conditional UPDATE, so several run_workers
+    processes can poll the same table without picking up the same job.
+    """
+    now = timezone.now()
+    candidates = (
+        BackgroundJob.objects.filter(status=BackgroundJob.PENDING, run_after__lte=now)
+        .order_by('run_after', 'id').values_list('id', flat=True)[:limit]
+    )
+    claimed = []
+    for job_id in list(candidates):
+        updated = BackgroundJob.objects.filter(pk=job_id, status=BackgroundJob.PENDING).update(
+            status=BackgroundJob.RUNNING, started_at=now, updated_at=now,
+        )
+        if updated:
+            claimed.append(job_id)
+    return list(BackgroundJob.objects.filter(pk__in=claimed).order_by('run_after', 'id'))
+
+
+def complete(job, result):
+    job.status = BackgroundJob.DONE
+    job.attempts += 1
+    job.result = result
+    job.last_error = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'attempts', 'result', 'last_error', 'finished_at', 'updated_at'])
+    if job.kind == 'image' and result.get('changed', True):
+        # Pages showing the image still point at the original upload instead of its renditions
+        forget_manifest(job.payload['name'])
+        for model in image_owners(job.payload['name']):
+            invalidate_pages(model)
+
+
+def fail(job, error):
+    """Record a failed attempt and schedule a retry with exponential backoff"""
+    job.attempts += 1
+    job.last_error = error
+    if job.attempts >= job.max_attempts:
+        job.status = BackgroundJob.FAILED
+        job.finished_at = timezone.now()
+    else:
+        job.status = BackgroundJob.PENDING
+        job.run_after = timezone.now() + timedelta(seconds=BACKOFF_SECONDS * 2 ** (job.attempts - 1))
+    job.save(update_fields=['status', 'attempts', 'last_error', 'run_after', 'finished_at', 'updated_at'])
+
+
+def retry(queryset):
+    """Put jobs back in the queue to run immediately with a fresh attempt budget"""
+    return queryset.exclude(status=BackgroundJob.RUNNING).update(
+        status=BackgroundJob.PENDING, attempts=0, run_after=timezone.now(), last_error='', finished_at=None,
+    )
+
+
+def requeue_running(lease=RUNNING_LEASE_SECONDS):
+    """
+    Return jobs left running by a worker that died back to the queue.
+
+    Only jobs started more than `lease` seconds ago are taken, so jobs that
+    another live run_workers process is still running are left alone.
+    """
+    now = timezone.now()
+    return BackgroundJob.objects.filter(
+        status=BackgroundJob.RUNNING, started_at__lt=now - timedelta(seconds=lease),
+    ).update(status=BackgroundJob.PENDING, run_after=now)
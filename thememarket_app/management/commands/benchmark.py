@@ -0,0 +1,103 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from thememarket_app.benchmark import (
+    BASELINE_CATALOG, InProcessTransport, SocketTransport, admin_cookie, admin_routes, baseline_file, compare, load_json,
+    results_file, run, save_json, storefront_routes,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test every storefront route and admin changelist through the WSGI application and '
+        'compare latency, throughput, query counts and memory with the committed baseline'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--transport', choices=('inprocess', 'socket'), default='inprocess',
+                            help='Call the WSGI app directly or over a local HTTP socket')
+        parser.add_argument('--clients', type=int, default=8, help='Concurrent client threads')
+        parser.add_argument('--rounds', type=int, default=30, help='Requests per route')
+        parser.add_argument('--no-warmup', action='store_true', help='Measure cold caches too')
+        parser.add_argument('--skip-admin', action='store_true', help='Leave out the admin changelists')
+        parser.add_argument('--route', action='append', default=[], help='Only run routes whose name contains this')
+        parser.add_argument('--output', help='Where to write the results JSON (default benchmarks/results-<transport>.json)')
+        parser.add_argument('--baseline', help='Baseline JSON to compare with (default benchmarks/baseline-<transport>.json)')
+        parser.add_argument('--tolerance', type=float, default=20.0,
+                            help='Allowed throughput and peak memory regression in percent')
+        parser.add_argument('--latency-tolerance', type=float, default=100.0,
+                            help='Allowed growth of a route\'s median latency in percent')
+        parser.add_argument(
+            '--update-baseline', action='store_true',
+            help='Record these results as the baseline; only on a database built by BASELINE_CATALOG',
+        )
+
+    def handle(self, *args, **options):
+        from thememarket_project.wsgi import application
+
+        routes = storefront_routes()
+        cookies = {}
+        if not options['skip_admin']:
+            cookie = admin_cookie()
+            if cookie is None:
+                self.stdout.write(self.style.WARNING('No active superuser, skipping the admin changelists'))
+            else:
+                changelists = admin_routes()
+                routes.update(changelists)
+                cookies = dict.fromkeys(changelists, cookie)
+        if options['route']:
+            routes = {name: url for name, url in routes.items() if any(part in name for part in options['route'])}
+        if not routes:
+            raise CommandError('No routes to benchmark')
+
+        transport_class = SocketTransport if options['transport'] == 'socket' else InProcessTransport
+        transport = transport_class(application)
+        output = options['output'] or results_file(transport.name)
+        baseline_path = options['baseline'] or baseline_file(transport.name)
+        self.stdout.write(
+            f'Benchmarking {len(routes)} routes x {options["rounds"]} requests '
+            f'with {options["clients"]} clients ({transport.name})'
+        )
+        try:
+            results = run(
+                transport, routes, cookies,
+                clients=max(1, options['clients']), rounds=max(1, options['rounds']), warmup=not options['no_warmup'],
+            )
+        finally:
+            transport.close()
+
+        for name, route in sorted(results['routes'].items()):
+            self.stdout.write(
+                f'  {name:<48} p50 {route["p50"]:>8.2f}  p95 {route["p95"]:>8.2f}  p99 {route["p99"]:>8.2f} ms'
+                f'  {route["queries"] if route["queries"] is not None else "-":>3} queries  {route["bytes"]:>8,} B'
+            )
+        summary = results['summary']
+        self.stdout.write(
+            f'{summary["requests"]} requests in {summary["seconds"]:.1f}s: {summary["throughput"]} req/s, '
+            f'{summary["errors"]} errors, RSS {summary["rss_mb"]} MB (peak {summary["max_rss_mb"]} MB)'
+        )
+        save_json(output, results)
+        self.stdout.write(f'Results written to {output}')
+
+        if options['update_baseline']:
+            results['meta']['catalog'] = list(BASELINE_CATALOG)
+            save_json(baseline_path, results)
+            self.stdout.write(self.style.SUCCESS(f'Baseline written to {baseline_path}'))
+            return
+        baseline = load_json(baseline_path)
+        if not baseline:
+            self.stdout.write(self.style.WARNING(f'No baseline at {baseline_path}; run with --update-baseline'))
+            return
+        if baseline['meta']['themes'] != results['meta']['themes']:
+            self.stdout.write(self.style.WARNING(
+                f'The baseline was recorded with {baseline["meta"]["themes"]} themes and this run had '
+                f'{results["meta"]["themes"]}; latencies are only comparable on the same catalog, built with:'
+            ))
+            for command in baseline['meta'].get('catalog', BASELINE_CATALOG):
+                self.stdout.write(f'    {command}')
+        lines, regressions = compare(results, baseline, options['tolerance'], options['latency_tolerance'])
+        self.stdout.write(f'Compared with {baseline_path} (recorded {baseline["meta"]["recorded"]}):')
+        for line in lines:
+            self.stdout.write(self.style.ERROR(line) if line.endswith('REGRESSED') else line)
+        if regressions:
+            raise CommandError(f'{len(regressions)} regressions against the baseline')
+        self.stdout.write(self.style.SUCCESS('No regressions against the baseline'))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from thememarket_app.bundles import build_bundles, manifest_file
+from thememarket_app.critical import baseline_file, build_critical_css, load_baseline, save_baseline
+
+
+class Command(BaseCommand):
+    help = (
+        'Build the content-hashed CSS/JS bundles referenced by {% bundle %} and the per-page '
+        'critical CSS inlined by {% page_styles %}; run before collectstatic'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-critical', action='store_true', help='Only build the bundles')
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Fail if any page\'s first-paint bytes grew past the committed baseline',
+        )
+        parser.add_argument('--tolerance', type=float, default=5.0, help='Allowed first-paint growth in percent')
+        parser.add_argument('--update-baseline', action='store_true', help='Record the new first-paint bytes as the baseline')
+
+    def handle(self, *args, **options):
+        manifest = build_bundles()
+        for name, path in sorted(manifest.items()):
+            self.stdout.write(f'  {name} -> {path}')
+        self.stdout.write(self.style.SUCCESS(f'Built {len(manifest)} bundles, manifest at {manifest_file()}'))
+        if options['skip_critical']:
+            return
+
+        first_paint = build_critical_css()
+        baseline = load_baseline()
+        regressions = []
+        for page, (before, after) in first_paint.items():
+            line = f'  {page}: {before:,} -> {after:,} first-paint bytes'
+            limit = baseline.get(page, after) * (1 + options['tolerance'] / 100)
+            if after > limit:
+                regressions.append(page)
+                line += f' (baseline {baseline[page]:,})'
+            self.stdout.write(line)
+
+        if options['update_baseline']:
+            save_baseline({page: after for page, (_, after) in first_paint.items()})
+            self.stdout.write(self.style.SUCCESS(f'Baseline written to {baseline_file()}'))
+        elif options['check'] and regressions:
+            raise CommandError(f'First-paint bytes regressed for: {", ".join(regressions)}')
+        self.stdout.write(self.style.SUCCESS(f'Critical CSS built for {len(first_paint)} pages'))
@@ -0,0 +1,99 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from thememarket_app.models import (
+    Category, Theme, NavigationMenu, FooterSection, FooterLink, SocialLink
+)
+from thememarket_app.pagination import KeysetPaginator
+from thememarket_app.sections import PAGE_SECTIONS, section_queryset
+
+# EXPLAIN output that means the table is read front to back without an index
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (\w+)\b(?! USING)'),
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+}
+
+
+def storefront_queries():
+    """(label, queryset) for every query shape the storefront views issue"""
+    queries = [
+        ('home: featured categories', Category.objects.filter(is_featured=True)[:8]),
+        ('home: featured themes', Theme.objects.filter(is_featured=True)[:9]),
+        ('home: popular themes', Theme.objects.filter(is_popular=True)[:9]),
+        ('home: new themes', Theme.objects.filter(is_new=True)[:9]),
+        ('themes: categories', Category.objects.all()),
+        ('template: html themes', Theme.objects.filter(theme_type='html')[:12]),
+        ('template: ui themes', Theme.objects.filter(theme_type='ui')[:12]),
+        ('chrome: navigation', NavigationMenu.objects.filter(is_active=True)),
+        ('chrome: footer sections', FooterSection.objects.all()),
+        ('chrome: footer links', FooterLink.objects.filter(is_active=True)),
+        ('chrome: social links', SocialLink.objects.filter(is_active=True)),
+    ]
+
+    # Singleton sections hold one or two rows and are served from the section
+    # cache, so only the ordered *PageContent lists are checked here
+    for page, entries in PAGE_SECTIONS.items():
+        for entry in entries:
+            if entry.many:
+                queries.append((f'{page}: {entry.name}', section_queryset(entry)))
+
+    filters = {
+        'all': {},
+        'category': {'category__slug': 'sample'},
+        'type': {'theme_type': 'wordpress'},
+        'category+type': {'category__slug': 'sample', 'theme_type': 'wordpress'},
+    }
+    cursor_values = [timezone.now(), 0]
+    for label, lookup in filters.items():
+        paginator = KeysetPaginator(Theme.objects.filter(**lookup), 20)
+        descending = [f'-{name}' for name in paginator.fields]
+        queries.append((f'themes ({label}): first page', paginator.queryset.order_by(*descending)[:21]))
+        queries.append((
+            f'themes ({label}): next page',
+            paginator.queryset.filter(paginator.boundary(cursor_values, 'lt')).order_by(*descending)[:21],
+        ))
+        queries.append((
+            f'themes ({label}): previous page',
+            paginator.queryset.filter(paginator.boundary(cursor_values, 'gt')).order_by(*paginator.fields)[:21],
+        ))
+    return queries
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN every storefront query and fail if any of them needs a full table scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the full plan of every query')
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        pattern = FULL_SCAN_PATTERNS.get(vendor)
+        if pattern is None:
+            raise CommandError(f'Query plan checks are not supported on {vendor}')
+
+        failures = []
+        with transaction.atomic():
+            if vendor == 'postgresql':
+                # Tiny dev tables make seq scans the cheapest plan; forbid them so
+                # the planner shows whether an index path exists at all
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for label, queryset in storefront_queries():
+                plan = queryset.explain()
+                scans = pattern.findall(plan)
+                if scans:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f'FULL SCAN {label}: {", ".join(scans)}'))
+                else:
+                    self.stdout.write(self.style.SUCCESS(f'ok {label}'))
+                if scans or options['verbose_plans']:
+                    for line in plan.splitlines():
+                        self.stdout.write(f'    {line}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} storefront queries fall back to a full scan')
+        self.stdout.write(self.style.SUCCESS('All storefront queries use an index'))
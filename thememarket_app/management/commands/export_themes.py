@@ -0,0 +1,57 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from thememarket_app.exports import CHUNK_SIZE, FORMATS, export_lines, export_rows
+from thememarket_app.models import Theme
+
+
+class Command(BaseCommand):
+    help = (
+        'Export themes with category name, images and discount to a CSV or JSONL file, '
+        'streaming rows in chunks so any catalog size fits in memory'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Output file, or - for standard output')
+        parser.add_argument('--format', choices=sorted(FORMATS), help='File format (default: from the file extension)')
+        parser.add_argument('--category', action='append', default=[], help='Only themes in this category slug')
+        parser.add_argument('--type', choices=[value for value, _ in Theme.THEME_TYPES], help='Only this theme type')
+        parser.add_argument('--featured', action='store_true', help='Only featured themes')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Rows fetched per database round trip')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or Path(path).suffix.lstrip('.').lower()
+        if file_format not in FORMATS:
+            raise CommandError('Pass --format csv or jsonl, or use a .csv or .jsonl file name')
+
+        queryset = Theme.objects.order_by('-created_at', '-id')
+        if options['category']:
+            queryset = queryset.filter(category__slug__in=options['category'])
+        if options['type']:
+            queryset = queryset.filter(theme_type=options['type'])
+        if options['featured']:
+            queryset = queryset.filter(is_featured=True)
+
+        started = time.perf_counter()
+        count = 0
+        to_stdout = path == '-'
+        handle = None if to_stdout else open(path, 'w', newline='', encoding='utf-8')
+        try:
+            for line in export_lines(export_rows(queryset, max(1, options['chunk_size'])), file_format):
+                if handle is None:
+                    self.stdout.write(line, ending='')
+                else:
+                    handle.write(line)
+                count += 1
+        finally:
+            if handle is not None:
+                handle.close()
+        if file_format == 'csv':
+            count -= 1
+        if not to_stdout:
+            self.stdout.write(self.style.SUCCESS(
+                f'Exported {count} themes to {path} in {time.perf_counter() - started:.2f}s'
+            ))
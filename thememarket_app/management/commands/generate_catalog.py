@@ -0,0 +1,238 @@
+import bisect
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+from PIL import Image, ImageDraw
+
+from thememarket_app.catalog import catalog_loaded
+from thememarket_app.jobs import enqueue
+from thememarket_app.models import Category, Theme, ThemeImage
+
+ADJECTIVES = (
+    'Modern', 'Clean', 'Bold', 'Minimal', 'Creative', 'Elegant', 'Responsive', 'Flexible', 'Premium', 'Fresh',
+    'Smart', 'Rapid', 'Classic', 'Vivid', 'Sleek', 'Pure', 'Nova', 'Urban', 'Aurora', 'Zen',
+)
+NOUNS = (
+    'Agency', 'Portfolio', 'Shop', 'Blog', 'Magazine', 'Dashboard', 'Landing', 'Studio', 'Restaurant', 'Startup',
+    'Consulting', 'Fitness', 'Travel', 'Education', 'Medical', 'Real Estate', 'Photography', 'Event', 'SaaS', 'Charity',
+)
+SUFFIXES = ('Theme', 'Template', 'Kit', 'Pro', 'Starter', 'Builder', 'Suite', 'UI')
+CATEGORY_NAMES = (
+    'Business', 'E-commerce', 'Portfolio', 'Blog', 'Corporate', 'Technology', 'Education', 'Health', 'Food',
+    'Travel', 'Real Estate', 'Fashion', 'Music', 'Sports', 'Non-profit', 'Photography', 'Wedding', 'Admin',
+    'Landing Pages', 'Magazine', 'Entertainment', 'Automotive', 'Finance', 'Gaming',
+)
+ICONS = ('fas fa-briefcase', 'fas fa-store', 'fas fa-camera', 'fas fa-pen', 'fas fa-laptop-code', 'fas fa-heart')
+WORDS = (
+    'layout', 'responsive', 'design', 'pages', 'widgets', 'typography', 'customizable', 'modern', 'mobile', 'fast',
+    'components', 'sections', 'header', 'footer', 'gallery', 'checkout', 'blog', 'portfolio', 'retina', 'grid',
+    'animations', 'dark', 'mode', 'builder', 'SEO', 'optimized', 'clean', 'code', 'documentation', 'support',
+)
+FEATURES = (
+    'One-click demo import', 'Drag-and-drop page builder', 'WooCommerce ready', 'Retina-ready graphics',
+    'Dark mode', 'RTL support', 'Translation ready', 'Free lifetime updates', 'Google Fonts', 'Sticky header',
+    'Mega menu', 'Contact form', 'Parallax sections', 'SEO optimized markup',
+)
+
+# Catalog shape: most themes are WordPress, a long tail of categories and downloads
+THEME_TYPE_WEIGHTS = {'wordpress': 50, 'html': 25, 'ui': 15, 'plugin': 10}
+CATEGORY_SKEW = 1.1
+DOWNLOADS_SHAPE = 1.16
+DOWNLOADS_SCALE = 20
+DOWNLOADS_CAP = 250_000
+POPULAR_DOWNLOADS = 500
+FREE_SHARE = 0.15
+DISCOUNTED_SHARE = 0.3
+UNRATED_SHARE = 0.1
+FEATURED_SHARE = 0.02
+CATALOG_DAYS = 3 * 365
+NEW_DAYS = 30
+
+IMAGE_SIZE = (1280, 800)
+# Descriptions are drawn from a pool; composing one per row costs more than inserting it
+DESCRIPTION_POOL = 2000
+
+
+def zipf_cum_weights(count, skew):
+    """Cumulative weights for random.choices where item n is picked about 1/n**skew as often as the first"""
+    return list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def description_html(rng):
+    paragraphs = [
+        '<p>' + ' '.join(rng.choices(WORDS, k=rng.randint(20, 60))).capitalize() + '.</p>'
+        for _ in range(rng.randint(1, 4))
+    ]
+    features = ''.join(f'<li>{feature}</li>' for feature in rng.sample(FEATURES, rng.randint(3, 8)))
+    return ''.join(paragraphs) + f'<h3>Features</h3><ul>{features}</ul>'
+
+
+def price_pair(rng):
+    """(price, original_price): a share of free themes, log-normal prices ending in .00, some discounts"""
+    if rng.random() < FREE_SHARE:
+        return Decimal('0.00'), None
+    price = Decimal(min(199, max(9, round(rng.lognormvariate(3.6, 0.5))))).quantize(Decimal('0.01'))
+    if rng.random() < DISCOUNTED_SHARE:
+        return price, (price * Decimal(rng.uniform(1.2, 1.8))).quantize(Decimal('1.00'))
+    return price, None
+
+
+def rating(rng):
+    if rng.random() < UNRATED_SHARE:
+        return Decimal('0.00')
+    return Decimal(5 * rng.betavariate(8, 2)).quantize(Decimal('0.01'))
+
+
+def placeholder_images(rng, count):
+    """Storage names of count placeholder screenshots, written once and shared by every generated theme"""
+    names = []
+    for number in range(count):
+        name = f'themes/catalog/placeholder-{number}.jpg'
+        if not default_storage.exists(name):
+            colors = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(2)]
+            image = Image.new('RGB', IMAGE_SIZE, colors[0])
+            draw = ImageDraw.Draw(image)
+            draw.rectangle((0, 0, IMAGE_SIZE[0], 90), fill=colors[1])
+            for row in range(3):
+                top = 160 + row * 200
+                draw.rectangle((80, top, IMAGE_SIZE[0] - 80, top + 140), outline=colors[1], width=6)
+            buffer = BytesIO()
+            image.save(buffer, 'JPEG', quality=80)
+            name = default_storage.save(name, ContentFile(buffer.getvalue()))
+        names.append(name)
+    return names
+
+
+@contextmanager
+def explicit_timestamps(model):
+    """Let bulk_create keep the created_at/updated_at values set on the instances"""
+    fields = [field for field in model._meta.concrete_fields if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Command(BaseCommand):
+    help = 'Generate a synthetic theme catalog with realistic distributions for benchmarking'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--themes', type=int, default=10_000, help='Themes to create')
+        parser.add_argument('--categories', type=int, default=12, help='Categories to spread them over')
+        parser.add_argument('--images-per-theme', type=int, default=2, help='Gallery images per theme')
+        parser.add_argument('--image-pool', type=int, default=12, help='Distinct placeholder image files to reuse')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk_create and transaction')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible catalog')
+        parser.add_argument('--skip-index', action='store_true', help='Do not rebuild the search index afterwards')
+
+    def handle(self, *args, **options):
+        if options['themes'] < 0 or options['categories'] < 1 or options['images_per_theme'] < 0:
+            raise CommandError('--themes and --images-per-theme must be >= 0 and --categories >= 1')
+        rng = random.Random(options['seed'])
+        started = time.perf_counter()
+
+        categories = self.ensure_categories(options['categories'])
+        images = placeholder_images(rng, max(1, options['image_pool']))
+        for name in images:
+            enqueue('image', name=name)
+
+        created = 0
+        descriptions = [description_html(rng) for _ in range(min(DESCRIPTION_POOL, max(1, options['themes'])))]
+        first_number = (Theme.objects.aggregate(last=Max('id'))['last'] or 0) + 1
+        with explicit_timestamps(Theme):
+            while created < options['themes']:
+                size = min(options['batch_size'], options['themes'] - created)
+                with transaction.atomic():
+                    themes = Theme.objects.bulk_create(
+                        self.build_themes(rng, categories, images, descriptions, first_number + created, size),
+                        batch_size=size,
+                    )
+                    if options['images_per_theme']:
+                        ThemeImage.objects.bulk_create(
+                            self.build_images(rng, themes, images, options['images_per_theme']),
+                            batch_size=size,
+                        )
+                created += size
+                elapsed = time.perf_counter() - started
+                self.stdout.write(f'{created}/{options["themes"]} themes ({created / elapsed:.0f}/s)')
+
+        indexed = catalog_loaded(reindex=not options['skip_index'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {created} themes in {len(categories)} categories in {time.perf_counter() - started:.1f}s'
+            f' ({indexed} indexed)'
+        ))
+
+    def ensure_categories(self, count):
+        names = [
+            CATEGORY_NAMES[index] if index < len(CATEGORY_NAMES) else f'{CATEGORY_NAMES[index % len(CATEGORY_NAMES)]} {index // len(CATEGORY_NAMES) + 1}'
+            for index in range(count)
+        ]
+        slugs = [slugify(name) for name in names]
+        existing = set(Category.objects.filter(slug__in=slugs).values_list('slug', flat=True))
+        Category.objects.bulk_create([
+            Category(name=name, slug=slug, icon_class=ICONS[index % len(ICONS)], order=index, is_featured=index < 6)
+            for index, (name, slug) in enumerate(zip(names, slugs))
+            if slug not in existing
+        ])
+        by_slug = Category.objects.in_bulk(slugs, field_name='slug')
+        return [by_slug[slug].pk for slug in slugs]
+
+    def build_themes(self, rng, categories, images, descriptions, first_number, count):
+        category_weights = zipf_cum_weights(len(categories), CATEGORY_SKEW)
+        type_weights = list(itertools.accumulate(THEME_TYPE_WEIGHTS.values()))
+        types = list(THEME_TYPE_WEIGHTS)
+        now = timezone.now()
+        for number in range(first_number, first_number + count):
+            title = f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.choice(SUFFIXES)}'
+            slug = f'{slugify(title)}-{number}'
+            price, original_price = price_pair(rng)
+            downloads = min(DOWNLOADS_CAP, int(rng.paretovariate(DOWNLOADS_SHAPE) * DOWNLOADS_SCALE) - DOWNLOADS_SCALE)
+            # More of the catalog is recent than old
+            age = timedelta(days=CATALOG_DAYS * rng.random() ** 1.5)
+            created_at = now - age
+            yield Theme(
+                title=title,
+                slug=slug,
+                description=rng.choice(descriptions),
+                category_id=categories[bisect.bisect_left(category_weights, rng.random() * category_weights[-1])],
+                theme_type=types[bisect.bisect_left(type_weights, rng.random() * type_weights[-1])],
+                price=price,
+                original_price=original_price,
+                image=rng.choice(images),
+                preview_url=f'https://demo.example.com/{slug}/',
+                download_url=f'https://downloads.example.com/{slug}.zip',
+                is_featured=rng.random() < FEATURED_SHARE,
+                is_popular=downloads >= POPULAR_DOWNLOADS,
+                is_new=age.days < NEW_DAYS,
+                rating=rating(rng),
+                downloads=downloads,
+                created_at=created_at,
+                updated_at=created_at + timedelta(days=rng.random() * age.days),
+            )
+
+    def build_images(self, rng, themes, images, per_theme):
+        for theme in themes:
+            for order, name in enumerate(rng.sample(images, min(per_theme, len(images)))):
+                yield ThemeImage(
+                    theme_id=theme.pk,
+                    image=name,
+                    alt_text=f'{theme.title} screenshot {order + 1}',
+                    is_primary=order == 0,
+                    order=order,
+                )
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from thememarket_app.derivatives import IMAGE_FIELDS, generate_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Generate responsive WebP and JPEG/PNG renditions for every uploaded image'
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        for model, field_names in IMAGE_FIELDS.items():
+            for field_name in field_names:
+                names = (
+                    model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+                    .values_list(field_name, flat=True).distinct()
+                )
+                for name in names.iterator():
+                    try:
+                        generate_derivatives(name)
+                        processed += 1
+                    except (OSError, ValueError) as exc:
+                        failed += 1
+                        self.stdout.write(self.style.WARNING(f'Skipped {name}: {exc}'))
+        self.stdout.write(self.style.SUCCESS(f'{processed} images processed, {failed} skipped'))
@@ -0,0 +1,59 @@
+import csv
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from thememarket_app.imports import BATCH_SIZE, ThemeImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Import a vendor catalog from a CSV or JSONL file, creating or updating themes by slug in batches. '
+        'Invalid rows are reported and skipped; the rest of the file is still imported'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file with one theme per row')
+        parser.add_argument('--format', choices=('csv', 'jsonl'), help='File format (default: from the file extension)')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='Rows written per statement')
+        parser.add_argument('--dry-run', action='store_true', help='Validate every row without writing anything')
+        parser.add_argument('--errors', help='Write every rejected row to this CSV file')
+        parser.add_argument('--max-errors', type=int, default=50, help='Rejected rows to print (all go to --errors)')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        printed = 0
+        error_file = open(options['errors'], 'w', newline='') if options['errors'] else None
+        writer = csv.writer(error_file) if error_file else None
+        if writer:
+            writer.writerow(['line', 'slug', 'errors'])
+
+        def on_error(error):
+            nonlocal printed
+            if writer:
+                writer.writerow([error.line, error.slug, '; '.join(error.messages)])
+            if printed < options['max_errors']:
+                printed += 1
+                self.stderr.write(f'  line {error.line} ({error.slug or "no slug"}): {error}')
+
+        importer = ThemeImporter(batch_size=max(1, options['batch_size']), dry_run=options['dry_run'], on_error=on_error)
+        try:
+            importer.run(read_rows(options['path'], options['format']))
+        except (OSError, ValueError) as exc:
+            raise CommandError(exc)
+        finally:
+            if error_file:
+                error_file.close()
+
+        if importer.failed > printed:
+            self.stderr.write(f'  ... {importer.failed - printed} more rejected rows')
+        elapsed = time.perf_counter() - started
+        if options['dry_run']:
+            summary = f'{importer.valid} valid rows and {importer.failed} rejected in {elapsed:.2f}s'
+            self.stdout.write(self.style.WARNING(f'Dry run, nothing written: {summary}'))
+            return
+        summary = (
+            f'{importer.created} themes created, {importer.updated} updated and '
+            f'{importer.failed} rows rejected in {elapsed:.2f}s'
+        )
+        self.stdout.write(self.style.WARNING(summary) if importer.failed else self.style.SUCCESS(summary))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from thememarket_app.search import get_backend, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Drop and rebuild the theme full-text search index'
+
+    def handle(self, *args, **options):
+        if get_backend() is None:
+            raise CommandError(f'Full-text search is not supported on {connection.vendor}')
+        with transaction.atomic():
+            indexed = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} themes'))
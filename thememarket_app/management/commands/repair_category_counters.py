@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from thememarket_app.counters import recount_categories
+from thememarket_app.models import Category, Theme
+
+
+class Command(BaseCommand):
+    help = 'Recompute the denormalized theme counters on every category'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drifted = recount_categories(Category, Theme)
+        for category in drifted:
+            self.stdout.write(f'Repaired "{category}": {category.theme_count} themes')
+        self.stdout.write(self.style.SUCCESS(f'{len(drifted)} categories repaired'))
@@ -0,0 +1,98 @@
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from thememarket_app.jobs import RUNNING_LEASE_SECONDS, claim, complete, execute, fail, requeue_running
+
+BROKEN_POOL_ERROR = 'A worker process died (crash or out of memory) while this batch was running'
+
+
+class Command(BaseCommand):
+    help = 'Process queued background jobs (image renditions and metadata) across a pool of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='Worker processes')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty')
+        parser.add_argument('--once', action='store_true', help='Exit once no due jobs are left')
+        parser.add_argument(
+            '--lease', type=int, default=RUNNING_LEASE_SECONDS,
+            help='Seconds after which a running job is assumed lost with its worker and queued again',
+        )
+        parser.add_argument(
+            '--start-method', choices=multiprocessing.get_all_start_methods(),
+            help="How worker processes are started (default: the platform's)",
+        )
+
+    def start_pool(self, processes, start_method=None):
+        # Children must not inherit the parent's database connections
+        connections.close_all()
+        # Under the spawn and forkserver start methods (macOS, and Linux from
+        # Python 3.14) children start from a fresh interpreter and must set
+        # Django up before they can import the job handlers
+        return ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context(start_method), initializer=django.setup,
+        )
+
+    def submit(self, pool, job):
+        try:
+            return pool.submit(execute, job.kind, job.payload)
+        except BrokenProcessPool as exc:
+            future = Future()
+            future.set_exception(exc)
+            return future
+
+    def requeue(self, lease):
+        requeued = requeue_running(lease)
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} jobs left running by a dead worker'))
+
+    def handle(self, *args, **options):
+        processes = max(1, options['processes'])
+        self.requeue(options['lease'])
+
+        done = failed = 0
+        pool = self.start_pool(processes, options['start_method'])
+        self.stdout.write(self.style.SUCCESS(f'Started {processes} worker processes'))
+        try:
+            while True:
+                jobs = claim(processes * 2)
+                if not jobs:
+                    if options['once']:
+                        break
+                    self.requeue(options['lease'])
+                    time.sleep(options['poll_interval'])
+                    continue
+                futures = {self.submit(pool, job): job for job in jobs}
+                broken = False
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        complete(job, future.result())
+                        done += 1
+                    except BrokenProcessPool:
+                        # Which job killed the process is unknown, so every unfinished job in the
+                        # batch is charged an attempt; a poison job then runs out of max_attempts
+                        broken = True
+                        fail(job, BROKEN_POOL_ERROR)
+                        failed += 1
+                        self.stdout.write(self.style.WARNING(f'{job} lost with its worker (attempt {job.attempts})'))
+                    except Exception:
+                        fail(job, traceback.format_exc(limit=5))
+                        failed += 1
+                        self.stdout.write(self.style.WARNING(f'{job} failed (attempt {job.attempts})'))
+                if broken:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = self.start_pool(processes, options['start_method'])
+                    self.stdout.write(self.style.WARNING(f'Restarted {processes} worker processes'))
+        except KeyboardInterrupt:
+            self.stdout.write('Stopping workers')
+        finally:
+            pool.shutdown(cancel_futures=True)
+        self.stdout.write(self.style.SUCCESS(f'{done} jobs done, {failed} failed'))
@@ -0,0 +1,42 @@
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from thememarket_app.seeding import DEFAULT_DATASET, load_dataset, seed
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed the site from declarative datasets (thememarket_app/seeds/<name>.json or a path), '
+        'creating missing rows in bulk inside one transaction'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('datasets', nargs='*', default=[DEFAULT_DATASET], help='Dataset names or JSON file paths')
+        parser.add_argument('--update', action='store_true',
+                            help='Also reset existing rows whose fields differ from the dataset')
+        parser.add_argument('--dry-run', action='store_true', help='Report the changes and roll them back')
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            entries = [entry for name in options['datasets'] for entry in load_dataset(name)]
+            plans = seed(entries, update=options['update'], dry_run=options['dry_run'])
+        except (ImproperlyConfigured, LookupError) as exc:
+            raise CommandError(exc)
+
+        created = updated = 0
+        for plan in plans:
+            if plan.create or plan.update:
+                self.stdout.write(
+                    f'  {plan.model._meta.verbose_name_plural}: {len(plan.create)} created, '
+                    f'{len(plan.update)} updated, {plan.unchanged} unchanged'
+                )
+            created += len(plan.create)
+            updated += len(plan.update)
+        summary = f'{created} rows created and {updated} updated across {len(plans)} models in {time.perf_counter() - started:.2f}s'
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Dry run, rolled back: {summary}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from thememarket_app import urls as storefront_urls
+from thememarket_app.caching import cache_is_shared
+from thememarket_app.models import Category, Theme
+from thememarket_app.pagination import KeysetPaginator
+from thememarket_app.sections import get_page_sections
+
+# Per-user or request-specific endpoints that have nothing shared to warm
+SKIPPED_URLS = {'fragments', 'theme_search'}
+# Query strings for endpoints that need one to do any work
+URL_QUERIES = {'suggest': {'q': 'a'}}
+
+
+def storefront_urls_to_warm(max_pages):
+    """Every argument-free storefront URL, every category/type filter and the themes listing pages"""
+    urls = []
+    for pattern in storefront_urls.urlpatterns:
+        if isinstance(pattern, URLPattern) and not pattern.pattern.converters and pattern.name not in SKIPPED_URLS:
+            query = URL_QUERIES.get(pattern.name)
+            urls.append(reverse(pattern.name) + (f'?{urlencode(query)}' if query else ''))
+
+    themes_url = reverse('themes')
+    categories = [None] + list(Category.objects.values_list('slug', flat=True))
+    types = [None] + [value for value, _ in Theme.THEME_TYPES]
+    for category in categories:
+        for theme_type in types:
+            params = {name: value for name, value in (('category', category), ('type', theme_type)) if value}
+            if params:
+                urls.append(f'{themes_url}?{urlencode(params)}')
+
+    # Later pages of the unfiltered listing, following the same cursors the pager links to
+    grid = get_page_sections('themes')['themes_grid']
+    paginator = KeysetPaginator(Theme.objects.all(), grid.items_per_page if grid else 20)
+    page = paginator.page(None)
+    for _ in range(max_pages - 1):
+        if not page.has_next:
+            break
+        urls.append(f'{themes_url}?{urlencode({"cursor": page.next_cursor})}')
+        page = paginator.page(page.next_cursor)
+    return urls
+
+
+def warm(url, host):
+    client = Client(HTTP_HOST=host)
+    started = time.perf_counter()
+    try:
+        response = client.get(url)
+        return url, response.status_code, response.get('X-Page-Cache', '-'), len(response.content), time.perf_counter() - started
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        'Render every storefront URL and themes filter combination to fill the shared page and catalog caches. '
+        'Requires a cache backend shared between processes; in-process layers (chrome and section memos, the '
+        'suggestion index) can only be warmed inside each worker, see thememarket_app.warmup.warm_process'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=4, help='Concurrent requests')
+        parser.add_argument('--max-pages', type=int, default=10, help='Themes listing pages to follow')
+        parser.add_argument('--host', default=None, help='Host header to send (default: first ALLOWED_HOSTS entry)')
+        parser.add_argument('--slow-ms', type=float, default=500, help='Flag URLs slower than this')
+        parser.add_argument(
+            '--allow-local-cache', action='store_true',
+            help='Run with a per-process cache anyway, only to check that every URL renders',
+        )
+
+    def handle(self, *args, **options):
+        host = options['host'] or next(
+            (host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'), 'localhost'
+        )
+        if not cache_is_shared():
+            backend = type(caches['default']).__name__
+            if not options['allow_local_cache']:
+                raise CommandError(
+                    f'The default cache is a {backend}, which lives only in this process: everything '
+                    f'warmed would be lost when the command exits and no serving worker would see it. '
+                    f'Configure a shared backend (Redis, Memcached, database or file-based), or pass '
+                    f'--allow-local-cache to just check that every URL renders.'
+                )
+            self.stdout.write(self.style.WARNING(
+                f'The default cache is a {backend}: pages are rendered but nothing stays warm after this command'
+            ))
+        started = time.perf_counter()
+        urls = storefront_urls_to_warm(options['max_pages'])
+
+        with ThreadPoolExecutor(max_workers=max(1, options['threads'])) as pool:
+            results = list(pool.map(lambda url: warm(url, host), urls))
+
+        failures = []
+        for url, status, cache_state, size, elapsed in sorted(results, key=lambda result: -result[4]):
+            line = f'{elapsed * 1000:8.1f} ms  {status}  {cache_state:<5}  {size:>8,} B  {url}'
+            if status != 200:
+                failures.append(url)
+                self.stdout.write(self.style.ERROR(line))
+            elif elapsed * 1000 > options['slow_ms']:
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+
+        total = time.perf_counter() - started
+        if failures:
+            raise CommandError(f'{len(failures)} of {len(urls)} URLs failed: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS(f'Warmed {len(urls)} URLs in {total:.2f}s'))
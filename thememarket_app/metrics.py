@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.template.backends.django import Template
+
+# Requests kept per URL name for the admin stats page
+SAMPLE_SIZE = getattr(settings, 'REQUEST_STATS_SAMPLES', 500)
+SAMPLE_RATE = getattr(settings, 'REQUEST_STATS_SAMPLE_RATE', 1.0)
+
+_current = ContextVar('thememarket_request_metrics', default=None)
+_samples = defaultdict(lambda: deque(maxlen=SAMPLE_SIZE))
+_samples_lock = threading.Lock()
+_template_timer_installed = False
+
+
+class RequestMetrics:
+    """What one request spent on the database, templates and caches"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+        self.cache = {'hit': 0, 'miss': 0, 'stale': 0}
+        self.total_time = 0.0
+
+
+def start_request():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def finish_request(metrics, token):
+    metrics.total_time = time.perf_counter() - metrics.started
+    _current.reset(token)
+
+
+def record_cache(outcome):
+    """Count a cache 'hit', 'miss' or 'stale' read against the current request"""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.cache[outcome] += 1
+
+
+def record_query(execute, sql, params, many, context):
+    """connection.execute_wrapper() hook timing every query of the current request"""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def install_template_timer():
+    """Time Django template rendering; nested renders count once, in the outermost one"""
+    global _template_timer_installed
+    if _template_timer_installed:
+        return
+    render = Template.render
+
+    def timed_render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return render(self, context, request)
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_time += time.perf_counter() - started
+
+    Template.render = timed_render
+    _template_timer_installed = True
+
+
+def server_timing(metrics):
+    """Server-Timing header value for a finished request"""
+    cache = metrics.cache
+    return ', '.join([
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+        f'tpl;dur={metrics.template_time * 1000:.1f};desc="templates"',
+        f'cache;desc="hit={cache["hit"]} miss={cache["miss"]} stale={cache["stale"]}"',
+        f'total;dur={metrics.total_time * 1000:.1f}',
+    ])
+
+
+def record_sample(name, metrics):
+    if SAMPLE_RATE < 1 and random.random() >= SAMPLE_RATE:
+        return
+    sample = (metrics.total_time, metrics.queries, metrics.db_time, metrics.template_time,
+              metrics.cache['hit'], metrics.cache['miss'] + metrics.cache['stale'])
+    with _samples_lock:
+        _samples[name].append(sample)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def request_stats():
+    """Per URL name summaries of the recent samples, busiest first"""
+    with _samples_lock:
+        snapshot = {name: list(samples) for name, samples in _samples.items() if samples}
+    stats = []
+    for name, samples in snapshot.items():
+        totals = [sample[0] * 1000 for sample in samples]
+        hits = sum(sample[4] for sample in samples)
+        lookups = hits + sum(sample[5] for sample in samples)
+        stats.append({
+            'name': name,
+            'count': len(samples),
+            'p50': _percentile(totals, 0.5),
+            'p95': _percentile(totals, 0.95),
+            'p99': _percentile(totals, 0.99),
+            'max': max(totals),
+            'queries': sum(sample[1] for sample in samples) / len(samples),
+            'max_queries': max(sample[1] for sample in samples),
+            'db_p95': _percentile([sample[2] * 1000 for sample in samples], 0.95),
+            'template_p95': _percentile([sample[3] * 1000 for sample in samples], 0.95),
+            'cache_hit_ratio': hits / lookups if lookups else None,
+        })
+    return sorted(stats, key=lambda entry: -entry['count'])
+
+
+def reset_stats():
+    with _samples_lock:
+        _samples.clear()
@@ -0,0 +1,54 @@
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .fragments import MARKER_PREFIX, fill_fragments
+from .metrics import finish_request, install_template_timer, record_query, record_sample, server_timing, start_request
+
+
+class FragmentMiddleware:
+    """Fill the per-user holes {% user_fragment %} leaves in cached page shells"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            not response.streaming
+            and response.get('Content-Type', '').startswith('text/html')
+            and MARKER_PREFIX in response.content
+        ):
+            response.content = fill_fragments(response.content, request)
+        return response
+
+
+class ServerTimingMiddleware:
+    """
+    Measure each request's queries, DB time, template time and cache reads.
+
+    The figures go out in a Server-Timing header and into the per URL name
+    samples behind the admin's request stats page. Keep it first in
+    MIDDLEWARE so the total covers the other middleware too.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.send_header = getattr(settings, 'SERVER_TIMING_HEADER', True)
+        install_template_timer()
+
+    def __call__(self, request):
+        metrics, token = start_request()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(record_query))
+                response = self.get_response(request)
+        finally:
+            finish_request(metrics, token)
+        match = request.resolver_match
+        record_sample(match.view_name if match else 'unresolved', metrics)
+        if self.send_header:
+            response['Server-Timing'] = server_timing(metrics)
+        return response
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thememarket_app', '0002_alter_category_description_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cartpagecontent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='cart_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['order'], name='category_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['order'], name='category_featured_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkoutpagecontent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='checkout_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='footerlink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='footerlink_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='footersection',
+            index=models.Index(fields=['order'], name='footersection_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loginpagecontent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='login_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='navigationmenu',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='navmenu_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentpagecontent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='payment_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentsuccesspagecontent',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='paysuccess_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sociallink',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order'], name='social_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(fields=['-created_at', '-id'], name='theme_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at', '-id'], name='theme_featured_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(condition=models.Q(('is_popular', True)), fields=['-created_at', '-id'], name='theme_popular_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(condition=models.Q(('is_new', True)), fields=['-created_at', '-id'], name='theme_new_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(fields=['theme_type', '-created_at', '-id'], name='theme_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='theme_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='theme',
+            index=models.Index(fields=['category', 'theme_type', '-created_at', '-id'], name='theme_cat_type_created_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from thememarket_app.search import document_text, get_backend
+
+    backend = get_backend(schema_editor.connection)
+    if backend is None:
+        return
+    Theme = apps.get_model('thememarket_app', 'Theme')
+    documents = [
+        (pk, title, category_name or '', document_text(description))
+        for pk, title, category_name, description in Theme.objects.values_list(
+            'id', 'title', 'category__name', 'description'
+        )
+    ]
+    with schema_editor.connection.cursor() as cursor:
+        backend.create(cursor)
+        if documents:
+            backend.upsert(cursor, documents)
+
+
+def drop_search_index(apps, schema_editor):
+    from thememarket_app.search import get_backend
+
+    backend = get_backend(schema_editor.connection)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend.drop(cursor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('thememarket_app', '0003_storefront_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.core.validators import URLValidator
 from tinymce.models import HTMLField
 
@@ -27,6 +28,9 @@ class NavigationMenu(models.Model):
         ordering = ['order']
         verbose_name = "Navigation Menu"
         verbose_name_plural = "Navigation Menus"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='navmenu_active_order_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -69,14 +73,35 @@ class Category(models.Model):
     color = models.CharField(max_length=7, default="#5c2dd5")
     is_featured = models.BooleanField(default=False)
     order = models.IntegerField(default=0)
+    # Denormalized theme counters, kept current by signals and repair_category_counters
+    theme_count = models.PositiveIntegerField(default=0, editable=False)
+    wordpress_count = models.PositiveIntegerField(default=0, editable=False)
+    html_count = models.PositiveIntegerField(default=0, editable=False)
+    ui_count = models.PositiveIntegerField(default=0, editable=False)
+    plugin_count = models.PositiveIntegerField(default=0, editable=False)
+    COUNTER_FIELDS = ('theme_count', 'wordpress_count', 'html_count', 'ui_count', 'plugin_count')
     
     class Meta:
         ordering = ['order']
         verbose_name = "Category"
         verbose_name_plural = "Categories"
+        indexes = [
+            models.Index(fields=['order'], name='category_order_idx'),
+            models.Index(fields=['order'], condition=models.Q(is_featured=True), name='category_featured_order_idx'),
+        ]
     
     def __str__(self):
         return self.name
+    
+    def save(self, *args, **kwargs):
+        # The counters change underneath loaded instances through F() updates;
+        # saving a stale instance must not write its old values back
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
 class Theme(models.Model):
     THEME_TYPES = [
@@ -108,14 +133,28 @@ class Theme(models.Model):
         ordering = ['-created_at']
         verbose_name = "Theme"
         verbose_name_plural = "Themes"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='theme_created_idx'),
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_featured=True), name='theme_featured_created_idx'),
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_popular=True), name='theme_popular_created_idx'),
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_new=True), name='theme_new_created_idx'),
+            models.Index(fields=['theme_type', '-created_at', '-id'], name='theme_type_created_idx'),
+            models.Index(fields=['category', '-created_at', '-id'], name='theme_cat_created_idx'),
+            models.Index(fields=['category', 'theme_type', '-created_at', '-id'], name='theme_cat_type_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
     @property
     def discount_percentage(self):
-        if self.original_price and self.original_price > self.price:
-            return int(((self.original_price - self.price) / self.original_price) * 100)
+        return self.discount_for(self.price, self.original_price)
+
+    @staticmethod
+    def discount_for(price, original_price):
+        """Whole percent off original_price; also used on value rows that are not Theme instances"""
+        if original_price and original_price > price:
+            return int(((original_price - price) / original_price) * 100)
         return 0
 
 class ThemeImage(models.Model):
@@ -157,6 +196,9 @@ class FooterSection(models.Model):
         ordering = ['order']
         verbose_name = "Footer Section"
         verbose_name_plural = "Footer Sections"
+        indexes = [
+            models.Index(fields=['order'], name='footersection_order_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -172,6 +214,9 @@ class FooterLink(models.Model):
         ordering = ['order']
         verbose_name = "Footer Link"
         verbose_name_plural = "Footer Links"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='footerlink_active_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.section.title} - {self.title}"
@@ -196,6 +241,9 @@ class SocialLink(models.Model):
         ordering = ['order']
         verbose_name = "Social Link"
         verbose_name_plural = "Social Links"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='social_active_order_idx'),
+        ]
     
     def __str__(self):
         return self.platform.title()
@@ -616,6 +664,9 @@ class LoginPageContent(models.Model):
         ordering = ['order']
         verbose_name = "Login Page Content"
         verbose_name_plural = "Login Page Contents"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='login_active_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_section_type_display()} - {self.title}"
@@ -638,6 +689,9 @@ class CartPageContent(models.Model):
         ordering = ['order']
         verbose_name = "Cart Page Content"
         verbose_name_plural = "Cart Page Contents"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='cart_active_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_section_type_display()} - {self.title}"
@@ -660,6 +714,9 @@ class CheckoutPageContent(models.Model):
         ordering = ['order']
         verbose_name = "Checkout Page Content"
         verbose_name_plural = "Checkout Page Contents"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='checkout_active_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_section_type_display()} - {self.title}"
@@ -682,6 +739,9 @@ class PaymentPageContent(models.Model):
         ordering = ['order']
         verbose_name = "Payment Page Content"
         verbose_name_plural = "Payment Page Contents"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='payment_active_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_section_type_display()} - {self.title}"
@@ -704,6 +764,50 @@ class PaymentSuccessPageContent(models.Model):
         ordering = ['order']
         verbose_name = "Payment Success Page Content"
         verbose_name_plural = "Payment Success Page Contents"
+        indexes = [
+            models.Index(fields=['order'], condition=models.Q(is_active=True), name='paysuccess_active_order_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_section_type_display()} - {self.title}"
+
+# BACKGROUND JOBS
+class BackgroundJob(models.Model):
+    KINDS = [
+        ('image', 'Image Processing'),
+    ]
+    
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+    
+    kind = models.CharField(max_length=20, choices=KINDS)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUSES, default=PENDING)
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Jobs"
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.get_section_type_display()} - {self.title}"
\ No newline at end of file
+        return f"{self.get_kind_display()} #{self.pk} ({self.status})"
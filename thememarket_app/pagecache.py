@@ -0,0 +1,113 @@
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .bundles import manifest_version
+from .caching import bump_version, cached, get_version, last_modified
+from .chrome import CHROME_MODELS
+from .fragments import fragment_state
+from .sections import page_models
+
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# page: models whose changes purge it, filled in by @cache_page
+PAGE_DEPENDENCIES = {}
+
+
+def page_namespace(page):
+    return f'page:{page}'
+
+
+def page_key(request, params):
+    """Cache key for a request: path, the view's declared query params and the bundle build"""
+    query = urlencode([(name, value) for name in params for value in request.GET.getlist(name)])
+    return f'{manifest_version()}:{hashlib.md5(f"{request.path}?{query}".encode()).hexdigest()}'
+
+
+def page_etag(request, key, version, modified):
+    """
+    ETag for a page from its cache key, content version and the user's fragments.
+
+    The modification stamp is part of it so a cache reset, which restarts
+    version numbers, can't revive an old validator.
+    """
+    digest = hashlib.md5(f'{key}:{version}:{modified}:{fragment_state(request)}'.encode()).hexdigest()[:20]
+    return quote_etag(digest)
+
+
+def _set_validators(request, response, etag, modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(modified)
+    # Browsers may keep the page but must check back, which costs a 304
+    patch_cache_control(response, no_cache=True)
+    if request.user.is_authenticated:
+        patch_cache_control(response, private=True)
+    return response
+
+
+def cacheable(request):
+    return request.method in ('GET', 'HEAD')
+
+
+def cache_page(page, *models, params=()):
+    """
+    Serve a storefront view from the shared cache.
+
+    The cached shell is the same for everybody: per-user parts are left as
+    {% user_fragment %} holes that FragmentMiddleware fills per request.
+
+    Responses are keyed on the path plus the query params the view reads, so
+    tracking parameters don't fragment the cache. They are purged when the
+    site chrome, any of the page's sections or one of the given models is
+    saved or deleted. Conditional requests are answered with a 304 before
+    the cache or the view is touched. A purged page keeps being served to
+    other visitors while one request re-renders it.
+    """
+    PAGE_DEPENDENCIES[page] = frozenset(CHROME_MODELS + page_models(page) + models)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not cacheable(request):
+                return view(request, *args, **kwargs)
+            namespace = page_namespace(page)
+            key = page_key(request, params)
+            version, modified = get_version(namespace), last_modified(namespace)
+            etag = page_etag(request, key, version, modified)
+            not_modified = get_conditional_response(request, etag=etag, last_modified=modified)
+            if not_modified is not None:
+                return _set_validators(request, not_modified, etag, modified)
+
+            rendered = {}
+
+            def render():
+                response = rendered['response'] = view(request, *args, **kwargs)
+                if response.status_code == 200 and not response.streaming and not response.cookies:
+                    return (response.content, response['Content-Type'], version, modified)
+                return None
+
+            entry = cached(namespace, key, render, PAGE_CACHE_TIMEOUT)
+            if entry is None:
+                return rendered['response']
+            content, content_type, entry_version, entry_modified = entry
+            if 'response' in rendered:
+                response = rendered['response']
+                response['X-Page-Cache'] = 'miss'
+            else:
+                response = HttpResponse(content, content_type=content_type)
+                # stale: an older version served while another worker rebuilds the page
+                response['X-Page-Cache'] = 'hit' if entry_version == version else 'stale'
+            return _set_validators(request, response, page_etag(request, key, entry_version, entry_modified), entry_modified)
+        return wrapper
+    return decorator
+
+
+def invalidate_pages(model=None):
+    """Purge the cached pages that depend on a model, or every page when model is None"""
+    for page, dependencies in PAGE_DEPENDENCIES.items():
+        if model is None or model in dependencies:
+            bump_version(page_namespace(page))
@@ -0,0 +1,113 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    """One page of a keyset-paginated queryset"""
+
+    def __init__(self, items, next_cursor=None, previous_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over a descending ordering such as ('-created_at', '-id').
+
+    Every page is a single indexed range scan with LIMIT, so page 5000 costs
+    the same as page 1. The last field must be unique to keep cursors stable.
+    """
+
+    def __init__(self, queryset, per_page, fields=('created_at', 'id')):
+        self.queryset = queryset
+        self.per_page = max(1, int(per_page))
+        self.fields = tuple(fields)
+        self.model_fields = [queryset.model._meta.get_field(name) for name in self.fields]
+
+    def encode_cursor(self, item, direction):
+        values = [field.value_to_string(item) for field in self.model_fields]
+        payload = json.dumps([direction] + values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            direction, *values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if direction not in (NEXT, PREVIOUS) or len(values) != len(self.fields):
+                raise InvalidCursor(cursor)
+            return direction, [field.to_python(value) for field, value in zip(self.model_fields, values)]
+        except (binascii.Error, ValueError, TypeError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def boundary(self, values, lookup):
+        """(a < x) OR (a = x AND b < y) ... for the tuple comparison on self.fields"""
+        condition = Q()
+        for index, name in enumerate(self.fields):
+            clause = Q(**{f'{name}__{lookup}': values[index]})
+            for previous_name, previous_value in zip(self.fields[:index], values[:index]):
+                clause &= Q(**{previous_name: previous_value})
+            condition |= clause
+        return condition
+
+    def page(self, cursor=None):
+        """Return the page addressed by cursor; an invalid or missing cursor is the first page"""
+        direction, values = NEXT, None
+        if cursor:
+            try:
+                direction, values = self.decode_cursor(cursor)
+            except InvalidCursor:
+                direction, values = NEXT, None
+
+        descending = [f'-{name}' for name in self.fields]
+        if values is None:
+            rows = list(self.queryset.order_by(*descending)[:self.per_page + 1])
+            more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            return self._build(rows, has_next=more, has_previous=False)
+
+        if direction == NEXT:
+            queryset = self.queryset.filter(self.boundary(values, 'lt')).order_by(*descending)
+            rows = list(queryset[:self.per_page + 1])
+            more = len(rows) > self.per_page
+            return self._build(rows[:self.per_page], has_next=more, has_previous=True)
+
+        queryset = self.queryset.filter(self.boundary(values, 'gt')).order_by(*self.fields)
+        rows = list(queryset[:self.per_page + 1])
+        if len(rows) <= self.per_page:
+            # Walked back past the start: serve a full first page instead
+            return self.page()
+        rows = list(reversed(rows[:self.per_page]))
+        return self._build(rows, has_next=True, has_previous=True)
+
+    def _build(self, rows, has_next, has_previous):
+        return KeysetPage(
+            rows,
+            next_cursor=self.encode_cursor(rows[-1], NEXT) if rows and has_next else None,
+            previous_cursor=self.encode_cursor(rows[0], PREVIOUS) if rows and has_previous else None,
+        )
@@ -0,0 +1,148 @@
+import gzip
+import mimetypes
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import StaticFilesStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.json', '.svg', '.txt', '.xml', '.html', '.map', '.ico', '.ttf', '.otf', '.eot')
+# A sibling is only kept when it is meaningfully smaller than the original
+MIN_SAVING = 0.95
+# Names carrying a content hash, e.g. bundles/home.3f2c9a1b7e0d.css
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+DEFAULT_MAX_AGE = 60 * 60
+
+# (Accept-Encoding token, file suffix) in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def accepted_codings(header):
+    """Map each content coding in an Accept-Encoding header to its q-value"""
+    codings = {}
+    for token in header.split(','):
+        coding, *params = token.split(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def compress_file(path):
+    """Write .gz (and .br when brotli is installed) siblings of a file; returns the suffixes written"""
+    with open(path, 'rb') as handle:
+        data = handle.read()
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    written = []
+    for suffix, compressed in variants:
+        if len(compressed) < len(data) * MIN_SAVING:
+            with open(path + suffix, 'wb') as handle:
+                handle.write(compressed)
+            written.append(suffix)
+        elif os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return written
+
+
+class PrecompressedStaticFilesStorage(StaticFilesStorage):
+    """collectstatic storage that writes .gz/.br siblings of compressible files"""
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        for name in paths:
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                written = compress_file(self.path(name))
+                yield name, name, bool(written)
+
+
+class PrecompressedStaticApp:
+    """
+    WSGI wrapper that serves STATIC_ROOT, picking the .br or .gz sibling the client accepts.
+
+    Content-hashed names get a year-long immutable Cache-Control; everything
+    else is revalidated hourly. Other requests pass through to the Django app.
+    """
+
+    def __init__(self, application, root=None, prefix=None):
+        self.application = application
+        self.root = os.path.realpath(root or settings.STATIC_ROOT)
+        self.prefix = prefix or settings.STATIC_URL
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if environ['REQUEST_METHOD'] not in ('GET', 'HEAD') or not path.startswith(self.prefix):
+            return self.application(environ, start_response)
+        name = unquote(path[len(self.prefix):])
+        filename = os.path.realpath(os.path.join(self.root, name))
+        if not filename.startswith(self.root + os.sep) or not os.path.isfile(filename):
+            return self.application(environ, start_response)
+        return self.serve(environ, start_response, name, filename)
+
+    def negotiate(self, environ, filename):
+        """The most preferred sibling the client accepts; q=0 refuses a coding and '*' covers unlisted ones"""
+        codings = accepted_codings(environ.get('HTTP_ACCEPT_ENCODING', ''))
+        best_quality, best = 0, (None, filename)
+        for encoding, suffix in ENCODINGS:
+            quality = codings.get(encoding, codings.get('*', 0))
+            if quality > best_quality and os.path.isfile(filename + suffix):
+                best_quality, best = quality, (encoding, filename + suffix)
+        return best
+
+    def serve(self, environ, start_response, name, filename):
+        encoding, variant = self.negotiate(environ, filename)
+        stat = os.stat(variant)
+        content_type, _ = mimetypes.guess_type(filename)
+        max_age = IMMUTABLE_MAX_AGE if HASHED_NAME.search(name) else DEFAULT_MAX_AGE
+        headers = [
+            ('Content-Type', content_type or 'application/octet-stream'),
+            ('Last-Modified', formatdate(stat.st_mtime, usegmt=True)),
+            ('Cache-Control', f'public, max-age={max_age}' + (', immutable' if max_age == IMMUTABLE_MAX_AGE else '')),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if encoding:
+            headers.append(('Content-Encoding', encoding))
+
+        since = environ.get('HTTP_IF_MODIFIED_SINCE')
+        if since:
+            try:
+                if int(stat.st_mtime) <= parsedate_to_datetime(since).timestamp():
+                    start_response('304 Not Modified', headers)
+                    return []
+            except (TypeError, ValueError):
+                pass
+
+        headers.append(('Content-Length', str(stat.st_size)))
+        start_response('200 OK', headers)
+        if environ['REQUEST_METHOD'] == 'HEAD':
+            return []
+        handle = open(variant, 'rb')
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper:
+            return file_wrapper(handle, 64 * 1024)
+        return _read_chunks(handle)
+
+
+def _read_chunks(handle, size=64 * 1024):
+    with handle:
+        for chunk in iter(lambda: handle.read(size), b''):
+            yield chunk
@@ -0,0 +1,195 @@
+import html
+import math
+import re
+
+from django.db import connection
+from django.utils.html import strip_tags
+
+from .models import Theme
+
+# How many FTS hits are blended with downloads/rating before paging
+CANDIDATE_LIMIT = 200
+BATCH_SIZE = 500
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def query_terms(query):
+    """Split user input into bare word tokens, safe to splice into a MATCH expression"""
+    return TOKEN_RE.findall(query.lower())[:10]
+
+
+def document_text(description):
+    return html.unescape(strip_tags(description or ''))
+
+
+class SQLiteSearchBackend:
+    """FTS5 virtual table keyed by Theme.id (rowid)"""
+
+    table = 'thememarket_app_theme_fts'
+
+    def create(self, cursor):
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+            f"title, category, description, tokenize='unicode61 remove_diacritics 2')"
+        )
+
+    def drop(self, cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+
+    def delete(self, cursor, ids):
+        cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [(pk,) for pk in ids])
+
+    def upsert(self, cursor, documents):
+        self.delete(cursor, [document[0] for document in documents])
+        cursor.executemany(
+            f'INSERT INTO {self.table} (rowid, title, category, description) VALUES (%s, %s, %s, %s)',
+            documents,
+        )
+
+    def match(self, cursor, terms, limit):
+        # Every term must match; the last one is a prefix so partial words still hit
+        expression = ' '.join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+        cursor.execute(
+            f'SELECT rowid, -bm25({self.table}, 10.0, 4.0, 1.0) FROM {self.table} '
+            f'WHERE {self.table} MATCH %s ORDER BY bm25({self.table}, 10.0, 4.0, 1.0) LIMIT %s',
+            [expression.strip(), limit],
+        )
+        return cursor.fetchall()
+
+
+class PostgresSearchBackend:
+    """Side table of weighted tsvectors with a GIN index"""
+
+    table = 'thememarket_app_theme_search'
+
+    def create(self, cursor):
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.table} ('
+            f'theme_id bigint PRIMARY KEY REFERENCES thememarket_app_theme (id) ON DELETE CASCADE, '
+            f'document tsvector NOT NULL)'
+        )
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {self.table}_gin ON {self.table} USING GIN (document)')
+
+    def drop(self, cursor):
+        cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+
+    def delete(self, cursor, ids):
+        cursor.execute(f'DELETE FROM {self.table} WHERE theme_id = ANY(%s)', [list(ids)])
+
+    def upsert(self, cursor, documents):
+        cursor.executemany(
+            f"INSERT INTO {self.table} (theme_id, document) VALUES (%s, "
+            f"setweight(to_tsvector('english', %s), 'A') || "
+            f"setweight(to_tsvector('english', %s), 'B') || "
+            f"setweight(to_tsvector('english', %s), 'C')) "
+            f"ON CONFLICT (theme_id) DO UPDATE SET document = EXCLUDED.document",
+            documents,
+        )
+
+    def match(self, cursor, terms, limit):
+        expression = ' & '.join(terms[:-1] + [f'{terms[-1]}:*'])
+        cursor.execute(
+            f"SELECT theme_id, ts_rank(document, query) FROM {self.table}, "
+            f"to_tsquery('english', %s) query WHERE document @@ query "
+            f"ORDER BY 2 DESC LIMIT %s",
+            [expression, limit],
+        )
+        return cursor.fetchall()
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend(conn=None):
+    """Search backend for a connection, or None when the database has no FTS support here"""
+    backend_class = BACKENDS.get((conn or connection).vendor)
+    return backend_class() if backend_class else None
+
+
+def theme_documents(queryset):
+    """(id, title, category name, stripped description) for each theme in batches"""
+    rows = queryset.values_list('id', 'title', 'category__name', 'description').order_by()
+    batch = []
+    for pk, title, category_name, description in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append((pk, title, category_name or '', document_text(description)))
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def index_themes(queryset):
+    """Write the search documents of the given themes"""
+    backend = get_backend()
+    if backend is None:
+        return 0
+    indexed = 0
+    with connection.cursor() as cursor:
+        for batch in theme_documents(queryset):
+            backend.upsert(cursor, batch)
+            indexed += len(batch)
+    return indexed
+
+
+def unindex_themes(ids):
+    backend = get_backend()
+    if backend is None:
+        return
+    with connection.cursor() as cursor:
+        backend.delete(cursor, ids)
+
+
+def rebuild_index():
+    backend = get_backend()
+    if backend is None:
+        return 0
+    with connection.cursor() as cursor:
+        backend.drop(cursor)
+        backend.create(cursor)
+    return index_themes(Theme.objects.all())
+
+
+def blended_scores(hits, candidates):
+    """
+    Blend text relevance with popularity and rating for (id, downloads, rating) rows.
+
+    Relevance and downloads are normalised against the best candidate so the
+    weights mean the same thing for common and rare terms.
+    """
+    best_relevance = max(hits.values()) or 1.0
+    most_downloads = math.log1p(max((downloads for _, downloads, _ in candidates), default=0)) or 1.0
+    return {
+        pk: 0.7 * hits[pk] / best_relevance
+        + 0.2 * math.log1p(max(downloads, 0)) / most_downloads
+        + 0.1 * float(rating) / 5
+        for pk, downloads, rating in candidates
+    }
+
+
+def search_themes(query, limit=20):
+    """
+    Themes matching query, best first, as [(theme, score)].
+
+    Candidates are ranked from bare (id, downloads, rating) rows; only the
+    `limit` themes returned are loaded as model instances.
+    """
+    terms = query_terms(query)
+    backend = get_backend()
+    if not terms or backend is None:
+        return []
+
+    with connection.cursor() as cursor:
+        hits = dict(backend.match(cursor, terms, CANDIDATE_LIMIT))
+    if not hits:
+        return []
+
+    candidates = list(Theme.objects.filter(id__in=hits).values_list('id', 'downloads', 'rating'))
+    scores = blended_scores(hits, candidates)
+    best = sorted(scores, key=lambda pk: (-scores[pk], pk))[:limit]
+    themes = Theme.objects.select_related('category').defer('description').in_bulk(best)
+    return [(themes[pk], scores[pk]) for pk in best if pk in themes]
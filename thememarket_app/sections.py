@@ -0,0 +1,117 @@
+from collections import namedtuple
+from types import MappingProxyType
+
+from .caching import versioned
+from .models import (
+    ContactInfo,
+    # Home Page Models
+    HeroBanner, HeroImage, CategorySection, FeaturedSection, PopularSection, NewSection,
+    WhyChooseSection, FeatureCard, NewsletterSection, TestimonialsSection, CustomerTestimonial,
+    # About Page Models
+    AboutHero, AboutMission, AboutValues, ValueItem, AboutTeam, TeamMember,
+    # Contact Page Models
+    ContactHero, ContactForm, ContactOffice,
+    # Themes Page Models
+    ThemesHero, ThemesFilter, ThemesGrid,
+    # Templates Page Models
+    TemplatesHero, HTMLTemplatesSection, UITemplatesSection,
+    # Other Page Models
+    LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent
+)
+
+SECTIONS_NAMESPACE = 'sections'
+
+# name: context variable, prefetch: inlines loaded alongside the section,
+# many: every active row ordered by 'order' instead of the first active one
+PageSection = namedtuple('PageSection', ['name', 'model', 'prefetch', 'many'])
+
+
+def section(name, model, prefetch=(), many=False):
+    return PageSection(name, model, tuple(prefetch), many)
+
+
+PAGE_SECTIONS = {
+    'home': (
+        section('hero_banner', HeroBanner, prefetch=['hero_images']),
+        section('category_section', CategorySection),
+        section('featured_section', FeaturedSection),
+        section('popular_section', PopularSection),
+        section('new_section', NewSection),
+        section('why_choose_section', WhyChooseSection, prefetch=['features']),
+        section('newsletter_section', NewsletterSection),
+        section('testimonials_section', TestimonialsSection, prefetch=['testimonials']),
+    ),
+    'about': (
+        section('about_hero', AboutHero),
+        section('about_mission', AboutMission),
+        section('about_values', AboutValues, prefetch=['values']),
+        section('about_team', AboutTeam, prefetch=['members']),
+    ),
+    'contact': (
+        section('contact_hero', ContactHero),
+        section('contact_form', ContactForm),
+        section('contact_office', ContactOffice),
+        section('contact_info', ContactInfo),
+    ),
+    'themes': (
+        section('themes_hero', ThemesHero),
+        section('themes_filter', ThemesFilter),
+        section('themes_grid', ThemesGrid),
+    ),
+    'template': (
+        section('templates_hero', TemplatesHero),
+        section('html_templates_section', HTMLTemplatesSection),
+        section('ui_templates_section', UITemplatesSection),
+    ),
+    'login': (section('login_contents', LoginPageContent, many=True),),
+    'cart': (section('cart_contents', CartPageContent, many=True),),
+    'checkout': (section('checkout_contents', CheckoutPageContent, many=True),),
+    'payment': (section('payment_contents', PaymentPageContent, many=True),),
+    'payment_success': (section('payment_success_contents', PaymentSuccessPageContent, many=True),),
+}
+
+# Inline models edited through the section admins
+SECTION_INLINE_MODELS = (HeroImage, FeatureCard, CustomerTestimonial, ValueItem, TeamMember)
+
+SECTION_MODELS = tuple(
+    {entry.model: None for entries in PAGE_SECTIONS.values() for entry in entries}
+) + SECTION_INLINE_MODELS
+
+
+def page_models(page):
+    """Section models a page renders, including the inlines prefetched with them"""
+    models = []
+    for entry in PAGE_SECTIONS[page]:
+        models.append(entry.model)
+        models.extend(entry.model._meta.get_field(name).related_model for name in entry.prefetch)
+    return tuple(models)
+
+
+def section_queryset(entry):
+    queryset = entry.model.objects.prefetch_related(*entry.prefetch)
+    if any(field.name == 'is_active' for field in entry.model._meta.fields):
+        queryset = queryset.filter(is_active=True)
+    if entry.many:
+        return queryset.order_by('order')
+    return queryset.order_by('pk')[:1]
+
+
+def load_sections(page):
+    """
+    Load every active section of a page.
+
+    Each section is its own model, so this runs one query per section model
+    plus one per prefetched inline model; rows in separate tables cannot be
+    fetched together through the ORM. get_page_sections() memoizes the
+    result, so only the first request after a change pays for them.
+    """
+    sections = {}
+    for entry in PAGE_SECTIONS[page]:
+        rows = tuple(section_queryset(entry))
+        sections[entry.name] = rows if entry.many else (rows[0] if rows else None)
+    return MappingProxyType(sections)
+
+
+def get_page_sections(page):
+    """Active sections of a page, cached in-process until any section model changes"""
+    return versioned(SECTIONS_NAMESPACE, page, lambda: load_sections(page))
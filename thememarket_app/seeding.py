@@ -0,0 +1,188 @@
+import json
+from pathlib import Path
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Q
+
+from .caching import bump_version
+from .catalog import catalog_loaded
+from .chrome import CHROME_MODELS, CHROME_NAMESPACE
+from .models import Category, Theme
+from .pagecache import invalidate_pages
+from .search import index_themes
+from .sections import SECTION_MODELS, SECTIONS_NAMESPACE
+
+DATASET_DIR = Path(__file__).resolve().parent / 'seeds'
+DEFAULT_DATASET = 'site'
+
+
+class SeedPlan:
+    """What applying one dataset entry would change: rows to create and rows to update"""
+
+    def __init__(self, model, key):
+        self.model = model
+        self.key = key
+        self.create = []
+        self.update = []
+        self.update_fields = set()
+        self.unchanged = 0
+        # dataset key -> pk, filled in once the rows exist
+        self.pks = {}
+        self.created_pks = []
+
+    def changed_pks(self):
+        return self.created_pks + [instance.pk for instance in self.update]
+
+
+def dataset_path(name):
+    path = Path(name)
+    return path if path.suffix else DATASET_DIR / f'{name}.json'
+
+
+def load_dataset(name):
+    """
+    The entries of a seed dataset file.
+
+    A dataset is a JSON list of {"model": "app_label.Model", "key": [...],
+    "rows": [...]} entries in dependency order. key names the fields that
+    identify a row; an empty key means the model holds a single row. A
+    foreign key value is the key of the referenced row, as a scalar for a
+    one-field key, a list otherwise, and [] for a single-row model.
+    """
+    path = dataset_path(name)
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError) as exc:
+        raise ImproperlyConfigured(f'Cannot read seed dataset {path}: {exc}')
+    for entry in entries:
+        entry['model'] = apps.get_model(entry['model'])
+        entry['key'] = tuple(entry.get('key', ()))
+    return entries
+
+
+def _as_key(value):
+    return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+
+def _resolve(model, row, plans):
+    """Declared field values with foreign keys swapped for the pk of the referenced row"""
+    values = {}
+    for name, value in row.items():
+        field = model._meta.get_field(name)
+        if field.many_to_one and value is not None:
+            target = plans.get(field.related_model)
+            if target is None:
+                raise ImproperlyConfigured(
+                    f'{model.__name__}.{name} refers to {field.related_model.__name__}, '
+                    f'which must come earlier in the dataset'
+                )
+            try:
+                values[field.attname] = target.pks[_as_key(value)]
+            except KeyError:
+                raise ImproperlyConfigured(f'{model.__name__}.{name}: no {field.related_model.__name__} with key {value!r}')
+        else:
+            values[field.attname] = field.to_python(value)
+    return values
+
+
+def _existing(model, key, rows):
+    """{key: instance} for the rows of model matching the dataset's keys"""
+    if not key:
+        instance = model.objects.order_by('pk').first()
+        return {(): instance} if instance else {}
+    first = model._meta.get_field(key[0]).attname
+    queryset = model.objects.filter(**{f'{first}__in': {row[first] for row in rows}})
+    attnames = [model._meta.get_field(name).attname for name in key]
+    return {tuple(getattr(instance, name) for name in attnames): instance for instance in queryset}
+
+
+def plan_entry(entry, plans, update):
+    """
+    Diff one dataset entry against the database.
+
+    Missing rows are always planned for creation. Rows that exist but differ
+    are only planned for update when update is true, so by default seeding
+    never overwrites what editors changed in the admin.
+    """
+    model, key = entry['model'], entry['key']
+    plan = SeedPlan(model, key)
+    attnames = [model._meta.get_field(name).attname for name in key]
+    rows = [_resolve(model, row, plans) for row in entry['rows']]
+    existing = _existing(model, key, rows)
+    for values in rows:
+        row_key = tuple(values[name] for name in attnames)
+        instance = existing.get(row_key)
+        if instance is None:
+            plan.create.append(model(**values))
+            continue
+        plan.pks[row_key] = instance.pk
+        changed = [name for name, value in values.items() if getattr(instance, name) != value]
+        if changed and update:
+            for name in changed:
+                setattr(instance, name, values[name])
+            plan.update.append(instance)
+            plan.update_fields.update(changed)
+        else:
+            plan.unchanged += 1
+    return plan
+
+
+def apply_plan(plan):
+    """Write a plan with one bulk_create and one bulk_update"""
+    created = plan.model.objects.bulk_create(plan.create)
+    attnames = [plan.model._meta.get_field(name).attname for name in plan.key]
+    if any(instance.pk is None for instance in created):
+        # Backends without RETURNING: read the new rows' pks back
+        created = _existing(plan.model, plan.key, [
+            {name: getattr(instance, name) for name in attnames} for instance in created
+        ]).values()
+    for instance in created:
+        plan.pks[tuple(getattr(instance, name) for name in attnames)] = instance.pk
+        plan.created_pks.append(instance.pk)
+    if plan.update:
+        plan.model.objects.bulk_update(plan.update, sorted(plan.update_fields))
+
+
+def seed(entries, update=False, dry_run=False):
+    """
+    Bring the database in line with dataset entries inside one transaction.
+
+    Returns the plans. bulk_create and bulk_update do not send model
+    signals, so the caches and derived data of every changed model are
+    refreshed once at the end.
+    """
+    plans = {}
+    with transaction.atomic():
+        for entry in entries:
+            plan = plan_entry(entry, plans, update)
+            # Applied even on a dry run: later entries need the pks of the rows this one creates
+            apply_plan(plan)
+            plans[plan.model] = plan
+        if dry_run:
+            transaction.set_rollback(True)
+    changed = {model: plan.changed_pks() for model, plan in plans.items() if plan.create or plan.update}
+    if changed and not dry_run:
+        models_changed(changed)
+    return list(plans.values())
+
+
+def models_changed(changed):
+    """
+    The invalidation the model signals would have done for rows written in bulk.
+
+    changed maps each model to the pks of its created or updated rows.
+    """
+    if changed.keys() & set(CHROME_MODELS):
+        bump_version(CHROME_NAMESPACE)
+    if changed.keys() & set(SECTION_MODELS):
+        bump_version(SECTIONS_NAMESPACE)
+    if changed.keys() & {Theme, Category}:
+        # A category's name is part of its themes' search documents
+        catalog_loaded(reindex=False)
+        index_themes(Theme.objects.filter(
+            Q(pk__in=changed.get(Theme, ())) | Q(category_id__in=changed.get(Category, ()))
+        ))
+    for model in changed:
+        invalidate_pages(model)
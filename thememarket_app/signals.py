@@ -0,0 +1,120 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+
+from .caching import bump_version
+from .chrome import CHROME_MODELS, CHROME_NAMESPACE
+from .counters import move_theme
+from .derivatives import IMAGE_FIELDS
+from .facets import CATALOG_NAMESPACE
+from .jobs import enqueue_images
+from .models import Category, Theme
+from .pagecache import invalidate_pages
+from .search import index_themes, unindex_themes
+from .sections import SECTION_MODELS, SECTIONS_NAMESPACE
+from . import suggest
+
+
+def invalidate_chrome(sender, **kwargs):
+    bump_version(CHROME_NAMESPACE)
+
+
+def invalidate_sections(sender, **kwargs):
+    bump_version(SECTIONS_NAMESPACE)
+
+
+def invalidate_catalog(sender, **kwargs):
+    bump_version(CATALOG_NAMESPACE)
+
+
+def remember_theme_bucket(sender, instance, **kwargs):
+    instance._counted_bucket = (
+        Theme.objects.filter(pk=instance.pk).values_list('category_id', 'theme_type').first()
+        if instance.pk else None
+    )
+
+
+def count_theme_saved(sender, instance, **kwargs):
+    move_theme(Category, getattr(instance, '_counted_bucket', None), (instance.category_id, instance.theme_type))
+    instance._counted_bucket = (instance.category_id, instance.theme_type)
+
+
+def count_theme_deleted(sender, instance, **kwargs):
+    move_theme(Category, (instance.category_id, instance.theme_type), None)
+
+
+def index_theme(sender, instance, **kwargs):
+    index_themes(Theme.objects.filter(pk=instance.pk))
+
+
+def unindex_theme(sender, instance, **kwargs):
+    unindex_themes([instance.pk])
+
+
+def suggest_theme_saved(sender, instance, **kwargs):
+    suggest.theme_changed(instance)
+
+
+def suggest_theme_deleted(sender, instance, **kwargs):
+    suggest.theme_removed(instance)
+
+
+def suggest_category_saved(sender, instance, **kwargs):
+    suggest.category_changed(instance)
+
+
+def suggest_category_deleted(sender, instance, **kwargs):
+    suggest.category_removed(instance)
+
+
+def remember_category_name(sender, instance, **kwargs):
+    instance._indexed_name = (
+        Category.objects.filter(pk=instance.pk).values_list('name', flat=True).first()
+        if instance.pk else None
+    )
+
+
+def reindex_category_themes(sender, instance, created, **kwargs):
+    # The category name is part of every theme document in it
+    if not created and getattr(instance, '_indexed_name', instance.name) != instance.name:
+        index_themes(Theme.objects.filter(category=instance))
+
+
+def queue_image_processing(sender, instance, **kwargs):
+    # Renditions are built by run_workers so uploads do not block the admin save
+    enqueue_images(instance)
+
+
+def purge_pages(sender, **kwargs):
+    invalidate_pages(sender)
+
+
+def _connect(receiver, models, label):
+    for model in models:
+        post_save.connect(receiver, sender=model, dispatch_uid=f'{label}_save_{model.__name__}')
+        post_delete.connect(receiver, sender=model, dispatch_uid=f'{label}_delete_{model.__name__}')
+
+
+def connect_signals():
+    """Wire cache invalidation, counters, search, suggestions and image renditions to model changes"""
+    _connect(invalidate_chrome, CHROME_MODELS, 'chrome')
+    _connect(invalidate_sections, SECTION_MODELS, 'sections')
+    _connect(invalidate_catalog, (Theme, Category), 'catalog')
+    # Every model: the page dependency map is only complete once the views are imported
+    post_save.connect(purge_pages, dispatch_uid='pages_save')
+    post_delete.connect(purge_pages, dispatch_uid='pages_delete')
+
+    pre_save.connect(remember_theme_bucket, sender=Theme, dispatch_uid='counters_theme_bucket')
+    post_save.connect(count_theme_saved, sender=Theme, dispatch_uid='counters_theme_saved')
+    post_delete.connect(count_theme_deleted, sender=Theme, dispatch_uid='counters_theme_deleted')
+
+    post_save.connect(index_theme, sender=Theme, dispatch_uid='search_index_theme')
+    post_delete.connect(unindex_theme, sender=Theme, dispatch_uid='search_unindex_theme')
+    pre_save.connect(remember_category_name, sender=Category, dispatch_uid='search_category_name')
+    post_save.connect(reindex_category_themes, sender=Category, dispatch_uid='search_reindex_category')
+
+    post_save.connect(suggest_theme_saved, sender=Theme, dispatch_uid='suggest_theme_saved')
+    post_delete.connect(suggest_theme_deleted, sender=Theme, dispatch_uid='suggest_theme_deleted')
+    post_save.connect(suggest_category_saved, sender=Category, dispatch_uid='suggest_category_saved')
+    post_delete.connect(suggest_category_deleted, sender=Category, dispatch_uid='suggest_category_deleted')
+
+    for model in IMAGE_FIELDS:
+        post_save.connect(queue_image_processing, sender=model, dispatch_uid=f'derivatives_{model.__name__}')
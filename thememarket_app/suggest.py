@@ -0,0 +1,274 @@
+import heapq
+import sys
+import unicodedata
+from bisect import bisect_left, insort
+from threading import RLock
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .caching import bump_version, get_version
+from .models import Category, Theme
+
+SUGGEST_NAMESPACE = 'suggest'
+
+THEME = 'theme'
+CATEGORY = 'category'
+KINDS = (THEME, CATEGORY)
+
+# Only the most downloaded themes are kept in memory so a worker's footprint
+# does not grow with the catalog; override with SUGGEST_MAX_THEMES
+DEFAULT_MAX_THEMES = 50000
+# Lookup results remembered until the next change
+MEMO_SIZE = 4096
+# Changes kept in the shared cache for other workers to replay; a worker
+# further behind than CHANGE_LOG_LENGTH rebuilds its index instead
+CHANGE_LOG_LENGTH = 500
+CHANGE_LOG_TIMEOUT = 60 * 60
+CHANGE_KEY_PREFIX = 'thememarket:suggest:change:'
+
+
+def normalize(text):
+    """Lowercase, strip accents and collapse everything but letters and digits to single spaces"""
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char if char.isalnum() else ' ' for char in text if not unicodedata.combining(char))
+    return ' '.join(text.split())
+
+
+def index_keys(label):
+    """The label itself plus every suffix starting at a word, so 'wor' finds 'Flatsome WordPress'"""
+    words = normalize(label).split()
+    return {' '.join(words[index:]) for index in range(len(words))}
+
+
+class PrefixIndex:
+    """
+    Per kind, a sorted array of (key, id) for bisect and the ids best first.
+
+    Items are kept in a dict alongside so updates can find and drop the keys
+    they own. The number of themes is capped; the least downloaded theme is
+    evicted when a new one is added at capacity.
+    """
+
+    def __init__(self, max_themes):
+        self.max_themes = max_themes
+        self.lock = RLock()
+        self.entries = {kind: [] for kind in KINDS}
+        self.ranked = {kind: [] for kind in KINDS}
+        self.items = {}
+        self.theme_heap = []
+        self.theme_count = 0
+        self.memo = {}
+        self.version = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, kind, pk, label, slug, weight):
+        with self.lock:
+            self.remove(kind, pk)
+            if kind == THEME and self.theme_count >= self.max_themes:
+                if not self._evict_below(weight):
+                    return
+            keys = index_keys(label)
+            self.items[(kind, pk)] = (label, slug, weight, keys)
+            for key in keys:
+                insort(self.entries[kind], (key, pk))
+            insort(self.ranked[kind], (-weight, pk))
+            if kind == THEME:
+                self.theme_count += 1
+                heapq.heappush(self.theme_heap, (weight, pk))
+            self.memo = {}
+
+    def load(self, kind, rows):
+        """Bulk-add (id, label, slug, weight) rows to an empty index with a single sort"""
+        with self.lock:
+            entries, ranked = self.entries[kind], self.ranked[kind]
+            for pk, label, slug, weight in rows:
+                keys = index_keys(label)
+                self.items[(kind, pk)] = (label, slug, weight, keys)
+                entries.extend((key, pk) for key in keys)
+                ranked.append((-weight, pk))
+                if kind == THEME:
+                    self.theme_count += 1
+                    self.theme_heap.append((weight, pk))
+            entries.sort()
+            ranked.sort()
+            heapq.heapify(self.theme_heap)
+            self.memo = {}
+
+    def remove(self, kind, pk):
+        with self.lock:
+            item = self.items.pop((kind, pk), None)
+            if item is None:
+                return
+            if kind == THEME:
+                self.theme_count -= 1
+            self.memo = {}
+            entries, ranked = self.entries[kind], self.ranked[kind]
+            for key in item[3]:
+                position = bisect_left(entries, (key, pk))
+                if position < len(entries) and entries[position] == (key, pk):
+                    del entries[position]
+            position = bisect_left(ranked, (-item[2], pk))
+            if position < len(ranked) and ranked[position] == (-item[2], pk):
+                del ranked[position]
+
+    def _evict_below(self, weight):
+        """Drop the least downloaded live theme if it ranks below weight"""
+        while self.theme_heap:
+            lowest, pk = self.theme_heap[0]
+            item = self.items.get((THEME, pk))
+            if item is None or item[2] != lowest:
+                heapq.heappop(self.theme_heap)
+                continue
+            if lowest >= weight:
+                return False
+            heapq.heappop(self.theme_heap)
+            self.remove(THEME, pk)
+            return True
+        return True
+
+    def _best(self, kind, prefix, limit):
+        entries, ranked, items = self.entries[kind], self.ranked[kind], self.items
+        start = bisect_left(entries, (prefix,))
+        matched = bisect_left(entries, (prefix + chr(sys.maxunicode),), start) - start
+        if not matched:
+            return []
+        # Walking the matching keys takes `matched` steps; walking the items best
+        # first stops after about limit * len(ranked) / matched. Take the shorter
+        if matched * matched <= limit * len(ranked):
+            found = {pk: items[(kind, pk)][2] for _, pk in entries[start:start + matched]}
+            return [pk for pk, _ in heapq.nlargest(limit, found.items(), key=lambda entry: (entry[1], -entry[0]))]
+        best = []
+        for _, pk in ranked:
+            if any(key.startswith(prefix) for key in items[(kind, pk)][3]):
+                best.append(pk)
+                if len(best) == limit:
+                    break
+        return best
+
+    def lookup(self, prefix, limit):
+        """Best `limit` items of each kind whose keys start with prefix"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return {THEME: [], CATEGORY: []}
+
+        # Every prefix is remembered until the next change, and a hit skips the lock
+        result = self.memo.get((prefix, limit))
+        if result is not None:
+            return result
+        with self.lock:
+            result = {
+                kind: [
+                    {'id': pk, 'label': self.items[(kind, pk)][0], 'slug': self.items[(kind, pk)][1]}
+                    for pk in self._best(kind, prefix, limit)
+                ]
+                for kind in KINDS
+            }
+            if len(self.memo) >= MEMO_SIZE:
+                self.memo = {}
+            self.memo[(prefix, limit)] = result
+        return result
+
+
+_index = None
+_index_lock = RLock()
+
+
+def build_index():
+    index = PrefixIndex(getattr(settings, 'SUGGEST_MAX_THEMES', DEFAULT_MAX_THEMES))
+    version = get_version(SUGGEST_NAMESPACE)
+    index.load(CATEGORY, (
+        (pk, name, slug, float('inf')) for pk, name, slug in Category.objects.values_list('id', 'name', 'slug')
+    ))
+    themes = Theme.objects.order_by('-downloads').values_list('id', 'title', 'slug', 'downloads')
+    index.load(THEME, themes[:index.max_themes].iterator(chunk_size=2000))
+    index.version = version
+    return index
+
+
+def change_key(version):
+    return f'{CHANGE_KEY_PREFIX}{version}'
+
+
+def replay(index, change):
+    action, kind, *args = change
+    if action == 'add':
+        index.add(kind, *args)
+    else:
+        index.remove(kind, *args)
+
+
+def catch_up(index, version):
+    """
+    Replay the changes other workers logged since the index was built.
+
+    Returns False when some have expired from the log or were never logged
+    (a bulk import), and the index has to be rebuilt.
+    """
+    if index.version >= version:
+        return True
+    behind = version - index.version
+    if behind > CHANGE_LOG_LENGTH:
+        return False
+    keys = [change_key(index.version + step) for step in range(1, behind + 1)]
+    changes = cache.get_many(keys)
+    if len(changes) < behind:
+        return False
+    for key in keys:
+        replay(index, changes[key])
+    index.version = version
+    return True
+
+
+def get_index():
+    """
+    The worker's prefix index, kept up to date with other workers' changes.
+
+    Lookups keep using the outdated index while one thread replays the
+    changes, or rebuilds it when they are no longer all in the log.
+    """
+    global _index
+    version = get_version(SUGGEST_NAMESPACE)
+    index = _index
+    if index is not None and index.version >= version:
+        return index
+    if not _index_lock.acquire(blocking=index is None):
+        return index
+    try:
+        if _index is None or not catch_up(_index, version):
+            _index = build_index()
+        return _index
+    finally:
+        _index_lock.release()
+
+
+def suggest(prefix, limit=8):
+    return get_index().lookup(prefix, limit)
+
+
+def _apply(change):
+    """Apply a change to this worker's index and log it for the other workers to replay"""
+    with _index_lock:
+        version = bump_version(SUGGEST_NAMESPACE)
+        cache.set(change_key(version), change, CHANGE_LOG_TIMEOUT)
+        if _index is not None and _index.version == version - 1:
+            replay(_index, change)
+            _index.version = version
+
+
+def theme_changed(theme):
+    _apply(('add', THEME, theme.pk, theme.title, theme.slug, theme.downloads))
+
+
+def theme_removed(theme):
+    _apply(('remove', THEME, theme.pk))
+
+
+def category_changed(category):
+    _apply(('add', CATEGORY, category.pk, category.name, category.slug, float('inf')))
+
+
+def category_removed(category):
+    _apply(('remove', CATEGORY, category.pk))
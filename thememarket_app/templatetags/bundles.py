@@ -0,0 +1,41 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import mark_safe
+
+from thememarket_app.bundles import bundle_content, bundle_path
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle(name):
+    """<link> or <script> tag for a built CSS/JS bundle"""
+    url = static(bundle_path(name))
+    if name.endswith('.css'):
+        return format_html('<link rel="stylesheet" href="{}">', url)
+    return format_html('<script src="{}"></script>', url)
+
+
+@register.simple_tag
+def page_styles(*names):
+    """
+    Stylesheets for a page's CSS bundles.
+
+    Once build_bundles has produced critical CSS for the page, that is inlined
+    and the full bundles load without blocking first paint.
+    """
+    urls = [static(bundle_path(name)) for name in names]
+    blocking = format_html_join('', '<link rel="stylesheet" href="{}">', ((url,) for url in urls))
+    critical = bundle_content(names[-1].replace('.css', '.critical.css'))
+    if critical is None:
+        return blocking
+    return format_html(
+        '<style>{}</style>{}<noscript>{}</noscript>',
+        mark_safe(critical),
+        format_html_join(
+            '', '<link rel="preload" as="style" href="{}" onload="this.onload=null;this.rel=\'stylesheet\'">',
+            ((url,) for url in urls),
+        ),
+        blocking,
+    )
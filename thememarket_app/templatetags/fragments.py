@@ -0,0 +1,14 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from thememarket_app.fragments import FRAGMENTS, marker
+
+register = template.Library()
+
+
+@register.simple_tag
+def user_fragment(name):
+    """Punch a hole for a per-user fragment; FragmentMiddleware fills it per request"""
+    if name not in FRAGMENTS:
+        raise template.TemplateSyntaxError(f'Unknown fragment {name!r}')
+    return mark_safe(marker(name))
@@ -0,0 +1,48 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+
+from thememarket_app.derivatives import get_manifest, rendition_path
+
+register = template.Library()
+
+DEFAULT_SIZES = '(max-width: 768px) 100vw, 400px'
+
+
+def _srcset(manifest, extension):
+    return ', '.join(
+        f'{default_storage.url(rendition_path(manifest["hash"], width, extension))} {width}w'
+        for width in manifest['widths']
+    )
+
+
+@register.simple_tag
+def responsive_image(field_file, alt='', sizes=DEFAULT_SIZES, css_class='', loading='lazy'):
+    """
+    <picture> with WebP and JPEG/PNG srcsets for a processed image.
+
+    Falls back to a plain <img> of the original upload until its renditions exist.
+    """
+    if not field_file:
+        return ''
+    attributes = [('alt', alt), ('loading', loading)]
+    if css_class:
+        attributes.append(('class', css_class))
+
+    manifest = get_manifest(field_file)
+    if manifest is None:
+        return format_html(
+            '<img src="{}"{}>', field_file.url,
+            format_html_join('', ' {}="{}"', attributes),
+        )
+
+    fallback_width = manifest['widths'][-1]
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}"{}></picture>',
+        _srcset(manifest, 'webp'), sizes,
+        default_storage.url(rendition_path(manifest['hash'], fallback_width, manifest['fallback'])),
+        _srcset(manifest, manifest['fallback']), sizes,
+        manifest['width'], manifest['height'],
+        format_html_join('', ' {}="{}"', attributes),
+    )
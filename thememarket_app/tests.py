@@ -0,0 +1,836 @@
+import base64
+import csv
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import bundles, urls
+from .admin_groups import admin_site
+from .benchmark import compare
+from .caching import LEASE_WAIT, cache_is_shared, cached, get_version
+from .checks import check_shared_cache
+from .counters import COUNTER_FIELDS, move_theme, recount_categories
+from .critical import extract_critical_css
+from .derivatives import process_image, rendition_path
+from .exports import export_rows
+from .facets import PRICE_BANDS, filter_themes, get_facets
+from .imports import ThemeImporter, read_rows
+from .jobs import HANDLERS, complete, requeue_running
+from .pagecache import page_key, page_namespace
+from .pagination import InvalidCursor, KeysetPaginator
+from .precompressed import PrecompressedStaticApp
+from .models import (
+    BackgroundJob, Category, Theme, ThemeImage, FooterSection, FooterLink, NavigationMenu,
+    LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent,
+)
+from .search import rebuild_index, search_themes
+from .seeding import load_dataset, seed
+from .suggest import SUGGEST_NAMESPACE, THEME, PrefixIndex, build_index, catch_up, change_key
+from .templatetags.responsive_images import responsive_image
+
+CATALOG_THEMES = 240
+
+# url name: (query string, max queries on a cold cache, max response bytes)
+STOREFRONT_BUDGETS = {
+    'home': ('', 18, 60_000),
+    'about': ('', 10, 30_000),
+    'contact': ('', 10, 30_000),
+    # A full grid page of real theme cards with responsive image markup
+    'themes': ('', 12, 70_000),
+    'theme_search': ('q=theme', 3, 10_000),
+    'suggest': ('q=th', 3, 2_000),
+    'fragments': ('', 2, 3_000),
+    'template': ('', 9, 32_000),
+    'login': ('', 7, 4_000),
+    'cart': ('', 7, 25_000),
+    'checkout': ('', 7, 27_000),
+    'payment': ('', 7, 27_000),
+    'payment_success': ('', 7, 24_000),
+}
+# Changelists are uncached; their cost must not grow with the number of rows
+ADMIN_QUERY_BUDGET = 12
+
+
+def seed_catalog():
+    """The repo's seed data plus enough themes to fill several listing pages"""
+    call_command('seed', stdout=StringIO())
+
+    categories = list(Category.objects.all())
+    types = [value for value, _ in Theme.THEME_TYPES]
+    Theme.objects.bulk_create([
+        Theme(
+            title=f'Catalog Theme {number}',
+            slug=f'catalog-theme-{number}',
+            description=f'<p>Theme number {number} with a <strong>responsive</strong> layout.</p>',
+            category=categories[number % len(categories)],
+            theme_type=types[number % len(types)],
+            price=Decimal(number % 90),
+            rating=Decimal(number % 5) + Decimal('0.5'),
+            downloads=(number * 7919) % 50_000,
+            is_featured=number % 11 == 0,
+            is_popular=number % 13 == 0,
+            is_new=number % 17 == 0,
+        )
+        for number in range(CATALOG_THEMES)
+    ])
+    recount_categories(Category, Theme)
+    rebuild_index()
+
+    # Inactive footer links must be filtered in the query, not in the template
+    for section in FooterSection.objects.all():
+        FooterLink.objects.bulk_create([
+            FooterLink(section=section, title=f'Link {order}', url='#', order=order, is_active=order % 3 != 0)
+            for order in range(6)
+        ])
+
+    for model in (LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent):
+        for order, (section_type, label) in enumerate(model.SECTION_TYPES):
+            model.objects.get_or_create(section_type=section_type, defaults={'title': label, 'order': order})
+
+
+class BundleBuildMixin:
+    """Build the CSS/JS bundles into a scratch static dir so templates can link them"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_dir = tempfile.mkdtemp()
+        cls.enterClassContext(override_settings(STATICFILES_DIRS=[cls.static_dir]))
+        bundles.build_bundles()
+
+    @classmethod
+    def tearDownClass(cls):
+        bundles.write_manifest({})
+        shutil.rmtree(cls.static_dir, ignore_errors=True)
+        super().tearDownClass()
+
+
+class QueryBudgetMixin:
+    def assertWithinBudget(self, client, path, max_queries, max_bytes=None):
+        """Request path and fail with the SQL it ran if it is over its query or size budget"""
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path)
+        self.assertEqual(response.status_code, 200, path)
+        if len(queries) > max_queries:
+            statements = '\n'.join(f'  {query["sql"]}' for query in queries.captured_queries)
+            self.fail(f'{path} ran {len(queries)} queries, budget is {max_queries}:\n{statements}')
+        if max_bytes is not None:
+            self.assertLessEqual(
+                len(response.content), max_bytes,
+                f'{path} rendered {len(response.content):,} bytes, budget is {max_bytes:,}',
+            )
+        return response
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class StorefrontBudgetTests(BundleBuildMixin, QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog()
+
+    def setUp(self):
+        cache.clear()
+
+    def url(self, name):
+        query = STOREFRONT_BUDGETS[name][0]
+        return reverse(name) + (f'?{query}' if query else '')
+
+    def test_every_url_has_a_budget(self):
+        names = {pattern.name for pattern in urls.urlpatterns if isinstance(pattern, URLPattern)}
+        self.assertEqual(names - set(STOREFRONT_BUDGETS), set())
+
+    def test_cold_cache_budgets(self):
+        for name, (_, max_queries, max_bytes) in STOREFRONT_BUDGETS.items():
+            with self.subTest(name):
+                cache.clear()
+                self.assertWithinBudget(self.client, self.url(name), max_queries, max_bytes)
+
+    def test_filtered_and_paged_themes(self):
+        category = Category.objects.order_by('-theme_count').first()
+        self.assertWithinBudget(self.client, f'{reverse("themes")}?category={category.slug}&type=html', 12)
+        self.assertWithinBudget(self.client, f'{reverse("themes")}?rating=4&price=free', 12)
+        # A quarter of the catalog is html, several pages' worth
+        response = self.assertWithinBudget(self.client, f'{reverse("themes")}?type=html', 12)
+        next_page = response.context['next_page_url']
+        self.assertIsNotNone(next_page)
+        second = self.assertWithinBudget(self.client, next_page, 12)
+        self.assertIsNotNone(second.context['previous_page_url'])
+        self.assertFalse({theme.pk for theme in response.context['themes']} & {theme.pk for theme in second.context['themes']})
+
+    def test_pager_links_drop_undeclared_params(self):
+        response = self.client.get(f'{reverse("themes")}?type=html&utm_source=mail&fbclid=abc')
+        next_page = response.context['next_page_url']
+        self.assertIn('type=html', next_page)
+        self.assertNotIn('utm_source', next_page)
+        self.assertNotIn('fbclid', next_page)
+        self.assertNotContains(self.client.get(f'{reverse("themes")}?type=html'), 'utm_source')
+
+    def test_facet_sidebar_submits_server_filters(self):
+        response = self.client.get(f'{reverse("themes")}?type=html')
+        self.assertContains(response, f'<form method="get" action="{reverse("themes")}" id="facet-form">')
+        self.assertContains(response, 'name="type" value="html" checked')
+        themes = list(response.context['themes'])
+        self.assertTrue(themes)
+        self.assertEqual({theme.theme_type for theme in themes}, {'html'})
+        self.assertContains(response, 'class="theme-card"', count=len(themes))
+
+    def test_warm_pages_skip_the_database(self):
+        for name in ('home', 'about', 'contact', 'themes', 'template', 'cart', 'checkout', 'payment', 'payment_success'):
+            with self.subTest(name):
+                self.client.get(self.url(name))
+                response = self.assertWithinBudget(self.client, self.url(name), 0)
+                self.assertEqual(response['X-Page-Cache'], 'hit')
+
+    def test_logged_in_pages_use_the_shared_shell(self):
+        self.client.get(self.url('home'))
+        self.client.force_login(User.objects.create_user('shopper'))
+        # Session and user lookups only
+        response = self.assertWithinBudget(self.client, self.url('home'), 2)
+        self.assertEqual(response['X-Page-Cache'], 'hit')
+        self.assertContains(response, 'SH')
+
+    def test_conditional_requests_are_answered_without_rendering(self):
+        etag = self.client.get(self.url('home'))['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 0)
+
+        Theme.objects.filter(is_featured=True).first().save()
+        self.assertEqual(self.client.get(self.url('home'), HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+    def test_encoded_query_values_get_their_own_page_cache_entry(self):
+        category = Category.objects.filter(html_count__gt=0).first()
+        factory = RequestFactory()
+        params = ('category', 'type')
+        smuggled = factory.get(reverse('themes'), {'category': f'{category.slug}&type=html'})
+        real = factory.get(reverse('themes'), {'category': category.slug, 'type': 'html'})
+        self.assertNotEqual(page_key(smuggled, params), page_key(real, params))
+
+        self.assertContains(self.client.get(f'{reverse("themes")}?category={category.slug}%26type%3Dhtml'), 'no-themes')
+        response = self.client.get(f'{reverse("themes")}?category={category.slug}&type=html')
+        self.assertEqual(response['X-Page-Cache'], 'miss')
+        self.assertNotContains(response, 'no-themes')
+
+    def test_saves_purge_only_the_pages_that_show_the_model(self):
+        for name in ('themes', 'about'):
+            self.client.get(self.url(name))
+        Theme.objects.first().save()
+        self.assertEqual(self.client.get(self.url('themes'))['X-Page-Cache'], 'miss')
+        self.assertEqual(self.client.get(self.url('about'))['X-Page-Cache'], 'hit')
+
+    def test_server_timing_reports_the_queries_run(self):
+        for name in ('themes', 'about'):
+            with self.subTest(name), CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url(name))
+            self.assertIn(f'desc="{len(queries)} queries"', response['Server-Timing'])
+            self.assertIn('total;dur=', response['Server-Timing'])
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class AdminChangelistBudgetTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog()
+        cls.admin = User.objects.create_superuser('budget-admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelist_budgets(self):
+        for model in admin_site._registry:
+            url = reverse(f'{admin_site.name}:{model._meta.app_label}_{model._meta.model_name}_changelist')
+            with self.subTest(model._meta.label):
+                self.assertWithinBudget(self.client, url, ADMIN_QUERY_BUDGET)
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class SearchTests(BundleBuildMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Creative', slug='creative')
+        for slug, title, description, downloads in (
+            ('aurora-portfolio', 'Aurora Portfolio', '<p>A clean layout</p>', 10),
+            ('portfolio-pro', 'Portfolio Pro', '<p>For studios</p>', 5_000),
+            ('shop-starter', 'Shop Starter', '<p>Sell next to your portfolio</p>', 100_000),
+            ('blog-basic', 'Blog Basic', '<p>Just words</p>', 50_000),
+        ):
+            Theme.objects.create(
+                title=title, slug=slug, description=description, category=category, price=1, downloads=downloads,
+            )
+
+    def slugs(self, query):
+        return [theme.slug for theme, _ in search_themes(query)]
+
+    def test_title_matches_rank_first_then_popularity(self):
+        self.assertEqual(self.slugs('portfolio'), ['portfolio-pro', 'aurora-portfolio', 'shop-starter'])
+        self.assertEqual(self.slugs('Portf'), ['portfolio-pro', 'aurora-portfolio', 'shop-starter'])
+        self.assertEqual(self.slugs('portfolio pro'), ['portfolio-pro'])
+        self.assertEqual([theme.slug for theme, _ in search_themes('portfolio', limit=1)], ['portfolio-pro'])
+
+    def test_empty_and_punctuation_only_queries(self):
+        for query in ('', '   ', '"', '*', '!!! ---', '") OR ("'):
+            with self.subTest(query):
+                self.assertEqual(search_themes(query), [])
+                response = self.client.get(reverse('theme_search'), {'q': query})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()['results'], [])
+
+    def test_browsers_get_a_results_page(self):
+        response = self.client.get(reverse('theme_search'), {'q': 'portfolio'}, HTTP_ACCEPT='text/html,*/*;q=0.8')
+        self.assertEqual(response['Content-Type'], 'text/html; charset=utf-8')
+        self.assertContains(response, 'class="theme-card"', count=3)
+        self.assertContains(response, 'value="portfolio"')
+        self.assertIn('Accept', response['Vary'])
+
+    def test_search_boxes_submit_to_search_and_suggest(self):
+        for name in ('home', 'themes'):
+            with self.subTest(name):
+                response = self.client.get(reverse(name))
+                self.assertContains(response, f'action="{reverse("theme_search")}"')
+                self.assertContains(response, f'data-suggest-url="{reverse("suggest")}"')
+
+
+class BundleTests(TestCase):
+    def setUp(self):
+        static_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_dir)
+        self.enterContext(override_settings(STATICFILES_DIRS=[static_dir]))
+        bundles.output_root().mkdir(parents=True)
+
+    def test_names_follow_content_and_superseded_files_go(self):
+        first = bundles.write_bundle('home.css', b'body{color:red}')
+        self.assertEqual(bundles.write_bundle('home.css', b'body{color:red}'), first)
+        second = bundles.write_bundle('home.css', b'body{color:blue}')
+        self.assertNotEqual(second, first)
+        self.assertEqual([path.name for path in bundles.output_root().iterdir()], [Path(second).name])
+
+
+class CriticalCSSTests(TestCase):
+    def test_keeps_only_rules_painted_above_the_fold(self):
+        html = (
+            '<html><body><header class="nav"></header><section class="hero"><h1>Hi</h1></section>'
+            '<section class="grid"></section><footer class="footer"></footer><script></script></body></html>'
+        )
+        css = (
+            '.nav{color:red}.hero h1,.footer{animation:pop 1s}.footer a{color:blue}'
+            '.nav:hover{color:green}@media (max-width:768px){.hero{padding:0}.footer{margin:0}}'
+            '@keyframes pop{to{opacity:1}}@keyframes unused{to{opacity:0}}'
+        )
+        critical = extract_critical_css(html, css)
+        self.assertEqual(
+            critical,
+            '.nav{color:red}.hero h1{animation:pop 1s}.nav:hover{color:green}'
+            '@media (max-width:768px){.hero{padding:0}}@keyframes pop{to{opacity:1}}',
+        )
+
+
+class FacetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_match_the_filtered_themes(self):
+        category = Category.objects.filter(html_count__gt=0).first()
+        filter_sets = (
+            {}, {'category': category.slug}, {'type': 'html'}, {'price': 'free', 'rating': 4},
+            {'category': category.slug, 'type': 'html', 'price': 'over50'},
+        )
+        for filters in filter_sets:
+            with self.subTest(filters):
+                facets = get_facets(filters)
+                self.assertEqual(facets['total'], filter_themes(Theme.objects.all(), filters).count())
+                categories = [(slug,) for slug in Category.objects.values_list('slug', flat=True)]
+                for name, values in (
+                    ('category', categories), ('type', Theme.THEME_TYPES), ('price', PRICE_BANDS), ('rating', [(3,), (4,), (5,)]),
+                ):
+                    others = {key: value for key, value in filters.items() if key != name}
+                    for value, *_ in values:
+                        expected = filter_themes(Theme.objects.all(), {**others, name: value}).count()
+                        self.assertEqual(facets[name].get(value, 0), expected, (name, value))
+
+    def test_encoded_values_get_their_own_cache_entry(self):
+        category = Category.objects.filter(html_count__gt=0).first()
+        self.assertEqual(get_facets({'category': f'{category.slug}&type=html'})['total'], 0)
+        self.assertEqual(get_facets({'category': category.slug, 'type': 'html'})['total'], category.html_count)
+
+
+class CachedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_waiters_stop_when_the_lease_is_released_without_a_value(self):
+        # Another worker holds the lease on a cold key and its builder returns None
+        cache.add('thememarket:tests:uncacheable:lease', 1, 30)
+        calls, results = [], []
+
+        def builder():
+            calls.append(1)
+            return None
+
+        waiter = threading.Thread(target=lambda: results.append(cached('tests', 'uncacheable', builder)))
+        started = time.monotonic()
+        waiter.start()
+        time.sleep(0.2)
+        cache.delete('thememarket:tests:uncacheable:lease')
+        waiter.join(LEASE_WAIT * 2)
+        self.assertLess(time.monotonic() - started, LEASE_WAIT / 2)
+        self.assertEqual((results, len(calls)), ([None], 1))
+
+    def test_waiters_pick_up_the_value_the_holder_stored(self):
+        def slow_builder():
+            time.sleep(0.3)
+            return 'built'
+
+        results = []
+        holder = threading.Thread(target=lambda: results.append(cached('tests', 'slow', slow_builder)))
+        holder.start()
+        time.sleep(0.1)
+        self.assertEqual(cached('tests', 'slow', lambda: 'rebuilt'), 'built')
+        holder.join()
+        self.assertEqual(results, ['built'])
+
+
+class SuggestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_lookups_rank_like_a_full_scan(self):
+        index = PrefixIndex(max_themes=500)
+        titles = ['Theme Shop', 'Theme Blog', 'Portfolio Theme', 'Shopfront', 'Blog Pro']
+        index.load(THEME, ((pk, f'{titles[pk % 5]} {pk}', f'theme-{pk}', pk * 37 % 101) for pk in range(500)))
+        for prefix in ('t', 'theme', 'shop', 'blog p', 'port', '42', 'nothing'):
+            for limit in (1, 8):
+                expected = sorted(
+                    (-weight, pk) for (_, pk), (_, _, weight, keys) in index.items.items()
+                    if any(key.startswith(prefix) for key in keys)
+                )[:limit]
+                found = index.lookup(prefix, limit)[THEME]
+                self.assertEqual([item['id'] for item in found], [pk for _, pk in expected], (prefix, limit))
+
+    def test_other_workers_replay_changes_instead_of_rebuilding(self):
+        category = Category.objects.create(name='Blog', slug='blog')
+        other = build_index()
+        theme = Theme.objects.create(
+            title='Quillpress', slug='quillpress', description='', category=category, price=1,
+        )
+        self.assertTrue(catch_up(other, get_version(SUGGEST_NAMESPACE)))
+        self.assertEqual([item['slug'] for item in other.lookup('quill', 8)[THEME]], ['quillpress'])
+
+        theme.delete()
+        cache.delete(change_key(get_version(SUGGEST_NAMESPACE)))
+        self.assertFalse(catch_up(other, get_version(SUGGEST_NAMESPACE)))
+
+
+def crash_job():
+    os._exit(1)
+
+
+def echo_job(**payload):
+    return payload
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        cache.clear()
+        buffer = BytesIO()
+        Image.new('RGB', (1000, 600), 'teal').save(buffer, 'JPEG')
+        self.name = default_storage.save('themes/shot.jpg', ContentFile(buffer.getvalue()))
+        self.image = Theme(image=self.name).image
+
+    def test_renditions_replace_the_plain_image_once_processed(self):
+        self.assertTrue(responsive_image(self.image).startswith('<img src="'))
+
+        result = process_image(self.name)
+        renditions = result['renditions']
+        self.assertTrue(result['changed'])
+        self.assertEqual((renditions['widths'], renditions['fallback']), ([320, 640, 960, 1000], 'jpg'))
+        for width in renditions['widths']:
+            for extension in ('webp', 'jpg'):
+                self.assertTrue(default_storage.exists(rendition_path(renditions['hash'], width, extension)))
+
+        markup = responsive_image(self.image, alt='Shot')
+        self.assertTrue(markup.startswith('<picture><source type="image/webp"'))
+        self.assertIn('width="1000" height="600"', markup)
+        self.assertFalse(process_image(self.name)['changed'])
+
+
+class RunWorkersTests(TestCase):
+    def setUp(self):
+        HANDLERS.update(crash=crash_job, echo=echo_job)
+        self.addCleanup(HANDLERS.pop, 'crash')
+        self.addCleanup(HANDLERS.pop, 'echo')
+
+    def test_a_dead_worker_is_recorded_and_the_pool_restarted(self):
+        poison = BackgroundJob.objects.create(kind='crash', max_attempts=1)
+        # Claimed in the same batch as the poison job, so it is lost with the worker
+        bystander = BackgroundJob.objects.create(kind='echo', payload={'n': 1})
+        later = [BackgroundJob.objects.create(kind='echo', payload={'n': n}) for n in (2, 3)]
+
+        out = StringIO()
+        call_command('run_workers', processes=1, once=True, stdout=out)
+
+        poison.refresh_from_db()
+        self.assertEqual((poison.status, poison.attempts), (BackgroundJob.FAILED, 1))
+        bystander.refresh_from_db()
+        self.assertEqual((bystander.status, bystander.attempts), (BackgroundJob.PENDING, 1))
+        for job in later:
+            job.refresh_from_db()
+            self.assertEqual(job.status, BackgroundJob.DONE)
+        self.assertIn('Restarted 1 worker processes', out.getvalue())
+
+    def test_spawned_workers_set_django_up(self):
+        job = BackgroundJob.objects.create(kind='image', payload={'name': 'missing/upload.png'}, max_attempts=1)
+        call_command('run_workers', processes=1, once=True, start_method='spawn', stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.FAILED)
+        self.assertNotIn('AppRegistryNotReady', job.last_error)
+        self.assertIn('FileNotFoundError', job.last_error)
+
+    def test_finished_image_jobs_purge_only_pages_showing_the_image(self):
+        category = Category.objects.create(name='Blog', slug='blog')
+        Theme.objects.create(title='Pic', slug='pic', description='', category=category, price=1, image='themes/pic.png')
+        versions = lambda: {page: get_version(page_namespace(page)) for page in ('themes', 'about')}
+
+        before = versions()
+        complete(BackgroundJob.objects.create(kind='image', payload={'name': 'themes/pic.png'}), {'changed': False})
+        self.assertEqual(versions(), before)
+
+        complete(BackgroundJob.objects.create(kind='image', payload={'name': 'themes/pic.png'}), {'changed': True})
+        after = versions()
+        self.assertNotEqual(after['themes'], before['themes'])
+        self.assertEqual(after['about'], before['about'])
+
+    def test_only_running_jobs_past_their_lease_are_requeued(self):
+        now = timezone.now()
+        live = BackgroundJob.objects.create(kind='echo', status=BackgroundJob.RUNNING, started_at=now - timedelta(seconds=30))
+        lost = BackgroundJob.objects.create(kind='echo', status=BackgroundJob.RUNNING, started_at=now - timedelta(hours=1))
+        self.assertEqual(requeue_running(lease=600), 1)
+        live.refresh_from_db()
+        lost.refresh_from_db()
+        self.assertEqual((live.status, lost.status), (BackgroundJob.RUNNING, BackgroundJob.PENDING))
+
+
+class WarmCachesTests(TestCase):
+    def test_refuses_a_per_process_cache(self):
+        with self.assertRaisesMessage(CommandError, 'LocMemCache'):
+            call_command('warm_caches', stdout=StringIO())
+
+    def test_detects_shared_backends(self):
+        self.assertFalse(cache_is_shared())
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}}
+        with override_settings(CACHES=shared):
+            self.assertTrue(cache_is_shared())
+
+    def test_check_refuses_a_per_process_cache_for_several_workers(self):
+        self.assertEqual(check_shared_cache(None), [])
+        with override_settings(WEB_WORKERS=4):
+            self.assertEqual([error.id for error in check_shared_cache(None)], ['thememarket.E001'])
+
+
+class CategoryCounterTests(TestCase):
+    def setUp(self):
+        self.blog = Category.objects.create(name='Blog', slug='blog')
+        self.shop = Category.objects.create(name='Shop', slug='shop')
+
+    def add_theme(self, slug, category, theme_type='wordpress'):
+        return Theme.objects.create(
+            title=slug, slug=slug, description='', category=category, theme_type=theme_type, price=1,
+        )
+
+    def counters(self, category):
+        return Category.objects.values_list(*COUNTER_FIELDS).get(pk=category.pk)
+
+    def test_model_and_counter_fields_agree(self):
+        self.assertEqual(Category.COUNTER_FIELDS, COUNTER_FIELDS)
+
+    def test_create_move_retype_and_delete(self):
+        theme = self.add_theme('one', self.blog)
+        self.add_theme('two', self.blog, 'html')
+        self.assertEqual(self.counters(self.blog), (2, 1, 1, 0, 0))
+
+        theme.category = self.shop
+        theme.save()
+        self.assertEqual(self.counters(self.blog), (1, 0, 1, 0, 0))
+        self.assertEqual(self.counters(self.shop), (1, 1, 0, 0, 0))
+
+        theme.theme_type = 'plugin'
+        theme.save()
+        self.assertEqual(self.counters(self.shop), (1, 0, 0, 0, 1))
+
+        theme.delete()
+        self.assertEqual(self.counters(self.shop), (0, 0, 0, 0, 0))
+        self.assertEqual(recount_categories(Category, Theme), [])
+
+    def test_move_theme_buckets(self):
+        move_theme(Category, None, (self.blog.pk, 'ui'))
+        move_theme(Category, (self.blog.pk, 'ui'), (self.shop.pk, 'ui'))
+        move_theme(Category, (self.shop.pk, 'ui'), (self.shop.pk, 'html'))
+        self.assertEqual(self.counters(self.blog), (0, 0, 0, 0, 0))
+        self.assertEqual(self.counters(self.shop), (1, 0, 1, 0, 0))
+        move_theme(Category, (self.shop.pk, 'html'), None)
+        # Never below zero, even when a bucket was already empty
+        move_theme(Category, (self.shop.pk, 'html'), None)
+        self.assertEqual(self.counters(self.shop), (0, 0, 0, 0, 0))
+
+    def test_saving_a_stale_category_keeps_its_counters(self):
+        stale = Category.objects.get(pk=self.blog.pk)
+        for number in range(3):
+            self.add_theme(f'theme-{number}', self.blog)
+        stale.name = 'Blogging'
+        stale.save()
+        self.assertEqual(self.counters(self.blog), (3, 3, 0, 0, 0))
+        self.assertEqual(Category.objects.get(pk=self.blog.pk).name, 'Blogging')
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Blog', slug='blog')
+        Theme.objects.bulk_create([
+            Theme(title=f'Theme {number}', slug=f'theme-{number}', description='', category=category, price=1)
+            for number in range(8)
+        ])
+        # Three created_at values shared by several rows, so pages split inside ties
+        stamps = [timezone.now() - timedelta(days=day) for day in (0, 0, 0, 1, 1, 1, 1, 2)]
+        for theme, stamp in zip(Theme.objects.order_by('pk'), stamps):
+            Theme.objects.filter(pk=theme.pk).update(created_at=stamp)
+        cls.expected = list(Theme.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+
+    def paginator(self):
+        return KeysetPaginator(Theme.objects.all(), 3)
+
+    def test_forward_and_back_across_ties(self):
+        pages = [self.paginator().page()]
+        while pages[-1].has_next:
+            pages.append(self.paginator().page(pages[-1].next_cursor))
+        self.assertEqual([[theme.pk for theme in page] for page in pages], [
+            self.expected[0:3], self.expected[3:6], self.expected[6:8],
+        ])
+        self.assertFalse(pages[0].has_previous)
+
+        back = self.paginator().page(pages[2].previous_cursor)
+        self.assertEqual([theme.pk for theme in back], self.expected[3:6])
+        first = self.paginator().page(back.previous_cursor)
+        self.assertEqual([theme.pk for theme in first], self.expected[0:3])
+        self.assertFalse(first.has_previous)
+
+    def test_tampered_cursors_fall_back_to_the_first_page(self):
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+        cursors = [
+            'not base64!', encode('nope'), encode(['x', '2024-01-01T00:00:00+00:00', '1']),
+            encode(['n', '2024-01-01T00:00:00+00:00']), encode(['n', 'notadate', 'x']),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    self.paginator().decode_cursor(cursor)
+                self.assertEqual([theme.pk for theme in self.paginator().page(cursor)], self.expected[0:3])
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def test_view_ignores_a_cursor_with_bad_values(self):
+        cursor = base64.urlsafe_b64encode(b'["n","notadate","x"]').decode()
+        self.assertEqual(self.client.get(reverse('themes'), {'cursor': cursor}).status_code, 200)
+
+
+class PrecompressedStaticAppTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.filename = os.path.join(root, 'app.css')
+        for suffix in ('', '.gz', '.br'):
+            Path(self.filename + suffix).write_text('body {}')
+        self.app = PrecompressedStaticApp(None, root=root, prefix='/static/')
+
+    def negotiate(self, header):
+        return self.app.negotiate({'HTTP_ACCEPT_ENCODING': header}, self.filename)[0]
+
+    def test_q_values_and_wildcard(self):
+        cases = {
+            '': None,
+            'gzip, deflate, br': 'br',
+            'gzip;q=1.0, br; q=0.5': 'gzip',
+            'gzip, br; q=0': 'gzip',
+            'gzip, br;q=0.0': 'gzip',
+            'br, gzip;q=0.000': 'br',
+            'gzip; q=0, br; Q=0': None,
+            '*': 'br',
+            '*;q=0.5, br;q=0': 'gzip',
+            'identity, *;q=0': None,
+            'br;q=bogus, gzip': 'gzip',
+        }
+        for header, encoding in cases.items():
+            self.assertEqual(self.negotiate(header), encoding, header)
+
+
+class SeedTests(TestCase):
+    def test_seed_is_idempotent(self):
+        entries = load_dataset('site')
+        first = seed(entries)
+        self.assertTrue(all(plan.create for plan in first))
+        with CaptureQueriesContext(connection) as queries:
+            second = seed(load_dataset('site'))
+        self.assertFalse(any(plan.create or plan.update for plan in second))
+        # One SELECT per model, no writes
+        self.assertLessEqual(len(queries), len(entries) + 2)
+
+    def test_existing_rows_are_only_reset_with_update(self):
+        seed(load_dataset('site'))
+        NavigationMenu.objects.filter(title='Home').update(url='/edited/')
+        seed(load_dataset('site'))
+        self.assertEqual(NavigationMenu.objects.get(title='Home').url, '/edited/')
+        seed(load_dataset('site'), update=True)
+        self.assertEqual(NavigationMenu.objects.get(title='Home').url, '/')
+
+
+class ImportThemesTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Blog', slug='blog')
+        Theme.objects.create(
+            title='Existing', slug='existing', description='<p>Kept</p>', category=self.category,
+            price=Decimal('10.00'), downloads=7,
+        )
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, name, text):
+        path = self.directory / name
+        path.write_text(text)
+        return path
+
+    def test_csv_rows_are_upserted_and_bad_rows_reported(self):
+        path = self.write('catalog.csv', (
+            'title,slug,category,price,preview_url,is_featured\n'
+            'Fresh,fresh,blog,0,https://example.com/fresh,yes\n'
+            'Existing renamed,existing,blog,12.50,,no\n'
+            'Too precise,too-precise,blog,1.999,,no\n'
+            'Bad link,bad-link,blog,1,not a url,no\n'
+            'Lost,lost,missing,1,,no\n'
+            'Twice,fresh,blog,1,,no\n'
+        ))
+        errors = []
+        importer = ThemeImporter(batch_size=2, on_error=errors.append)
+        importer.run(read_rows(path))
+
+        self.assertEqual((importer.created, importer.updated, importer.failed), (1, 1, 4))
+        self.assertEqual([error.line for error in errors], [4, 5, 6, 7])
+        self.assertIn('price: Ensure that there are no more than 2 decimal places.', errors[0].messages)
+        self.assertEqual(errors[1].messages, ['preview_url: Enter a valid URL.'])
+        existing = Theme.objects.get(slug='existing')
+        self.assertEqual((existing.title, existing.price), ('Existing renamed', Decimal('12.50')))
+        # Columns the file does not supply are left alone
+        self.assertEqual((existing.downloads, existing.description), (7, '<p>Kept</p>'))
+        self.assertTrue(Theme.objects.get(slug='fresh').is_featured)
+        self.assertEqual(Category.objects.get(pk=self.category.pk).theme_count, 2)
+
+    def test_jsonl_dry_run_writes_nothing(self):
+        path = self.write('catalog.jsonl', '{"title": "New", "category": "blog", "price": "5"}\n{oops\n')
+        out, err = StringIO(), StringIO()
+        call_command('import_themes', str(path), dry_run=True, stdout=out, stderr=err)
+        self.assertIn('1 valid rows and 1 rejected', out.getvalue())
+        self.assertIn('line 2', err.getvalue())
+        self.assertFalse(Theme.objects.filter(slug='new').exists())
+
+
+@override_settings(ALLOWED_HOSTS=['testserver'])
+class ExportThemesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_catalog()
+        cls.admin = User.objects.create_superuser('export-admin', 'admin@example.com', 'password')
+        cls.discounted = Theme.objects.get(slug='catalog-theme-10')
+        Theme.objects.filter(pk=cls.discounted.pk).update(price=Decimal('30.00'), original_price=Decimal('40.00'))
+        ThemeImage.objects.create(theme=cls.discounted, image='theme_images/second.jpg', order=2)
+        ThemeImage.objects.create(theme=cls.discounted, image='theme_images/first.jpg', order=1)
+
+    def test_rows_carry_category_images_and_discount(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(export_rows(Theme.objects.order_by('pk'), chunk_size=100))
+        self.assertEqual(len(rows), Theme.objects.count())
+        # One query for the themes and one for the images of each chunk
+        self.assertEqual(len(queries), 1 + (len(rows) + 99) // 100)
+        row = next(row for row in rows if row['id'] == self.discounted.pk)
+        self.assertEqual(row['category'], self.discounted.category.name)
+        self.assertEqual(row['discount_percentage'], 25)
+        self.assertEqual(row['images'], ['/media/theme_images/first.jpg', '/media/theme_images/second.jpg'])
+
+    def test_admin_action_streams_the_filtered_changelist(self):
+        self.client.force_login(self.admin)
+        url = reverse(f'{admin_site.name}:thememarket_app_theme_changelist')
+        response = self.client.post(f'{url}?theme_type__exact=html', {
+            'action': 'export_csv', 'select_across': '1', 'index': '0',
+            '_selected_action': [self.discounted.pk],
+        })
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment;', response['Content-Disposition'])
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        self.assertEqual(len(rows), Theme.objects.filter(theme_type='html').count())
+        self.assertEqual({row['theme_type'] for row in rows}, {'html'})
+
+    def test_command_writes_jsonl(self):
+        out = StringIO()
+        call_command('export_themes', '-', format='jsonl', category=[self.discounted.category.slug], stdout=out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(rows), self.discounted.category.themes.count())
+        self.assertIn(self.discounted.slug, {row['slug'] for row in rows})
+
+
+class GenerateCatalogTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+    def test_counters_and_search_cover_the_generated_themes(self):
+        call_command(
+            'generate_catalog', themes=60, categories=4, images_per_theme=1, image_pool=2, seed=21, stdout=StringIO(),
+        )
+        self.assertEqual(Theme.objects.count(), 60)
+        self.assertEqual(ThemeImage.objects.count(), 60)
+        self.assertEqual(sum(Category.objects.values_list('theme_count', flat=True)), 60)
+        self.assertEqual(BackgroundJob.objects.filter(kind='image').count(), 2)
+        title = Theme.objects.order_by('pk').values_list('title', flat=True).first()
+        self.assertIn(title, [theme.title for theme, _ in search_themes(title, limit=60)])
+
+
+class BenchmarkCompareTests(TestCase):
+    def results(self, throughput=100.0, p50=10.0, queries=5, errors=0):
+        route = {'p50': p50, 'queries': queries, 'errors': errors, 'requests': 30}
+        return {'summary': {'throughput': throughput, 'max_rss_mb': 100.0}, 'routes': {'home': route}}
+
+    def test_noise_passes_and_regressions_are_named(self):
+        baseline = self.results()
+        self.assertEqual(compare(self.results(throughput=90.0, p50=14.0), baseline, 20, 100)[1], [])
+        _, regressions = compare(self.results(throughput=70.0, p50=40.0, queries=6, errors=1), baseline, 20, 100)
+        self.assertEqual(regressions, ['throughput', 'home errors', 'home queries', 'home p50'])
@@ -6,6 +6,9 @@ urlpatterns = [
     path('about/', views.about, name='about'),
     path('contact/', views.contact, name='contact'),
     path('themes/', views.themes, name='themes'),
+    path('themes/search/', views.theme_search, name='theme_search'),
+    path('api/suggest/', views.suggest_api, name='suggest'),
+    path('api/fragments/', views.fragments_api, name='fragments'),
     path('template/', views.template_page, name='template'),
     path('login/', views.login_page, name='login'),
     path('cart/', views.cart, name='cart'),
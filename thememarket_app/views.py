@@ -1,47 +1,27 @@
+from urllib.parse import urlencode
+
+from django.http import JsonResponse
 from django.shortcuts import render, get_object_or_404
-from .models import (
-    SiteSettings, NavigationMenu, HeroSection, Category, Theme, 
-    Page, FooterSection, SocialLink, Testimonial, ContactInfo,
-    # Home Page Models
-    HeroBanner, CategorySection, FeaturedSection, PopularSection, NewSection,
-    WhyChooseSection, NewsletterSection, TestimonialsSection,
-    # About Page Models
-    AboutHero, AboutMission, AboutValues, AboutTeam,
-    # Contact Page Models
-    ContactHero, ContactForm, ContactOffice,
-    # Themes Page Models
-    ThemesHero, ThemesFilter, ThemesGrid,
-    # Templates Page Models
-    TemplatesHero, HTMLTemplatesSection, UITemplatesSection,
-    # Other Page Models
-    LoginPageContent, CartPageContent, CheckoutPageContent, PaymentPageContent, PaymentSuccessPageContent
-)
+from django.utils.cache import patch_vary_headers
+from .chrome import get_chrome
+from .facets import FACET_PARAMS, clean_filters, facet_options, filter_themes, get_facets
+from .fragments import FRAGMENTS, render_fragment
+from .models import Category, Theme
+from .pagecache import cache_page
+from .pagination import KeysetPaginator
+from .search import search_themes
+from .suggest import suggest
+from .sections import get_page_sections
 
 def get_common_context():
     """Get common context data for all views"""
-    try:
-        site_settings = SiteSettings.objects.first()
-    except SiteSettings.DoesNotExist:
-        site_settings = None
-    
-    return {
-        'site_settings': site_settings,
-        'navigation_menus': NavigationMenu.objects.filter(is_active=True),
-        'footer_sections': FooterSection.objects.prefetch_related('links'),
-        'social_links': SocialLink.objects.filter(is_active=True),
-    }
+    return dict(get_chrome())
 
+@cache_page('home', Theme, Category)
 def home(request):
     context = get_common_context()
+    context.update(get_page_sections('home'))
     context.update({
-        'hero_banner': HeroBanner.objects.filter(is_active=True).first(),
-        'category_section': CategorySection.objects.filter(is_active=True).first(),
-        'featured_section': FeaturedSection.objects.filter(is_active=True).first(),
-        'popular_section': PopularSection.objects.filter(is_active=True).first(),
-        'new_section': NewSection.objects.filter(is_active=True).first(),
-        'why_choose_section': WhyChooseSection.objects.filter(is_active=True).prefetch_related('features').first(),
-        'newsletter_section': NewsletterSection.objects.filter(is_active=True).first(),
-        'testimonials_section': TestimonialsSection.objects.filter(is_active=True).prefetch_related('testimonials').first(),
         'categories': Category.objects.filter(is_featured=True)[:8],
         'featured_themes': Theme.objects.filter(is_featured=True)[:9],
         'popular_themes': Theme.objects.filter(is_popular=True)[:9],
@@ -49,95 +29,144 @@ def home(request):
     })
     return render(request, 'home.html', context)
 
+@cache_page('about')
 def about(request):
     context = get_common_context()
-    context.update({
-        'about_hero': AboutHero.objects.filter(is_active=True).first(),
-        'about_mission': AboutMission.objects.filter(is_active=True).first(),
-        'about_values': AboutValues.objects.filter(is_active=True).prefetch_related('values').first(),
-        'about_team': AboutTeam.objects.filter(is_active=True).prefetch_related('members').first(),
-    })
+    context.update(get_page_sections('about'))
     return render(request, 'about.html', context)
 
+@cache_page('contact')
 def contact(request):
     context = get_common_context()
-    context.update({
-        'contact_hero': ContactHero.objects.filter(is_active=True).first(),
-        'contact_form': ContactForm.objects.filter(is_active=True).first(),
-        'contact_office': ContactOffice.objects.filter(is_active=True).first(),
-        'contact_info': ContactInfo.objects.first(),
-    })
+    context.update(get_page_sections('contact'))
     return render(request, 'contact.html', context)
 
+def _cursor_url(request, filters, cursor):
+    """Current URL with only the cleaned filters and the new cursor, as the cached page is shared"""
+    if cursor is None:
+        return None
+    return f'{request.path}?{urlencode({**filters, "cursor": cursor})}'
+
+@cache_page('themes', Theme, Category, params=FACET_PARAMS + ('cursor',))
 def themes(request):
     context = get_common_context()
-    category_slug = request.GET.get('category')
-    theme_type = request.GET.get('type')
+    filters = clean_filters(request.GET)
+    themes_queryset = filter_themes(Theme.objects.select_related('category'), filters)
     
-    themes_queryset = Theme.objects.all()
-    
-    if category_slug:
-        themes_queryset = themes_queryset.filter(category__slug=category_slug)
-    
-    if theme_type:
-        themes_queryset = themes_queryset.filter(theme_type=theme_type)
-    
-    themes_grid = ThemesGrid.objects.filter(is_active=True).first()
+    sections = get_page_sections('themes')
+    themes_grid = sections['themes_grid']
     items_per_page = themes_grid.items_per_page if themes_grid else 20
     
+    themes_page = KeysetPaginator(themes_queryset, items_per_page).page(request.GET.get('cursor'))
+    categories = Category.objects.all()
+    facets = get_facets(filters)
+    
+    context.update(sections)
     context.update({
-        'themes_hero': ThemesHero.objects.filter(is_active=True).first(),
-        'themes_filter': ThemesFilter.objects.filter(is_active=True).first(),
-        'themes_grid': themes_grid,
-        'themes': themes_queryset[:items_per_page],
-        'categories': Category.objects.all(),
-        'selected_category': category_slug,
-        'selected_type': theme_type,
+        'themes': themes_page.items,
+        'themes_page': themes_page,
+        'next_page_url': _cursor_url(request, filters, themes_page.next_cursor),
+        'previous_page_url': _cursor_url(request, filters, themes_page.previous_cursor),
+        'categories': categories,
+        'facets': facets,
+        'facet_options': facet_options(facets, categories, filters),
+        'selected_category': filters.get('category'),
+        'selected_type': filters.get('type'),
+        'selected_price': filters.get('price'),
+        'selected_rating': filters.get('rating'),
     })
     return render(request, 'themes.html', context)
 
+def theme_search(request):
+    """Search results as a page for browsers submitting the search box, as JSON for API clients"""
+    query = request.GET.get('q', '').strip()
+    try:
+        limit = min(max(int(request.GET.get('limit', 20)), 1), 50)
+    except ValueError:
+        limit = 20
+    
+    found = search_themes(query, limit)
+    if request.get_preferred_type(['application/json', 'text/html']) == 'text/html':
+        context = get_common_context()
+        context.update({'query': query, 'themes': [theme for theme, _ in found]})
+        response = render(request, 'search.html', context)
+    else:
+        results = [
+            {
+                'title': theme.title,
+                'slug': theme.slug,
+                'category': theme.category.name,
+                'theme_type': theme.theme_type,
+                'price': str(theme.price),
+                'rating': str(theme.rating),
+                'downloads': theme.downloads,
+                'image': theme.image.url if theme.image else None,
+                'preview_url': theme.preview_url,
+                'score': round(score, 4),
+            }
+            for theme, score in found
+        ]
+        response = JsonResponse({'query': query, 'results': results})
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+def suggest_api(request):
+    query = request.GET.get('q', '')
+    try:
+        limit = min(max(int(request.GET.get('limit', 8)), 1), 20)
+    except ValueError:
+        limit = 8
+    
+    suggestions = suggest(query[:100], limit)
+    return JsonResponse({
+        'query': query,
+        'themes': suggestions['theme'],
+        'categories': suggestions['category'],
+    })
+
+def fragments_api(request):
+    """Per-user fragments as JSON, for page shells served from a shared cache in front of Django"""
+    names = [name for name in request.GET.getlist('name') if name in FRAGMENTS] or list(FRAGMENTS)
+    response = JsonResponse({name: render_fragment(name, request) for name in names})
+    response['Cache-Control'] = 'private, no-store'
+    return response
+
+@cache_page('template', Theme, Category)
 def template_page(request):
     context = get_common_context()
+    context.update(get_page_sections('template'))
     context.update({
-        'templates_hero': TemplatesHero.objects.filter(is_active=True).first(),
-        'html_templates_section': HTMLTemplatesSection.objects.filter(is_active=True).first(),
-        'ui_templates_section': UITemplatesSection.objects.filter(is_active=True).first(),
         'html_templates': Theme.objects.filter(theme_type='html')[:12],
         'ui_templates': Theme.objects.filter(theme_type='ui')[:12],
     })
     return render(request, 'template.html', context)
 
+@cache_page('login')
 def login_page(request):
     context = get_common_context()
-    context.update({
-        'login_contents': LoginPageContent.objects.filter(is_active=True).order_by('order'),
-    })
+    context.update(get_page_sections('login'))
     return render(request, 'login.html', context)
 
+@cache_page('cart')
 def cart(request):
     context = get_common_context()
-    context.update({
-        'cart_contents': CartPageContent.objects.filter(is_active=True).order_by('order'),
-    })
+    context.update(get_page_sections('cart'))
     return render(request, 'cart.html', context)
 
+@cache_page('checkout')
 def checkout(request):
     context = get_common_context()
-    context.update({
-        'checkout_contents': CheckoutPageContent.objects.filter(is_active=True).order_by('order'),
-    })
+    context.update(get_page_sections('checkout'))
     return render(request, 'checkout.html', context)
 
+@cache_page('payment')
 def payment(request):
     context = get_common_context()
-    context.update({
-        'payment_contents': PaymentPageContent.objects.filter(is_active=True).order_by('order'),
-    })
+    context.update(get_page_sections('payment'))
     return render(request, 'payment.html', context)
 
+@cache_page('payment_success')
 def payment_success(request):
     context = get_common_context()
-    context.update({
-        'payment_success_contents': PaymentSuccessPageContent.objects.filter(is_active=True).order_by('order'),
-    })
+    context.update(get_page_sections('payment_success'))
     return render(request, 'payment_success.html', context)
\ No newline at end of file
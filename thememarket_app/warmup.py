@@ -0,0 +1,17 @@
+from .chrome import get_chrome
+from .sections import PAGE_SECTIONS, get_page_sections
+from .suggest import get_index
+
+
+def warm_process():
+    """
+    Build this process's in-process layers: the chrome and section memos and the suggestion index.
+
+    They live in each serving worker's memory, so only code running inside
+    that worker can fill them; manage.py warm_caches cannot. Call this from
+    a worker startup hook, such as gunicorn's post_worker_init.
+    """
+    get_chrome()
+    for page in PAGE_SECTIONS:
+        get_page_sections(page)
+    get_index()
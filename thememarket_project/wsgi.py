@@ -1,5 +1,18 @@
 import os
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'thememarket_project.settings')
-application = get_wsgi_application()
\ No newline at end of file
+
+from thememarket_app.precompressed import PrecompressedStaticApp
+
+django_application = get_wsgi_application()
+
+# WSGI servers don't run system checks; refuse to start with a cache the workers can't share
+cache_errors = [error for error in checks.run_checks(tags=[checks.Tags.caches]) if error.is_serious()]
+if cache_errors:
+    raise ImproperlyConfigured(cache_errors[0])
+
+# Serves collected static files (with their .br/.gz siblings) ahead of Django
+application = PrecompressedStaticApp(django_application)
\ No newline at end of file